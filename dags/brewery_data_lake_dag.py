@@ -16,11 +16,11 @@ import documentation
 
 def run_bronze():
     """
-    Executa a camada Bronze: busca dados da API e salva como JSON bruto.
+    Executa a camada Bronze: busca dados da API e salva como JSON bruto,
+    página a página, retomando a partir do último checkpoint se necessário.
     """
     print("Iniciando Camada Bronze (Ingestao)...")
-    data = bronze.fetch_data(bronze.API_URL)
-    bronze.save_raw_data(data)
+    bronze.ingest(bronze.API_URL)
     print("Camada Bronze concluida.")
 
 def run_silver():
@@ -28,9 +28,7 @@ def run_silver():
     Executa a camada Silver: carrega os dados brutos, aplica transformações e salva em Parquet.
     """
     print("\nIniciando Camada Silver (Transformacao)...")
-    raw_df = silver.load_latest_bronze()
-    clean_df = silver.transform(raw_df)
-    silver.save_silver(clean_df)
+    silver.process_silver()
     print("Camada Silver concluida.")
 
 def run_gold():
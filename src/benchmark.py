@@ -0,0 +1,416 @@
+"""
+benchmark.py – Suíte de benchmark de ponta a ponta do pipeline Medalhão.
+
+Mede cada etapa (carga Bronze, transformações Silver, escrita Silver, camada
+Silver completa em cada motor – pandas, Arrow e pandas em lotes –, snapshot
+Arrow IPC da Silver, carga Silver na Gold pelo snapshot e pelos arquivos
+Parquet, cubo base e cada tabela de 'GOLD_TABLE_SPECS' derivada dele, Gold
+completa a partir dos arquivos Silver em cada motor – pandas e DuckDB, se
+instalado –, e escrita Gold) sobre dados sintéticos (ver 'synthetic.py') de
+tamanhos configuráveis. As escritas são medidas só em formato colunar e com
+a cópia CSV, com o espaço ocupado em disco. Para cada etapa registra tempo de
+parede, pico de RSS e registros/s (nas agregações Gold, também o pico de
+memória alocada), grava os resultados em JSON e, opcionalmente, compara com
+um baseline armazenado para detectar regressões.
+
+Uso:
+    python benchmark.py --sizes 10000,100000
+    python benchmark.py --sizes 1000000,5000000       # motores Gold em grandes volumes
+    python benchmark.py --sizes 100000 --save-baseline
+    python benchmark.py --sizes 100000 --baseline ../benchmarks/baseline.json --tolerance 0.2
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import pandas as pd
+
+from config import BENCHMARK_DIR, SILVER_WRITE_WORKERS, GOLD_AGG_WORKERS, GOLD_DUCKDB_THREADS
+import synthetic
+import silver
+import gold
+import snapshot
+import gold_duckdb
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+
+# ---------------------------------------------------------------------------
+# Medição de Memória
+# ---------------------------------------------------------------------------
+
+def current_rss_bytes() -> int:
+    """Retorna o RSS atual do processo, em bytes (0 se não for possível medir)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
+
+
+class RssSampler:
+    """
+    Amostra o RSS do processo em segundo plano durante um bloco 'with' e
+    registra o pico observado.
+
+    Args:
+        interval (float): Intervalo entre amostras, em segundos.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, current_rss_bytes())
+
+    def __enter__(self):
+        self.start_rss = self.peak_rss = current_rss_bytes()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, current_rss_bytes())
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Execução das Etapas
+# ---------------------------------------------------------------------------
+
+def peak_alloc_bytes(func, *args, **kwargs) -> int:
+    """
+    Pico de memória alocada (pelo Python e pelo NumPy / pandas) durante uma
+    chamada de 'func', acima do que já estava alocado antes dela. Mais preciso
+    que o RSS para etapas curtas, mas não enxerga alocações do Arrow.
+    """
+    tracemalloc.start()
+    try:
+        with redirect_stdout(io.StringIO()):
+            func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(stage: str, rows: int, func, *args, repeat: int = 1, trace_alloc: bool = False, **kwargs) -> dict:
+    """
+    Executa 'func' 'repeat' vezes e retorna a melhor medição.
+
+    Saídas em stdout da função medida são suprimidas. Com 'trace_alloc', uma
+    execução extra (fora da medição de tempo) registra o pico de memória
+    alocada ('peak_alloc_mb'; ver 'peak_alloc_bytes').
+
+    Returns:
+        dict: Etapa, linhas, segundos, registros/s e memória (MB).
+    """
+    best = None
+    for _ in range(repeat):
+        with RssSampler() as sampler, redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+        run = {
+            "stage": stage,
+            "rows": rows,
+            "seconds": round(elapsed, 6),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed > 0 else None,
+            "peak_rss_mb": round(sampler.peak_rss / 2 ** 20, 1),
+            "rss_delta_mb": round((sampler.peak_rss - sampler.start_rss) / 2 ** 20, 1),
+        }
+        if best is None or run["seconds"] < best["seconds"]:
+            best = run
+    if trace_alloc:
+        best["peak_alloc_mb"] = round(peak_alloc_bytes(func, *args, **kwargs) / 2 ** 20, 1)
+    return best
+
+
+# Transformações Silver medidas individualmente, na ordem de 'silver.transform'
+SILVER_STEPS = [
+    "deduplicate", "clean_strings", "normalize_phone", "normalize_postal_code",
+    "validate_coordinates", "standardize_brewery_type", "drop_redundant_columns", "categorize", "add_metadata",
+]
+
+
+def run_size(rows: int, repeat: int = 1, profile: dict = None, work_dir: str = None) -> list:
+    """
+    Mede todas as etapas do pipeline para uma entrada sintética de 'rows' registros.
+
+    Args:
+        rows (int): Tamanho da entrada sintética.
+        repeat (int): Repetições por etapa (vale a melhor).
+        profile (dict, opcional): Perfil de distribuições do gerador sintético.
+        work_dir (str, opcional): Diretório temporário para Bronze/Silver.
+
+    Returns:
+        list: Uma medição por etapa.
+    """
+    work_dir = work_dir or tempfile.mkdtemp(prefix="brewery_bench_")
+    bronze_dir = os.path.join(work_dir, "bronze")
+    silver_dir = os.path.join(work_dir, "silver")
+    gold_dir = os.path.join(work_dir, "gold")
+    results = []
+
+    try:
+        synthetic.generate_bronze(rows, bronze_dir=bronze_dir, compression=None, profile_source=None)
+        raw_df = pd.concat(synthetic.iter_blocks(rows, profile=profile), ignore_index=True)
+
+        # Bronze -> DataFrame
+        results.append(measure("silver.load_latest_bronze", rows, silver.load_latest_bronze,
+                               bronze_dir, allow_synthetic=True, repeat=repeat))
+
+        # Transformações Silver (cada uma sobre uma cópia da entrada bruta)
+        for step in SILVER_STEPS:
+            func = getattr(silver, step)
+            results.append(_measure_on_copy(f"silver.{step}", rows, func, raw_df, repeat))
+        results.append(_measure_on_copy("silver.transform", rows, silver.transform, raw_df, repeat))
+
+        # Escrita Silver: apenas Parquet (padrão) e com cópia CSV, com o espaço ocupado em disco,
+        # e sem paralelismo entre partições (referência para 'SILVER_WRITE_WORKERS')
+        clean_df = silver.transform(raw_df.copy())
+        for stage, write_csv, workers in (
+            ("silver.save_silver", False, SILVER_WRITE_WORKERS),
+            ("silver.save_silver[+csv]", True, SILVER_WRITE_WORKERS),
+            ("silver.save_silver[1 worker]", False, 1),
+        ):
+            run = measure(stage, rows, _save_silver_fresh, clean_df, silver_dir, write_csv, workers, repeat=repeat)
+            results.append(dict(run, disk_mb=_disk_mb(silver_dir)))
+
+        # Camada Silver completa (carga + transformação + escrita) em cada motor
+        for engine in silver.SILVER_ENGINES:
+            results.append(measure(f"silver.process_silver[{engine}]", rows, _process_silver_fresh,
+                                   bronze_dir, silver_dir, engine, repeat=repeat))
+        results.append(measure("silver.process_silver[streaming]", rows, _process_silver_fresh,
+                               bronze_dir, silver_dir, "pandas", streaming=True, repeat=repeat))
+
+        # Snapshot Arrow IPC da Silver (já gerado pela última execução acima) e carga
+        # Silver na Gold: todas as colunas e apenas as usadas pelas agregações, pelo
+        # snapshot (memory map) e pelos arquivos Parquet
+        run = measure("snapshot.build_silver_snapshot", rows, snapshot.build_silver_snapshot, silver_dir,
+                      repeat=repeat)
+        results.append(dict(run, disk_mb=_disk_mb(os.path.join(silver_dir, "_snapshot"))))
+        results.append(measure("gold.load_silver", rows, gold.load_silver, silver_dir, repeat=repeat))
+        results.append(measure("gold.load_silver[GOLD_COLUMNS]", rows, gold.load_silver, silver_dir,
+                               gold.GOLD_COLUMNS, repeat=repeat))
+        results.append(measure("gold.load_silver[GOLD_COLUMNS, parquet]", rows, gold.load_silver, silver_dir,
+                               gold.GOLD_COLUMNS, use_snapshot=False, repeat=repeat))
+
+        # Agregações Gold: cubo base (única passada sobre a Silver), cada tabela
+        # derivada do cubo e o conjunto completo, simultâneo e sequencial, com o
+        # pico de memória alocada além da Silver já carregada
+        silver_df = gold.load_silver(silver_dir, columns=gold.GOLD_COLUMNS)
+        results.append(measure("gold.build_base_cube", rows, gold.build_base_cube, silver_df,
+                               repeat=repeat, trace_alloc=True))
+        cube = gold.build_base_cube(silver_df)
+        for name, spec in gold.GOLD_TABLE_SPECS.items():
+            results.append(measure(f"gold.table[{name}]", rows, gold.aggregate_cube, cube, 1, {name: spec},
+                                   repeat=repeat))
+        for stage, workers in (("gold.run_aggregations", GOLD_AGG_WORKERS),
+                               ("gold.run_aggregations[1 worker]", 1)):
+            results.append(measure(stage, rows, gold.run_aggregations, silver_df, workers,
+                                   repeat=repeat, trace_alloc=True))
+
+        # Gold completa a partir dos arquivos Parquet da Silver (carga + agregações)
+        # em cada motor: pandas e, se instalado, DuckDB com todas as threads e com uma
+        results.append(measure("gold.run_aggregations[pandas, parquet]", rows, _gold_from_parquet,
+                               silver_dir, repeat=repeat, trace_alloc=True))
+        if gold_duckdb.duckdb is not None:
+            for stage, threads in (("gold_duckdb.run_aggregations", GOLD_DUCKDB_THREADS),
+                                   ("gold_duckdb.run_aggregations[1 thread]", 1)):
+                results.append(measure(stage, rows, gold_duckdb.run_aggregations, silver_dir,
+                                       threads=threads, repeat=repeat))
+
+        # Escrita Gold: apenas Parquet (padrão) e com cópia CSV
+        aggregations = gold.run_aggregations(silver_df)
+        for stage, write_csv in (("gold.publish_gold", False), ("gold.publish_gold[+csv]", True)):
+            run = measure(stage, rows, _save_gold_fresh, aggregations, gold_dir, write_csv, repeat=repeat)
+            results.append(dict(run, disk_mb=_disk_mb(gold_dir)))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def _measure_on_copy(stage, rows, func, df, repeat):
+    """Mede 'func' sobre uma cópia nova de 'df' a cada repetição (a cópia não é medida)."""
+    best = None
+    for _ in range(repeat):
+        run = measure(stage, rows, func, df.copy())
+        if best is None or run["seconds"] < best["seconds"]:
+            best = run
+    return best
+
+
+def _save_silver_fresh(df, silver_dir, write_csv=False, max_workers=SILVER_WRITE_WORKERS):
+    """Grava a Silver em um diretório limpo, para que execuções repetidas sejam comparáveis."""
+    shutil.rmtree(silver_dir, ignore_errors=True)
+    silver.save_silver(df, silver_dir, write_csv=write_csv, max_workers=max_workers)
+
+
+def _gold_from_parquet(silver_dir):
+    """Gold completa no motor pandas, lendo a Silver dos arquivos Parquet (sem snapshot)."""
+    return gold.run_aggregations(gold.load_silver(silver_dir, gold.GOLD_COLUMNS, use_snapshot=False))
+
+
+def _save_gold_fresh(aggregations, gold_dir, write_csv=False):
+    """Grava e publica todas as tabelas Gold em um diretório limpo."""
+    shutil.rmtree(gold_dir, ignore_errors=True)
+    gold.publish_gold(aggregations, gold_dir, write_csv=write_csv)
+
+
+def _disk_mb(path):
+    """Espaço ocupado pelos arquivos de um diretório, em MB."""
+    total = sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path) for name in names
+    )
+    return round(total / 2 ** 20, 2)
+
+
+def _process_silver_fresh(bronze_dir, silver_dir, engine, streaming=False):
+    """Executa a camada Silver completa com o motor 'engine' em um diretório limpo."""
+    shutil.rmtree(silver_dir, ignore_errors=True)
+    silver.process_silver(bronze_dir, silver_dir, engine=engine, streaming=streaming, allow_synthetic=True)
+
+
+# ---------------------------------------------------------------------------
+# Resultados e Baseline
+# ---------------------------------------------------------------------------
+
+def environment_info() -> dict:
+    """Descreve o ambiente da execução para tornar os resultados comparáveis."""
+    import pyarrow
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "pyarrow": pyarrow.__version__,
+        "duckdb": gold_duckdb.duckdb.__version__ if gold_duckdb.duckdb is not None else None,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare_with_baseline(results: list, baseline: dict, tolerance: float = 0.2) -> list:
+    """
+    Compara o tempo de cada etapa com o baseline.
+
+    Args:
+        results (list): Medições da execução atual.
+        baseline (dict): Conteúdo de um arquivo de resultados anterior.
+        tolerance (float): Aumento relativo de tempo tolerado (0.2 = 20%).
+
+    Returns:
+        list: Comparações por etapa, com 'ratio' (atual / baseline) e 'regression'.
+    """
+    reference = {(r["stage"], r["rows"]): r for r in baseline.get("results", [])}
+    comparisons = []
+    for r in results:
+        base = reference.get((r["stage"], r["rows"]))
+        if base is None or not base["seconds"]:
+            continue
+        ratio = r["seconds"] / base["seconds"]
+        comparisons.append({
+            "stage": r["stage"],
+            "rows": r["rows"],
+            "baseline_seconds": base["seconds"],
+            "seconds": r["seconds"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        })
+    return comparisons
+
+
+def print_report(results: list, comparisons: list = None) -> None:
+    """Imprime um resumo tabular das medições (e da comparação com o baseline)."""
+    by_key = {(c["stage"], c["rows"]): c for c in comparisons or []}
+    print("\nRelatorio de Benchmark")
+    print("=" * 112)
+    print(
+        f"  {'etapa':<42}{'linhas':>10}{'segundos':>11}{'linhas/s':>13}"
+        f"{'pico RSS MB':>13}{'disco MB':>12}{'vs base':>10}"
+    )
+    for r in results:
+        comp = by_key.get((r["stage"], r["rows"]))
+        vs = f"{comp['ratio']:.2f}x" + ("!" if comp["regression"] else "") if comp else "-"
+        disk = f"{r['disk_mb']:.2f}" if "disk_mb" in r else "-"
+        print(
+            f"  {r['stage']:<42}{r['rows']:>10}{r['seconds']:>11.4f}"
+            f"{(r['rows_per_second'] or 0):>13.0f}{r['peak_rss_mb']:>13.1f}{disk:>12}{vs:>10}"
+        )
+    print("=" * 112)
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de ponta a ponta do pipeline Medalhão.")
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="Tamanhos de entrada separados por vírgula (ex.: 100000,1000000).")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetições por etapa (vale a melhor).")
+    parser.add_argument("--output", help="Arquivo JSON de saída. Padrão: benchmarks/benchmark_<timestamp>.json")
+    parser.add_argument("--baseline", help="Arquivo de resultados usado como baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Aumento relativo de tempo tolerado antes de acusar regressão.")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Grava os resultados também como baseline ({BASELINE_FILE}).")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    profile = synthetic.build_profile()
+
+    results = []
+    for rows in sizes:
+        print(f"Medindo o pipeline com {rows} registros sintéticos...")
+        results.extend(run_size(rows, repeat=args.repeat, profile=profile))
+
+    report = {"environment": environment_info(), "sizes": sizes, "results": results}
+
+    comparisons = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            comparisons = compare_with_baseline(results, json.load(f), args.tolerance)
+        report["baseline"] = {"file": args.baseline, "tolerance": args.tolerance, "comparisons": comparisons}
+
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    output = args.output or os.path.join(
+        BENCHMARK_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    print_report(results, comparisons)
+    print(f"Resultados gravados em: {output}")
+
+    if comparisons and any(c["regression"] for c in comparisons):
+        regressions = [c["stage"] for c in comparisons if c["regression"]]
+        print(f"Regressão detectada em: {regressions}")
+        sys.exit(1)
@@ -1,10 +1,33 @@
 import requests
-import json
 import os
+import glob
+import gzip
+import json
+import hashlib
 import time
+import itertools
+import random
+import asyncio
 import logging
-from datetime import datetime
-from config import BRONZE_DIR, API_URL, LOGS_DIR
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from storage import (
+    atomic_path, atomic_write_json, read_json, append_ndjson, ndjson_file_name, iter_ndjson,
+    write_records_csv,
+)
+from config import (
+    BRONZE_DIR, API_URL, LOGS_DIR, BRONZE_CHECKPOINT_FILE, BRONZE_COMPRESSION, WRITE_CSV_COPIES,
+    BRONZE_DELTA_MANIFEST, BRONZE_HASH_STATE_FILE,
+    API_PER_PAGE, API_MAX_WORKERS, API_RATE_LIMIT, API_TIMEOUT,
+    API_MAX_RETRIES, API_BACKOFF_BASE, API_BACKOFF_MAX,
+)
+
+try:
+    import aiohttp
+except ImportError:  # Dependência opcional, necessária apenas para fetch_data_async
+    aiohttp = None
 
 def setup_logger():
     """
@@ -24,12 +47,265 @@ def setup_logger():
     return logging.getLogger("bronze")
 
 
-def fetch_data(url):
+# ---------------------------------------------------------------------------
+# Controle de Taxa
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """
+    Limitador de taxa do tipo token bucket, seguro para uso entre threads.
+
+    Substitui a pausa fixa entre páginas: permite rajadas de até 'capacity'
+    requisições e, em regime, no máximo 'rate' requisições por segundo.
+
+    Args:
+        rate (float): Tokens repostos por segundo.
+        capacity (float, opcional): Tamanho máximo da rajada. Padrão: max(1, rate).
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos aguardar antes de usá-lo."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Bloqueia a thread atual até que um token esteja disponível."""
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    async def acquire_async(self) -> None:
+        """Aguarda (sem bloquear o event loop) até que um token esteja disponível."""
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+
+# ---------------------------------------------------------------------------
+# Novas Tentativas (Retry)
+# ---------------------------------------------------------------------------
+
+# Status HTTP considerados transitórios: a página é buscada novamente
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _parse_retry_after(value):
+    """
+    Converte o cabeçalho 'Retry-After' (segundos ou data HTTP) em segundos.
+    Retorna None se o valor estiver ausente ou for inválido.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt, retry_after=None):
+    """
+    Calcula a espera antes da próxima tentativa: backoff exponencial com jitter
+    completo, limitado a API_BACKOFF_MAX. Se o servidor enviou 'Retry-After',
+    ele é respeitado como espera mínima.
+    """
+    delay = random.uniform(0, min(API_BACKOFF_MAX, API_BACKOFF_BASE * 2 ** attempt))
+    server_delay = _parse_retry_after(retry_after)
+    if server_delay is not None:
+        delay = max(delay, server_delay)
+    return delay
+
+
+# ---------------------------------------------------------------------------
+# Busca Paginada
+# ---------------------------------------------------------------------------
+
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Retorna a sessão HTTP (keep-alive) da thread atual, criando-a se necessário."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+def fetch_page(url, page, per_page=API_PER_PAGE, bucket=None, timeout=API_TIMEOUT,
+               max_retries=API_MAX_RETRIES):
+    """
+    Busca uma única página da API.
+
+    Respostas transitórias (429/5xx) e falhas de rede são repetidas até
+    'max_retries' vezes, com backoff exponencial com jitter que respeita o
+    cabeçalho 'Retry-After'. Assim, uma página instável custa uma nova
+    tentativa, e não o reinício de toda a ingestão.
+
+    Args:
+        url (str): URL base da API.
+        page (int): Número da página (começando em 1).
+        per_page (int): Quantidade de registros por página.
+        bucket (TokenBucket, opcional): Limitador de taxa compartilhado.
+        timeout (float): Timeout da requisição, em segundos.
+        max_retries (int): Máximo de novas tentativas para erros transitórios.
+
+    Returns:
+        list: Registros da página (lista vazia indica o fim da paginação).
+
+    Raises:
+        Exception: Caso a API responda com erro não transitório ou as tentativas se esgotem.
+    """
+    logger = logging.getLogger("bronze")
+    params = {'page': page, 'per_page': per_page}
+
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+
+        try:
+            response = _get_session().get(url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            status, detail, retry_after = None, str(e), None
+        else:
+            if response.status_code == 200:
+                return response.json()
+            status, detail = response.status_code, response.text
+            retry_after = response.headers.get("Retry-After")
+
+        retryable = status is None or status in RETRYABLE_STATUS
+        if not retryable or attempt == max_retries:
+            logger.error(f"Falha ao buscar página {page}. Status: {status}")
+            raise Exception(f"Requisição falhou: {status} - {detail}")
+
+        delay = _retry_delay(attempt, retry_after)
+        logger.warning(
+            f"Página {page}: falha transitória ({status}). "
+            f"Nova tentativa {attempt + 1}/{max_retries} em {delay:.2f}s."
+        )
+        time.sleep(delay)
+
+
+def _failure_to_raise(failure, end_page, pending_pages) -> bool:
+    """
+    Indica se a falha de uma página deve ser propagada agora: ela está antes
+    do fim da paginação e nenhuma página anterior ainda está em andamento
+    (as contíguas já buscadas foram entregues).
+    """
+    if failure is None or (end_page is not None and failure[0] > end_page):
+        return False
+    return not any(page < failure[0] for page in pending_pages)
+
+
+def iter_pages(url, per_page=API_PER_PAGE, max_workers=API_MAX_WORKERS,
+               rate_limit=API_RATE_LIMIT, start_page=1):
+    """
+    Busca as páginas da API de forma concorrente e as entrega em ordem.
+
+    Mantém no máximo 'max_workers' requisições em andamento e, no máximo,
+    '2 * max_workers' páginas buscadas aguardando a entrega, de modo que a
+    memória fica limitada mesmo quando uma página atrasa. A paginação termina
+    na primeira página vazia; páginas posteriores já solicitadas são descartadas.
+
+    Se uma página falhar, nenhuma página nova é solicitada; as anteriores a ela
+    ainda em andamento são aguardadas e todas as páginas contíguas já buscadas
+    são entregues antes de o erro ser propagado, para que quem consome (ex.:
+    'ingest') confirme tudo o que foi baixado e retome da página que falhou.
+
+    Args:
+        url (str): URL base da API.
+        per_page (int): Quantidade de registros por página.
+        max_workers (int): Máximo de requisições simultâneas (1 = sequencial).
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
+        start_page (int): Primeira página a ser buscada.
+
+    Yields:
+        tuple: (número da página, lista de registros), em ordem crescente de página.
+
+    Raises:
+        Exception: Caso ocorra erro na requisição de alguma página.
+    """
+    max_workers = max(1, int(max_workers))
+    window = 2 * max_workers
+    bucket = TokenBucket(rate_limit, capacity=max_workers) if rate_limit else None
+
+    fetched = {}          # página -> registros aguardando as páginas anteriores
+    in_flight = {}        # future -> página
+    next_to_submit = start_page
+    next_to_yield = start_page
+    end_page = None       # primeira página vazia encontrada
+    failure = None        # (página, exceção) da menor página que falhou
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bronze") as executor:
+        try:
+            while True:
+                while (
+                    end_page is None
+                    and failure is None
+                    and len(in_flight) < max_workers
+                    and next_to_submit < next_to_yield + window
+                ):
+                    future = executor.submit(fetch_page, url, next_to_submit, per_page, bucket)
+                    in_flight[future] = next_to_submit
+                    next_to_submit += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = in_flight.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        if failure is None or page < failure[0]:
+                            failure = (page, e)
+                        continue
+                    if data:
+                        fetched[page] = data
+                    elif end_page is None or page < end_page:
+                        end_page = page
+
+                while next_to_yield in fetched and (end_page is None or next_to_yield < end_page):
+                    yield next_to_yield, fetched.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if _failure_to_raise(failure, end_page, in_flight.values()):
+                    raise failure[1]
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def fetch_data(url, per_page=API_PER_PAGE, max_workers=API_MAX_WORKERS, rate_limit=API_RATE_LIMIT):
     """
     Busca dados da API tratando a paginação.
+
+    As páginas são buscadas de forma concorrente (ver 'iter_pages'), mas os
+    registros são retornados na mesma ordem da paginação sequencial.
     
     Args:
         url (str): URL base da API para busca dos dados.
+        per_page (int): Quantidade de registros por página.
+        max_workers (int): Máximo de requisições simultâneas (1 = sequencial).
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
         
     Returns:
         list: Lista contendo todos os registros coletados da API.
@@ -38,45 +314,211 @@ def fetch_data(url):
         Exception: Caso ocorra erro na requisição à API.
     """
     all_breweries = []
-    page = 1
-    per_page = 200 # Limite máximo permitido pela API
     
     logger = setup_logger()
-    logger.info(f"Iniciando a ingestão de dados de {url}")
+    logger.info(
+        f"Iniciando a ingestão de dados de {url} "
+        f"(requisições simultâneas: {max_workers}, limite: {rate_limit} req/s)"
+    )
     
-    while True:
+    try:
+        for page, data in iter_pages(url, per_page, max_workers, rate_limit):
+            all_breweries.extend(data)
+            logger.info(f"Página {page} coletada com {len(data)} registros. Total: {len(all_breweries)}")
+    except Exception as e:
+        logger.error(f"Erro ocorrido: {str(e)}")
+        raise e
+
+    logger.info("Nenhum dado adicional encontrado. Paginação concluída.")
+    return all_breweries
+
+async def _fetch_page_async(session, url, page, per_page, bucket, max_retries):
+    """
+    Versão assíncrona de 'fetch_page', usando a sessão aiohttp compartilhada.
+    Aplica a mesma política de novas tentativas para 429/5xx e falhas de rede.
+    """
+    logger = logging.getLogger("bronze")
+    params = {'page': page, 'per_page': per_page}
+
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            await bucket.acquire_async()
+
         try:
-            params = {'page': page, 'per_page': per_page}
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"Falha ao buscar página {page}. Status: {response.status_code}")
-                raise Exception(f"Requisição falhou: {response.status_code} - {response.text}")
-            
-            data = response.json()
-            
-            if not data:
-                logger.info("Nenhum dado adicional encontrado. Paginação concluída.")
-                break
-                
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+                status, detail = response.status, await response.text()
+                retry_after = response.headers.get("Retry-After")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status, detail, retry_after = None, str(e) or type(e).__name__, None
+
+        retryable = status is None or status in RETRYABLE_STATUS
+        if not retryable or attempt == max_retries:
+            logger.error(f"Falha ao buscar página {page}. Status: {status}")
+            raise Exception(f"Requisição falhou: {status} - {detail}")
+
+        delay = _retry_delay(attempt, retry_after)
+        logger.warning(
+            f"Página {page}: falha transitória ({status}). "
+            f"Nova tentativa {attempt + 1}/{max_retries} em {delay:.2f}s."
+        )
+        await asyncio.sleep(delay)
+
+
+async def iter_pages_async(url, per_page=API_PER_PAGE, max_concurrency=API_MAX_WORKERS,
+                           rate_limit=API_RATE_LIMIT, max_retries=API_MAX_RETRIES,
+                           timeout=API_TIMEOUT, start_page=1):
+    """
+    Equivalente assíncrono de 'iter_pages': busca páginas de forma concorrente
+    sobre uma única sessão aiohttp com conexões keep-alive reaproveitadas e as
+    entrega em ordem crescente, parando na primeira página vazia. Como em
+    'iter_pages', as páginas contíguas anteriores a uma falha são entregues
+    antes de o erro ser propagado.
+
+    Args:
+        url (str): URL base da API.
+        per_page (int): Quantidade de registros por página.
+        max_concurrency (int): Máximo de requisições simultâneas (e de conexões no pool).
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
+        max_retries (int): Máximo de novas tentativas por página.
+        timeout (float): Timeout total de cada requisição, em segundos.
+        start_page (int): Primeira página a ser buscada.
+
+    Yields:
+        tuple: (número da página, lista de registros).
+
+    Raises:
+        ImportError: Se o pacote 'aiohttp' não estiver instalado.
+        Exception: Caso alguma página falhe após esgotar as novas tentativas.
+    """
+    if aiohttp is None:
+        raise ImportError("A ingestão assíncrona requer o pacote 'aiohttp' (pip install aiohttp).")
+
+    max_concurrency = max(1, int(max_concurrency))
+    window = 2 * max_concurrency
+    bucket = TokenBucket(rate_limit, capacity=max_concurrency) if rate_limit else None
+
+    fetched = {}
+    in_flight = {}
+    next_to_submit = start_page
+    next_to_yield = start_page
+    end_page = None
+    failure = None
+
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        try:
+            while True:
+                while (
+                    end_page is None
+                    and failure is None
+                    and len(in_flight) < max_concurrency
+                    and next_to_submit < next_to_yield + window
+                ):
+                    task = asyncio.ensure_future(_fetch_page_async(
+                        session, url, next_to_submit, per_page, bucket, max_retries
+                    ))
+                    in_flight[task] = next_to_submit
+                    next_to_submit += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = in_flight.pop(task)
+                    try:
+                        data = task.result()
+                    except Exception as e:
+                        if failure is None or page < failure[0]:
+                            failure = (page, e)
+                        continue
+                    if data:
+                        fetched[page] = data
+                    elif end_page is None or page < end_page:
+                        end_page = page
+
+                while next_to_yield in fetched and (end_page is None or next_to_yield < end_page):
+                    yield next_to_yield, fetched.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if _failure_to_raise(failure, end_page, in_flight.values()):
+                    raise failure[1]
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def fetch_data_async(url, per_page=API_PER_PAGE, max_concurrency=API_MAX_WORKERS,
+                           rate_limit=API_RATE_LIMIT, max_retries=API_MAX_RETRIES,
+                           timeout=API_TIMEOUT):
+    """
+    Busca dados da API de forma assíncrona, tratando a paginação.
+
+    Usa uma única sessão com pool de conexões keep-alive, limita a concorrência
+    e repete respostas transitórias (429/5xx) com backoff com jitter que respeita
+    'Retry-After'. Os registros são retornados na ordem da paginação.
+
+    Exemplo:
+        data = asyncio.run(fetch_data_async(API_URL))
+
+    Args:
+        url (str): URL base da API para busca dos dados.
+        per_page (int): Quantidade de registros por página.
+        max_concurrency (int): Máximo de requisições simultâneas.
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
+        max_retries (int): Máximo de novas tentativas por página.
+        timeout (float): Timeout total de cada requisição, em segundos.
+
+    Returns:
+        list: Lista contendo todos os registros coletados da API.
+
+    Raises:
+        ImportError: Se o pacote 'aiohttp' não estiver instalado.
+        Exception: Caso alguma página falhe após esgotar as novas tentativas.
+    """
+    all_breweries = []
+
+    logger = setup_logger()
+    logger.info(
+        f"Iniciando a ingestão assíncrona de dados de {url} "
+        f"(requisições simultâneas: {max_concurrency}, limite: {rate_limit} req/s)"
+    )
+
+    try:
+        async for page, data in iter_pages_async(
+            url, per_page, max_concurrency, rate_limit, max_retries, timeout
+        ):
             all_breweries.extend(data)
             logger.info(f"Página {page} coletada com {len(data)} registros. Total: {len(all_breweries)}")
-            
-            page += 1
-            time.sleep(0.5) # Pausa para respeitar os limites da API
-            
-        except Exception as e:
-            logger.error(f"Erro ocorrido: {str(e)}")
-            raise e
-            
+    except Exception as e:
+        logger.error(f"Erro ocorrido: {str(e)}")
+        raise e
+
+    logger.info("Nenhum dado adicional encontrado. Paginação concluída.")
     return all_breweries
 
-def save_raw_data(data):
+def save_raw_data(data, compression=BRONZE_COMPRESSION, write_csv=WRITE_CSV_COPIES):
     """
     Salva os dados brutos na camada Bronze com particionamento por data de ingestão.
+
+    Os registros são gravados em NDJSON (um registro por linha, opcionalmente
+    comprimido), em blocos do tamanho de uma página, sem montar o arquivo
+    inteiro em memória. A cópia CSV opcional (para visualização rápida) é
+    gerada em fluxo a partir do NDJSON gravado (ver 'storage.write_records_csv'),
+    sem construir um DataFrame; sob demanda, use 'export.py'.
     
     Args:
-        data (list): Lista de dados a serem salvos.
+        data (iterable): Registros a serem salvos.
+        compression (str, opcional): None, 'gzip' ou 'zstd'.
+        write_csv (bool): Se True, grava também uma cópia CSV. Padrão: 'WRITE_CSV_COPIES'.
+
+    Returns:
+        str: Caminho do arquivo NDJSON gerado.
         
     Raises:
         Exception: Caso ocorra erro ao gravar o arquivo em disco.
@@ -89,29 +531,341 @@ def save_raw_data(data):
     save_path = os.path.join(BRONZE_DIR, f"ingestion_date={partition_date}")
     os.makedirs(save_path, exist_ok=True)
     
-    file_name = f"breweries_raw_{timestamp.strftime('%H%M%S')}.json"
-    full_path = os.path.join(save_path, file_name)
+    base_name = f"breweries_raw_{timestamp.strftime('%H%M%S')}"
+    full_path = os.path.join(save_path, ndjson_file_name(base_name, compression))
+    csv_path = os.path.join(save_path, f"{base_name}.csv")
     
     try:
-        # 1. Salva como JSON
-        with open(full_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        logger.info(f"Sucesso ao salvar {len(data)} registros em {full_path}")
-        
-        # 2. Salva como CSV (para facilitar visualização rápida)
-        import pandas as pd
-        csv_path = full_path.replace('.json', '.csv')
-        pd.DataFrame(data).to_csv(csv_path, index=False, encoding='utf-8')
-        logger.info(f"Sucesso ao salvar {len(data)} registros em {csv_path}")
+        total = 0
+        iterator = iter(data)
+        while True:
+            block = list(itertools.islice(iterator, API_PER_PAGE))
+            if not block:
+                break
+            append_ndjson(full_path, block, compression)
+            total += len(block)
 
-        print(f"Sucesso! {len(data)} registros salvos em {full_path} (JSON & CSV)")
+        # A cópia CSV é gerada a partir do NDJSON já gravado: o cabeçalho reúne
+        # as colunas de todos os registros, não apenas as do primeiro bloco
+        if write_csv and total:
+            write_records_csv(lambda: iter_ndjson(full_path), csv_path)
+
+        logger.info(f"Sucesso ao salvar {total} registros em {full_path}")
+        if write_csv:
+            logger.info(f"Sucesso ao salvar {total} registros em {csv_path}")
+
+        print(f"Sucesso! {total} registros salvos em {full_path}" + (" (NDJSON & CSV)" if write_csv else ""))
+        return full_path
     except Exception as e:
         logger.error(f"Falha ao salvar dados: {str(e)}")
         raise e
 
+
+# ---------------------------------------------------------------------------
+# Ingestão com Checkpoint (Retomável)
+# ---------------------------------------------------------------------------
+
+def find_resumable_checkpoint(url, per_page=API_PER_PAGE, bronze_dir=BRONZE_DIR):
+    """
+    Procura, na partição Bronze mais recente, um checkpoint incompleto da mesma
+    origem ('url' e 'per_page') que possa ser retomado.
+
+    Returns:
+        tuple: (caminho da partição, checkpoint) ou (None, None) se não houver.
+    """
+    partitions = sorted(glob.glob(os.path.join(bronze_dir, "ingestion_date=*")))
+    if not partitions:
+        return None, None
+
+    latest_partition = partitions[-1]
+    checkpoint = read_json(os.path.join(latest_partition, BRONZE_CHECKPOINT_FILE))
+    if (
+        checkpoint
+        and not checkpoint.get("complete")
+        and checkpoint.get("url") == url
+        and checkpoint.get("per_page") == per_page
+        and "file" in checkpoint
+    ):
+        return latest_partition, checkpoint
+    return None, None
+
+
+def ingest(url=API_URL, bronze_dir=BRONZE_DIR, per_page=API_PER_PAGE,
+           max_workers=API_MAX_WORKERS, rate_limit=API_RATE_LIMIT,
+           compression=BRONZE_COMPRESSION):
+    """
+    Ingere os dados da API na camada Bronze persistindo cada página assim que ela chega.
+
+    As páginas são anexadas, em ordem, a um único arquivo NDJSON (opcionalmente
+    comprimido) na partição 'ingestion_date='. Após cada página, o manifesto
+    '_checkpoint.json' registra a última página confirmada e o tamanho do arquivo
+    naquele ponto. Se a execução anterior falhou no meio, uma nova chamada trunca
+    o arquivo no último ponto confirmado e retoma a partir da página seguinte,
+    sem baixar tudo de novo. A memória usada não cresce com o tamanho da fonte.
+
+    Args:
+        url (str): URL base da API.
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        per_page (int): Quantidade de registros por página.
+        max_workers (int): Máximo de requisições simultâneas.
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
+        compression (str, opcional): None, 'gzip' ou 'zstd' (ignorado ao retomar,
+            que mantém a compressão original do arquivo).
+
+    Returns:
+        dict: Checkpoint final da execução (arquivo gravado, páginas e registros).
+
+    Raises:
+        Exception: Caso ocorra erro na API ou na gravação; as páginas já confirmadas
+            permanecem em disco para a próxima execução.
+    """
+    logger = setup_logger()
+    partition_path, checkpoint = find_resumable_checkpoint(url, per_page, bronze_dir)
+
+    if checkpoint is not None:
+        logger.info(
+            f"Retomando ingestão {checkpoint['run_id']} em {partition_path} "
+            f"a partir da página {checkpoint['last_page'] + 1}"
+        )
+    else:
+        timestamp = datetime.now()
+        partition_path = os.path.join(
+            bronze_dir, f"ingestion_date={timestamp.strftime('%Y-%m-%d')}"
+        )
+        run_id = timestamp.strftime('%H%M%S')
+        checkpoint = {
+            "run_id": run_id,
+            "url": url,
+            "per_page": per_page,
+            "file": ndjson_file_name(f"breweries_raw_{run_id}", compression),
+            "compression": compression,
+            "started_at": timestamp.isoformat(timespec="seconds"),
+            "last_page": 0,
+            "records": 0,
+            "bytes": 0,
+            "complete": False,
+        }
+        logger.info(f"Iniciando ingestão {run_id} em {partition_path}")
+
+    os.makedirs(partition_path, exist_ok=True)
+    checkpoint_path = os.path.join(partition_path, BRONZE_CHECKPOINT_FILE)
+    data_path = os.path.join(partition_path, checkpoint["file"])
+
+    # Descarta bytes de uma página gravada mas não confirmada no checkpoint
+    with open(data_path, 'ab') as f:
+        f.truncate(checkpoint["bytes"])
+
+    try:
+        for page, data in iter_pages(
+            url, per_page, max_workers, rate_limit, start_page=checkpoint["last_page"] + 1
+        ):
+            checkpoint["bytes"] = append_ndjson(data_path, data, checkpoint["compression"])
+            checkpoint["last_page"] = page
+            checkpoint["records"] += len(data)
+            atomic_write_json(checkpoint_path, checkpoint)
+            logger.info(f"Página {page} confirmada com {len(data)} registros. Total: {checkpoint['records']}")
+    except Exception as e:
+        logger.error(
+            f"Ingestão interrompida após a página {checkpoint['last_page']}: {str(e)}"
+        )
+        raise e
+
+    checkpoint["complete"] = True
+    checkpoint["completed_at"] = datetime.now().isoformat(timespec="seconds")
+    atomic_write_json(checkpoint_path, checkpoint)
+
+    # Atualiza o estado de hashes usado pela ingestão incremental
+    hashes = {record["id"]: record_hash(record) for record in iter_ndjson(data_path)}
+    save_hash_state(hashes, checkpoint["run_id"], partition_path, bronze_dir)
+
+    logger.info(f"Ingestão concluída: {checkpoint['records']} registros em {checkpoint['last_page']} página(s).")
+    print(f"Sucesso! {checkpoint['records']} registros salvos em {data_path}")
+    return checkpoint
+
+
+# ---------------------------------------------------------------------------
+# Ingestão Incremental (Change Data Capture)
+# ---------------------------------------------------------------------------
+
+def record_hash(record) -> str:
+    """
+    Calcula o hash de conteúdo de um registro (independente da ordem das chaves).
+    """
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_hash_state(bronze_dir=BRONZE_DIR):
+    """
+    Carrega o estado de hashes da última ingestão ({id: hash} e metadados).
+    Retorna None se nenhuma ingestão registrou estado ainda.
+    """
+    state_path = os.path.join(bronze_dir, BRONZE_HASH_STATE_FILE)
+    if not os.path.exists(state_path):
+        return None
+    with gzip.open(state_path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_hash_state(hashes, run_id, partition_path, bronze_dir=BRONZE_DIR):
+    """
+    Grava atomicamente o estado de hashes ({id: hash}) da ingestão concluída.
+    """
+    state = {
+        "run_id": run_id,
+        "partition": os.path.basename(partition_path),
+        "updated_at": datetime.now().isoformat(timespec="seconds"),
+        "records": len(hashes),
+        "hashes": hashes,
+    }
+    with atomic_path(os.path.join(bronze_dir, BRONZE_HASH_STATE_FILE)) as tmp_path:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+
+
+def ingest_incremental(url=API_URL, bronze_dir=BRONZE_DIR, per_page=API_PER_PAGE,
+                       max_workers=API_MAX_WORKERS, rate_limit=API_RATE_LIMIT,
+                       compression=BRONZE_COMPRESSION):
+    """
+    Ingestão incremental: grava apenas os registros novos, alterados e removidos
+    desde a última ingestão, como uma partição delta.
+
+    Cada página buscada é comparada com o estado anterior através de hashes de
+    conteúdo por 'id'; os registros que diferem são guardados em um arquivo
+    temporário. Ao final, como um 'id' repetido na fonte vale pela última
+    ocorrência, apenas a última ocorrência de cada 'id' novo ('insert') ou
+    alterado ('update') é anexada ao arquivo delta, com o campo '_op'; os ids
+    ausentes da fonte são registrados como '_op': 'delete' (apenas o 'id').
+    O manifesto '_delta.json' da partição resume cada execução.
+
+    Se ainda não houver estado de hashes, executa uma ingestão completa ('ingest').
+
+    Args:
+        url (str): URL base da API.
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        per_page (int): Quantidade de registros por página.
+        max_workers (int): Máximo de requisições simultâneas.
+        rate_limit (float): Requisições por segundo. None ou 0 desativa o limite.
+        compression (str, opcional): None, 'gzip' ou 'zstd'.
+
+    Returns:
+        dict: Resumo da execução (arquivo delta e contagens por operação).
+
+    Raises:
+        Exception: Caso ocorra erro na API ou na gravação.
+    """
+    logger = setup_logger()
+    previous = load_hash_state(bronze_dir)
+    if previous is None:
+        logger.info("Nenhum estado de hashes encontrado. Executando ingestão completa.")
+        return ingest(url, bronze_dir, per_page, max_workers, rate_limit, compression)
+
+    previous_hashes = previous["hashes"]
+    timestamp = datetime.now()
+    run_id = timestamp.strftime('%H%M%S')
+    partition_path = os.path.join(bronze_dir, f"ingestion_date={timestamp.strftime('%Y-%m-%d')}")
+    os.makedirs(partition_path, exist_ok=True)
+
+    file_name = ndjson_file_name(f"breweries_delta_{run_id}", compression)
+    data_path = os.path.join(partition_path, file_name)
+    logger.info(
+        f"Iniciando ingestão incremental {run_id} em {partition_path} "
+        f"(base: {previous['partition']}, {previous['records']} registros)"
+    )
+
+    hashes = {}
+    last_seen = {}  # id -> posição da última ocorrência na fonte
+    position = 0
+    counts = {"insert": 0, "update": 0, "delete": 0, "unchanged": 0}
+    # Candidatos a alteração, descartados ao final (sem extensão de dados da Bronze)
+    candidates_path = os.path.join(partition_path, f".{file_name}.candidates.tmp")
+
+    try:
+        for page, data in iter_pages(url, per_page, max_workers, rate_limit):
+            candidates = []
+            for record in data:
+                digest = record_hash(record)
+                hashes[record["id"]] = digest
+                last_seen[record["id"]] = position
+                if previous_hashes.get(record["id"]) != digest:
+                    candidates.append({"position": position, "record": record})
+                position += 1
+
+            if candidates:
+                append_ndjson(candidates_path, candidates)
+            logger.info(f"Página {page} comparada: {len(candidates)} candidato(s) em {len(data)} registros.")
+
+        # Um id repetido na fonte vale pela última ocorrência (como o 'keep="last"'
+        # da Silver): só ela é comparada com o estado anterior e gravada no delta
+        changes = (
+            {**c["record"], "_op": "update" if c["record"]["id"] in previous_hashes else "insert"}
+            for c in (iter_ndjson(candidates_path) if os.path.exists(candidates_path) else ())
+            if last_seen[c["record"]["id"]] == c["position"]
+        )
+        while True:
+            block = list(itertools.islice(changes, per_page))
+            if not block:
+                break
+            append_ndjson(data_path, block, compression)
+            for record in block:
+                counts[record["_op"]] += 1
+        counts["unchanged"] = len(hashes) - counts["insert"] - counts["update"]
+
+        deleted = [
+            {"id": brewery_id, "_op": "delete"}
+            for brewery_id in previous_hashes if brewery_id not in hashes
+        ]
+        if deleted:
+            append_ndjson(data_path, deleted, compression)
+        counts["delete"] = len(deleted)
+    except Exception as e:
+        logger.error(f"Ingestão incremental interrompida: {str(e)}")
+        raise e
+    finally:
+        if os.path.exists(candidates_path):
+            os.remove(candidates_path)
+
+    run = {
+        "run_id": run_id,
+        "mode": "incremental",
+        "url": url,
+        "file": file_name if os.path.exists(data_path) else None,
+        "base_partition": previous["partition"],
+        "base_run_id": previous["run_id"],
+        "records_scanned": len(hashes),
+        "counts": counts,
+        "completed_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    manifest_path = os.path.join(partition_path, BRONZE_DELTA_MANIFEST)
+    manifest = read_json(manifest_path, default={"runs": []})
+    manifest["runs"].append(run)
+    atomic_write_json(manifest_path, manifest)
+
+    # O novo estado só é gravado depois que o delta está em disco
+    save_hash_state(hashes, run_id, partition_path, bronze_dir)
+
+    logger.info(f"Ingestão incremental concluída: {counts}")
+    print(
+        f"Sucesso! Delta com {counts['insert']} novo(s), {counts['update']} alterado(s) e "
+        f"{counts['delete']} removido(s) em {partition_path}"
+    )
+    return run
+
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingestão da camada Bronze.")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Grava apenas registros novos, alterados e removidos (partição delta).",
+    )
+    args = parser.parse_args()
+
     try:
-        data = fetch_data(API_URL)
-        save_raw_data(data)
+        if args.incremental:
+            ingest_incremental(API_URL)
+        else:
+            ingest(API_URL)
     except Exception as e:
         print(f"Falha na ingestão: {e}")
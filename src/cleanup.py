@@ -3,7 +3,7 @@ import shutil
 import logging
 import re
 from datetime import datetime
-from config import BASE_DIR
+from config import BASE_DIR, SILVER_MANIFEST_FILE
 
 # Configuração de logging para limpeza
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -52,6 +52,11 @@ def smart_cleanup(directory_path):
     groups = {}
 
     for root, dirs, files in os.walk(directory_path):
+        # Diretórios versionados por manifesto (camada Silver) têm limpeza própria ('silver.vacuum_silver')
+        if SILVER_MANIFEST_FILE in files:
+            logger.info(f"Ignorando diretório versionado por manifesto: {root}")
+            dirs[:] = []
+            continue
         for filename in files:
             full_path = os.path.join(root, filename)
             base_name, timestamp, ext = get_file_info(filename)
@@ -0,0 +1,224 @@
+"""
+compaction.py – Compactação das partições da camada Silver.
+
+Cada execução do pipeline (e cada merge incremental) acrescenta arquivos
+pequenos às partições 'brewery_type='. A compactação junta os arquivos de
+cada partição, ordena as linhas (ver 'SILVER_SORT_COLUMNS') e as regrava em
+arquivos de tamanho alvo, com row groups ordenados e estatísticas por coluna.
+
+Os novos arquivos só passam a valer quando o manifesto é substituído
+(atomicamente) por uma nova versão: leitores nunca enxergam um estado parcial.
+Os arquivos antigos permanecem no disco até 'silver.vacuum_silver'.
+
+Uso:
+    python compaction.py
+    python compaction.py --target-mb 64 --vacuum
+"""
+
+import os
+import time
+import argparse
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from config import (
+    SILVER_DIR, SILVER_TARGET_FILE_SIZE, SILVER_ROW_GROUP_SIZE, SILVER_SORT_COLUMNS, SILVER_SNAPSHOT,
+)
+from schema import apply_dictionary_schema
+from storage import atomic_path, read_silver_manifest, list_silver_files
+from silver import logger, bootstrap_silver_manifest, commit_silver_version, vacuum_silver
+from silver_arrow import concat_tables
+from snapshot import refresh_silver_snapshot
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def scan_silver(silver_dir: str = SILVER_DIR) -> dict:
+    """
+    Lê a versão atual da camada Silver por inteiro e mede o tempo de leitura.
+
+    Returns:
+        dict: Quantidade de arquivos, linhas, bytes em disco e segundos de leitura.
+    """
+    files = list_silver_files(silver_dir)
+    start = time.perf_counter()
+    rows = sum(pq.read_table(f).num_rows for f in files)
+    return {
+        "files": len(files),
+        "rows": rows,
+        "bytes": sum(os.path.getsize(f) for f in files),
+        "scan_seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Compactação
+# ---------------------------------------------------------------------------
+
+def _needs_compaction(paths: list, target_file_size: int) -> bool:
+    """
+    Uma partição é compactada se tiver mais de um arquivo pequeno (menos da
+    metade do alvo) ou algum arquivo muito maior que o alvo.
+    """
+    sizes = [os.path.getsize(p) for p in paths]
+    small = sum(size < target_file_size / 2 for size in sizes)
+    return small > 1 or any(size > 2 * target_file_size for size in sizes)
+
+
+def compact_partition(silver_dir: str, brewery_type: str, paths: list, file_prefix: str,
+                      target_file_size: int = SILVER_TARGET_FILE_SIZE,
+                      row_group_size: int = SILVER_ROW_GROUP_SIZE,
+                      sort_columns: list = SILVER_SORT_COLUMNS) -> list:
+    """
+    Junta, ordena e regrava os arquivos de uma partição em arquivos de tamanho alvo.
+
+    A quantidade de linhas por arquivo é estimada pelo tamanho médio em disco
+    de uma linha nos arquivos de entrada.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        brewery_type (str): Valor da partição.
+        paths (list): Arquivos atuais da partição, relativos ao diretório Silver.
+        file_prefix (str): Prefixo dos novos arquivos.
+        target_file_size (int): Tamanho alvo de cada arquivo, em bytes.
+        row_group_size (int): Linhas por row group.
+        sort_columns (list): Colunas de ordenação (as ausentes são ignoradas).
+
+    Returns:
+        list: Novos arquivos da partição, relativos ao diretório Silver.
+    """
+    full_paths = [os.path.join(silver_dir, p) for p in paths]
+    table = apply_dictionary_schema(
+        concat_tables([pq.read_table(p) for p in full_paths]).replace_schema_metadata(None)
+    )
+    if not table.num_rows:
+        return []
+
+    ordering = [(c, "ascending") for c in sort_columns if c in table.column_names]
+    if ordering:
+        # As colunas de dicionário têm dicionário único e ordenado: ordenar pelos
+        # índices equivale a ordenar pelas strings (o Arrow não ordena dicionários)
+        keys = pa.table({
+            c: pa.chunked_array([chunk.indices for chunk in table[c].chunks], table[c].type.index_type)
+            if pa.types.is_dictionary(table[c].type) else table[c]
+            for c, _ in ordering
+        })
+        table = table.take(pc.sort_indices(keys, sort_keys=ordering))
+    sorting = pq.SortingColumn.from_ordering(table.schema, ordering) if ordering else None
+
+    bytes_per_row = sum(os.path.getsize(p) for p in full_paths) / table.num_rows
+    rows_per_file = max(row_group_size, int(target_file_size / max(bytes_per_row, 1)))
+
+    new_paths = []
+    for index, offset in enumerate(range(0, table.num_rows, rows_per_file)):
+        relpath = os.path.join(f"brewery_type={brewery_type}", f"{file_prefix}_{index:03d}.parquet")
+        with atomic_path(os.path.join(silver_dir, relpath)) as tmp_path:
+            with pq.ParquetWriter(tmp_path, table.schema, sorting_columns=sorting,
+                                  write_statistics=True) as writer:
+                writer.write_table(table.slice(offset, rows_per_file), row_group_size=row_group_size)
+        new_paths.append(relpath)
+
+    logger.info(
+        f"Compactação brewery_type={brewery_type}: {len(paths)} -> {len(new_paths)} arquivo(s), "
+        f"{table.num_rows} linhas."
+    )
+    return new_paths
+
+
+def compact_silver(silver_dir: str = SILVER_DIR, target_file_size: int = SILVER_TARGET_FILE_SIZE,
+                   row_group_size: int = SILVER_ROW_GROUP_SIZE, force: bool = False) -> dict:
+    """
+    Compacta todas as partições da camada Silver e publica o resultado como uma
+    nova versão do manifesto.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        target_file_size (int): Tamanho alvo de cada arquivo, em bytes.
+        row_group_size (int): Linhas por row group.
+        force (bool): Se True, regrava também as partições que já estão compactadas.
+
+    Returns:
+        dict: Relatório com as medições antes/depois e as partições compactadas.
+
+    Raises:
+        FileNotFoundError: Se a camada Silver estiver vazia.
+        RuntimeError: Se outra escrita publicar uma versão durante a compactação.
+    """
+    manifest = read_silver_manifest(silver_dir) or bootstrap_silver_manifest(silver_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"Nenhum arquivo Parquet encontrado na camada Silver: {silver_dir}")
+
+    before = scan_silver(silver_dir)
+    prefix = f"breweries_{datetime.now().strftime('%Y%m%d_%H%M%S')}_c{manifest['version'] + 1:06d}"
+    partitions = {t: list(paths) for t, paths in manifest["partitions"].items()}
+    compacted = []
+
+    for brewery_type, paths in sorted(manifest["partitions"].items()):
+        full_paths = [os.path.join(silver_dir, p) for p in paths]
+        if not force and not _needs_compaction(full_paths, target_file_size):
+            continue
+        partitions[brewery_type] = compact_partition(
+            silver_dir, brewery_type, paths, prefix, target_file_size, row_group_size
+        )
+        compacted.append(brewery_type)
+
+    if compacted:
+        # Outra escrita publicou uma versão no meio do processo: os arquivos
+        # compactados não refletem o estado atual e não podem ser publicados
+        current = read_silver_manifest(silver_dir)
+        if current["version"] != manifest["version"]:
+            raise RuntimeError(
+                f"A Silver mudou durante a compactação (versão {manifest['version']} -> "
+                f"{current['version']}). Execute a compactação novamente."
+            )
+        # Mesmas linhas em outros arquivos: nenhuma mudança em nível de linha
+        commit_silver_version(silver_dir, partitions, "compact", partitions_compacted=compacted,
+                              changes={"inserted": [], "removed": None})
+        if SILVER_SNAPSHOT:
+            refresh_silver_snapshot(silver_dir)
+
+    after = scan_silver(silver_dir)
+    report = {"before": before, "after": after, "partitions_compacted": compacted}
+    logger.info(f"Compactação Silver: {report}")
+    return report
+
+
+def print_report(report: dict) -> None:
+    """Imprime o resumo antes/depois de uma compactação."""
+    before, after = report["before"], report["after"]
+    print("\nCompactação da Camada Silver")
+    print("=" * 60)
+    print(f"  {'':<18}{'arquivos':>10}{'MB':>12}{'leitura (s)':>16}")
+    for label, m in (("antes", before), ("depois", after)):
+        print(f"  {label:<18}{m['files']:>10}{m['bytes'] / 2 ** 20:>12.2f}{m['scan_seconds']:>16.4f}")
+    print("=" * 60)
+    print(f"  Partições compactadas: {', '.join(report['partitions_compacted']) or 'nenhuma'}")
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compactação das partições da camada Silver.")
+    parser.add_argument("--silver-dir", default=SILVER_DIR)
+    parser.add_argument("--target-mb", type=float, default=SILVER_TARGET_FILE_SIZE / 2 ** 20,
+                        help="Tamanho alvo de cada arquivo, em MB.")
+    parser.add_argument("--row-group-size", type=int, default=SILVER_ROW_GROUP_SIZE,
+                        help="Linhas por row group.")
+    parser.add_argument("--force", action="store_true",
+                        help="Regrava também as partições que já estão compactadas.")
+    parser.add_argument("--vacuum", action="store_true",
+                        help="Remove, ao final, os arquivos fora da versão atual do manifesto.")
+    args = parser.parse_args()
+
+    report = compact_silver(args.silver_dir, int(args.target_mb * 2 ** 20), args.row_group_size, args.force)
+    print_report(report)
+    if args.vacuum:
+        removed = vacuum_silver(args.silver_dir)
+        print(f"  Arquivos removidos pelo vacuum: {removed}")
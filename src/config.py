@@ -11,6 +11,92 @@ BRONZE_DIR = os.path.join(DATA_DIR, "bronze")
 SILVER_DIR = os.path.join(DATA_DIR, "silver")
 GOLD_DIR = os.path.join(DATA_DIR, "gold")
 
+# Exportações CSV sob demanda (ver 'export.py')
+EXPORT_DIR = os.path.join(DATA_DIR, "exports")
+
+# Se True, as camadas gravam também uma cópia CSV ao lado de cada arquivo
+# colunar (NDJSON / Parquet). Por padrão, CSV é gerado apenas via 'export.py'.
+WRITE_CSV_COPIES = False
+
+# Resultados de benchmark (baseline e execuções)
+BENCHMARK_DIR = os.path.join(BASE_DIR, "benchmarks")
+
+# Partições Bronze sintéticas para testes de escala (ver 'synthetic.py'): gravadas
+# fora da Bronze de produção e identificadas pelo marcador, que a Silver recusa
+SYNTHETIC_DIR = os.path.join(DATA_DIR, "synthetic")
+SYNTHETIC_MARKER_FILE = "_synthetic.json"
+
+# Manifesto de checkpoint da ingestão, gravado em cada partição Bronze
+BRONZE_CHECKPOINT_FILE = "_checkpoint.json"
+
+# Ingestão incremental (CDC): manifesto das partições delta e estado de hashes
+# por registro (relativo ao diretório Bronze)
+BRONZE_DELTA_MANIFEST = "_delta.json"
+BRONZE_HASH_STATE_FILE = os.path.join("_state", "record_hashes.json.gz")
+
+# Compressão dos arquivos NDJSON da camada Bronze: None, "gzip" ou "zstd"
+BRONZE_COMPRESSION = "gzip"
+
+# Quantidade de registros por lote ao ler a camada Bronze
+SILVER_BATCH_SIZE = 50_000
+
+# Motor de transformação da camada Silver: "pandas" ou "arrow" (pyarrow.compute)
+SILVER_ENGINE = "pandas"
+
+# Escrita da camada Silver: "overwrite" (nova versão completa) ou "merge" (upsert por 'id')
+SILVER_WRITE_MODE = "overwrite"
+
+# Partições gravadas simultaneamente na escrita da camada Silver (1 = sequencial)
+SILVER_WRITE_WORKERS = os.cpu_count() or 1
+
+# Arquivos Silver lidos simultaneamente na carga da camada Gold
+SILVER_READ_WORKERS = os.cpu_count() or 1
+
+# Agregações Gold executadas simultaneamente sobre o cubo base (1 = sequencial)
+GOLD_AGG_WORKERS = os.cpu_count() or 1
+
+# Motor das agregações Gold: "pandas" (cubo base) ou "duckdb" (SQL sobre os
+# arquivos Parquet da Silver, ver 'gold_duckdb.py'; requer o pacote 'duckdb')
+GOLD_ENGINE = "pandas"
+
+# Threads do motor Gold "duckdb" na leitura e agregação da Silver
+GOLD_DUCKDB_THREADS = os.cpu_count() or 1
+
+# Manifesto de versões da camada Silver (relativo ao diretório Silver)
+SILVER_MANIFEST_FILE = "_manifest.json"
+
+# Registro de mudanças em nível de linha dos merges (relativo ao diretório Silver)
+SILVER_CHANGES_DIR = "_changes"
+
+# Snapshot Arrow IPC (memory-mapped) da versão atual da Silver consolidada,
+# atualizado a cada nova versão e lido pela Gold e pelo verificador
+# (relativo ao diretório Silver; ver 'snapshot.py')
+SILVER_SNAPSHOT = True
+SILVER_SNAPSHOT_FILE = os.path.join("_snapshot", "snapshot.json")
+
+# Compactação da camada Silver: tamanho alvo dos arquivos, linhas por row group
+# e ordenação das linhas (colunas usadas nos agrupamentos da Gold)
+SILVER_TARGET_FILE_SIZE = 128 * 2 ** 20
+SILVER_ROW_GROUP_SIZE = 100_000
+SILVER_SORT_COLUMNS = ["country", "state_province", "city", "id"]
+
+# Gold incremental: cubo base persistido e atualizado a partir das mudanças da
+# Silver (relativo ao diretório Gold; ver 'gold.update_gold_state')
+GOLD_INCREMENTAL = True
+GOLD_STATE_FILE = os.path.join("_state", "gold_state.json")
+
+# Manifesto da camada Gold: versão atual ("latest") de cada tabela (relativo ao diretório Gold)
+GOLD_MANIFEST_FILE = "_manifest.json"
+
+# Tabelas Gold gravadas simultaneamente na publicação (1 = sequencial)
+GOLD_WRITE_WORKERS = os.cpu_count() or 1
+
 # Configuração da API
 API_URL = "https://api.openbrewerydb.org/v1/breweries"
-
+API_PER_PAGE = 200  # Limite máximo permitido pela API
+API_MAX_WORKERS = 8  # Requisições de página simultâneas (1 = sequencial)
+API_RATE_LIMIT = 10.0  # Requisições por segundo (token bucket)
+API_TIMEOUT = 10  # Timeout por requisição, em segundos
+API_MAX_RETRIES = 5  # Novas tentativas por página em respostas 429/5xx ou falhas de rede
+API_BACKOFF_BASE = 0.5  # Base do backoff exponencial com jitter, em segundos
+API_BACKOFF_MAX = 30.0  # Espera máxima entre tentativas, em segundos
@@ -116,14 +116,16 @@ This project establishes a modern Data Lake using the Medallion Architecture (Br
 ## Data Architecture
 ### 1. Bronze Layer (Raw)
 - **Process**: Automated ingestion from Open Brewery DB via REST API.
-- **Storage**: JSON format, preserving raw state.
+- **Storage**: NDJSON format (optionally gzip/zstd compressed), written page by page with a resumable checkpoint, preserving raw state.
 
 ### 2. Silver Layer (Cleaned)
 - **Process**: Data cleaning, deduplication, and standardization.
-- **Storage**: Optimized Parquet format partitioned by `brewery_type`.
+- **Storage**: Optimized Parquet format partitioned by `brewery_type`, versioned by a `_manifest.json` (full overwrite or id-keyed upsert/delete merge), with low-cardinality columns (type, country, state, city) dictionary-encoded. Each new version is also consolidated into a memory-mapped Arrow IPC snapshot that Gold and the verifier open without decoding Parquet (`snapshot.py`). CSV copies are produced on demand with `export.py`.
 
 ### 3. Gold Layer (Analytical)
-- **Process**: Complex aggregations and business metrics calculation.
+- **Process**: Business metrics declared as table specs (dimensions, measures, filters, sort, top-N) and served from shared grouping sets over a persisted base cube that is updated incrementally from Silver changes (`--full` recomputes, `--check` verifies against a full recompute). An optional DuckDB engine (`--engine duckdb`) computes the same grouping sets in SQL directly over the Silver Parquet files, multi-threaded, with identical output.
+- **Storage**: Timestamped Parquet versions of each table, written concurrently and published together by an atomically replaced `_manifest.json` that points to the latest version of every table.
+- **Serving**: `gold_service.py` serves the current tables in-process or over HTTP (`GET /tables/<name>?state=&country=&top=`) from an in-memory cache that reloads only the tables republished in the manifest.
 - **Quality**: Automated checks verify data integrity.
 
 <!-- ANALYTICAL_RESULTS_EN -->
@@ -137,14 +139,16 @@ Este projeto estabelece um Data Lake moderno utilizando a Arquitetura Medalhão
 ## Arquitetura de Dados
 ### 1. Camada Bronze (Raw)
 - **Processo**: Ingestão automatizada da Open Brewery DB via API REST.
-- **Armazenamento**: Formato JSON original preservando o estado bruto.
+- **Armazenamento**: Formato NDJSON (opcionalmente comprimido com gzip/zstd), gravado página a página com checkpoint retomável, preservando o estado bruto.
 
 ### 2. Camada Silver (Limpa)
 - **Processo**: Limpeza, deduplicação e padronização dos dados.
-- **Armazenamento**: Formato Parquet otimizado, particionado por `brewery_type`.
+- **Armazenamento**: Formato Parquet otimizado, particionado por `brewery_type` e versionado por um `_manifest.json` (reescrita completa ou merge com upsert/remoção por id), com as colunas de baixa cardinalidade (tipo, país, estado, cidade) codificadas em dicionário. Cada nova versão também é consolidada em um snapshot Arrow IPC aberto com memory map pela Gold e pelo verificador, sem decodificar Parquet (`snapshot.py`). Cópias CSV são geradas sob demanda com `export.py`.
 
 ### 3. Camada Gold (Analítica)
-- **Processo**: Agregações complexas e cálculo de métricas de negócio.
+- **Processo**: Métricas de negócio declaradas como especificações de tabelas (dimensões, medidas, filtros, ordenação, top-N) e servidas por conjuntos de agrupamento compartilhados sobre um cubo base persistido e atualizado incrementalmente a partir das mudanças da Silver (`--full` recalcula tudo, `--check` confere com um recálculo completo). Um motor DuckDB opcional (`--engine duckdb`) calcula os mesmos conjuntos de agrupamento em SQL, com várias threads, diretamente sobre os arquivos Parquet da Silver, com resultado idêntico.
+- **Armazenamento**: Versões Parquet com timestamp de cada tabela, gravadas simultaneamente e publicadas em conjunto por um `_manifest.json` substituído atomicamente, que aponta a versão atual de cada tabela.
+- **Consulta**: `gold_service.py` serve as tabelas atuais em processo ou via HTTP (`GET /tables/<nome>?state=&country=&top=`) a partir de um cache em memória que recarrega apenas as tabelas republicadas no manifesto.
 - **Qualidade**: Verificações automatizadas garantem a integridade dos dados.
 
 <!-- ANALYTICAL_RESULTS_PT -->
@@ -0,0 +1,166 @@
+"""
+export.py – Exportação sob demanda das camadas do Data Lake para CSV.
+
+As camadas gravam apenas formatos colunares / NDJSON por padrão
+(ver 'WRITE_CSV_COPIES' em 'config.py'). Quando alguém precisa de um CSV,
+este comando o gera a partir da versão atual dos dados:
+
+Uso:
+    python export.py silver                                    # Silver inteira
+    python export.py silver --partition micro                  # Apenas brewery_type=micro
+    python export.py gold --table top_cities_by_brewery_count  # Versão atual de uma tabela Gold
+    python export.py bronze --date 2026-02-22                  # Partição Bronze de uma data
+"""
+
+import os
+import argparse
+import itertools
+from datetime import datetime
+
+import pyarrow.parquet as pq
+
+from config import BRONZE_DIR, SILVER_DIR, GOLD_DIR, EXPORT_DIR
+from storage import atomic_path, list_silver_files, gold_table_path, write_records_csv
+
+
+# ---------------------------------------------------------------------------
+# Utilitários
+# ---------------------------------------------------------------------------
+
+def _default_output(name: str) -> str:
+    return os.path.join(EXPORT_DIR, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+
+
+def parquet_to_csv(parquet_files: list, output: str) -> int:
+    """
+    Concatena arquivos Parquet em um único CSV, um row group por vez (sem
+    carregar os arquivos inteiros em memória). O CSV só aparece no destino
+    quando está completo.
+
+    Returns:
+        int: Quantidade de linhas exportadas.
+    """
+    rows = 0
+    with atomic_path(output) as tmp_path:
+        for file_path in parquet_files:
+            parquet = pq.ParquetFile(file_path)
+            for index in range(parquet.num_row_groups):
+                df = parquet.read_row_group(index).to_pandas()
+                df.to_csv(tmp_path, mode="a", header=rows == 0, index=False)
+                rows += len(df)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Exportações por Camada
+# ---------------------------------------------------------------------------
+
+def export_silver(partition: str = None, output: str = None, silver_dir: str = SILVER_DIR) -> str:
+    """
+    Exporta a versão atual da camada Silver (ou uma partição 'brewery_type') para CSV.
+
+    Args:
+        partition (str, opcional): Valor de 'brewery_type'. Padrão: todas as partições.
+        output (str, opcional): Caminho do CSV. Padrão: 'data/exports/silver_<partição>_<timestamp>.csv'.
+        silver_dir (str): Caminho para o diretório da camada Silver.
+
+    Returns:
+        str: Caminho do CSV gerado.
+
+    Raises:
+        FileNotFoundError: Se não houver arquivos para a partição escolhida.
+    """
+    files = list_silver_files(silver_dir)
+    if partition is not None:
+        files = [f for f in files if os.path.basename(os.path.dirname(f)) == f"brewery_type={partition}"]
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo Silver encontrado para a partição: {partition or '*'}")
+
+    output = output or _default_output(f"silver_{partition or 'all'}")
+    rows = parquet_to_csv(files, output)
+    print(f"Exportados {rows} registros da Silver para: {output}")
+    return output
+
+
+def export_gold(table: str, output: str = None, gold_dir: str = GOLD_DIR) -> str:
+    """
+    Exporta a versão atual de uma tabela Gold (apontada pelo manifesto da Gold) para CSV.
+
+    Args:
+        table (str): Nome da tabela (ver 'gold.GOLD_TABLE_SPECS', ex.: 'top_cities_by_brewery_count').
+        output (str, opcional): Caminho do CSV. Padrão: 'data/exports/<tabela>_<timestamp>.csv'.
+        gold_dir (str): Caminho para o diretório da camada Gold.
+
+    Returns:
+        str: Caminho do CSV gerado.
+
+    Raises:
+        FileNotFoundError: Se a tabela não existir na camada Gold.
+    """
+    path = gold_table_path(gold_dir, table)
+    if path is None:
+        raise FileNotFoundError(f"Tabela Gold não encontrada: {table}")
+
+    output = output or _default_output(table)
+    rows = parquet_to_csv([path], output)
+    print(f"Exportadas {rows} linhas de {os.path.basename(path)} para: {output}")
+    return output
+
+
+def export_bronze(date: str = None, output: str = None, bronze_dir: str = BRONZE_DIR) -> str:
+    """
+    Exporta os registros de uma partição Bronze (todos os arquivos da data) para CSV.
+
+    Args:
+        date (str, opcional): Data da partição (YYYY-MM-DD). Padrão: a mais recente.
+        output (str, opcional): Caminho do CSV. Padrão: 'data/exports/bronze_<data>_<timestamp>.csv'.
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+
+    Returns:
+        str: Caminho do CSV gerado.
+    """
+    # Importado aqui para não carregar o pandas/logging da Silver nas demais exportações
+    from silver import latest_bronze_partition, list_bronze_files, iter_bronze_records
+
+    partition = (
+        os.path.join(bronze_dir, f"ingestion_date={date}") if date else latest_bronze_partition(bronze_dir)
+    )
+    # Exportação dos dados brutos: partições incompletas ou sintéticas também são lidas
+    files = list_bronze_files(partition, allow_incomplete=True, allow_synthetic=True)
+    output = output or _default_output(f"bronze_{os.path.basename(partition).split('=', 1)[-1]}")
+
+    rows = write_records_csv(
+        lambda: itertools.chain.from_iterable(iter_bronze_records(f) for f in files), output
+    )
+    print(f"Exportados {rows} registros da Bronze para: {output}")
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta dados do Data Lake para CSV sob demanda.")
+    subparsers = parser.add_subparsers(dest="layer", required=True)
+
+    silver_parser = subparsers.add_parser("silver", help="Versão atual da camada Silver.")
+    silver_parser.add_argument("--partition", help="Valor de brewery_type (padrão: todas).")
+    silver_parser.add_argument("--output", help="Caminho do CSV de saída.")
+
+    gold_parser = subparsers.add_parser("gold", help="Versão atual de uma tabela Gold.")
+    gold_parser.add_argument("--table", required=True,
+                             help="Nome da tabela (ex.: top_cities_by_brewery_count).")
+    gold_parser.add_argument("--output", help="Caminho do CSV de saída.")
+
+    bronze_parser = subparsers.add_parser("bronze", help="Partição Bronze de uma data.")
+    bronze_parser.add_argument("--date", help="Data da partição, YYYY-MM-DD (padrão: a mais recente).")
+    bronze_parser.add_argument("--output", help="Caminho do CSV de saída.")
+
+    args = parser.parse_args()
+    if args.layer == "silver":
+        export_silver(args.partition, args.output)
+    elif args.layer == "gold":
+        export_gold(args.table, args.output)
+    else:
+        export_bronze(args.date, args.output)
@@ -1,13 +1,26 @@
 import os
-import glob
+import sys
+import uuid
 import logging
+import argparse
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import numpy as np
-
-
-from config import SILVER_DIR, GOLD_DIR, LOGS_DIR
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+from config import (
+    SILVER_DIR, SILVER_READ_WORKERS, GOLD_DIR, GOLD_AGG_WORKERS, GOLD_INCREMENTAL, GOLD_STATE_FILE,
+    GOLD_MANIFEST_FILE, GOLD_WRITE_WORKERS, GOLD_ENGINE, SILVER_SNAPSHOT, LOGS_DIR, WRITE_CSV_COPIES,
+)
+from schema import apply_categorical_schema, concat_categorical, decode_dictionaries
+from snapshot import open_silver_snapshot
+from storage import (
+    atomic_path, atomic_write_json, read_json, read_silver_manifest, list_silver_files, read_gold_manifest,
+)
 import data_quality as dq
 import documentation as doc
 
@@ -42,37 +55,180 @@ logger = setup_logger()
 # Carga da Camada Silver
 # ---------------------------------------------------------------------------
 
-def load_silver(silver_dir: str = SILVER_DIR) -> pd.DataFrame:
+# Colunas da Silver usadas pelas tabelas de 'GOLD_TABLE_SPECS'
+GOLD_COLUMNS = [
+    "id", "brewery_type", "country", "state_province", "city", "address_1", "phone", "website_url",
+]
+
+
+def _may_match(statistics, op: str, value) -> bool:
     """
-    Lê todos os arquivos Parquet da camada Silver (particionados por brewery_type)
-    e retorna um único DataFrame consolidado.
-    
+    Indica, pelas estatísticas (mín./máx.) de uma coluna em um row group, se
+    alguma linha pode satisfazer o filtro. Na dúvida (sem estatísticas, tipos
+    incomparáveis ou operadores sem poda), o row group é mantido.
+    """
+    if statistics is None or not statistics.has_min_max:
+        return True
+    low, high = statistics.min, statistics.max
+    try:
+        if op in ("=", "=="):
+            return low <= value <= high
+        if op == "in":
+            return any(low <= v <= high for v in value if v is not None)
+        if op == "<":
+            return low < value
+        if op == "<=":
+            return low <= value
+        if op == ">":
+            return high > value
+        if op == ">=":
+            return high >= value
+    except TypeError:
+        return True
+    return True
+
+
+def _read_silver_file(file_path: str, columns: list = None, filters: list = None):
+    """
+    Lê de um arquivo Silver apenas as colunas e os row groups necessários.
+
+    Os row groups cujas estatísticas excluem algum filtro são descartados sem
+    leitura; nas linhas lidas, os filtros são aplicados exatamente.
+
+    Returns:
+        tuple: (pa.Table, bytes comprimidos lidos do disco).
+    """
+    parquet = pq.ParquetFile(file_path)
+    metadata, names = parquet.metadata, parquet.schema_arrow.names
+    filters = filters or []
+    wanted = list(dict.fromkeys((columns or names) + [c for c, _, _ in filters]))
+    read_columns = [c for c in wanted if c in names]
+
+    row_groups = []
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        stats = {
+            row_group.column(j).path_in_schema: row_group.column(j).statistics
+            for j in range(row_group.num_columns)
+        }
+        if all(_may_match(stats.get(col), op, value) for col, op, value in filters):
+            row_groups.append(index)
+
+    table = parquet.read_row_groups(row_groups, columns=read_columns).replace_schema_metadata(None)
+    bytes_read = sum(
+        metadata.row_group(i).column(j).total_compressed_size
+        for i in row_groups
+        for j in range(metadata.num_columns)
+        if metadata.row_group(i).column(j).path_in_schema in read_columns
+    )
+
+    # Recupera o valor da partição do nome da pasta se a coluna estiver ausente
+    if "brewery_type" in wanted and "brewery_type" not in table.column_names:
+        btype = os.path.basename(os.path.dirname(file_path)).split("=", 1)[-1]
+        table = table.append_column("brewery_type", pa.repeat(btype, table.num_rows))
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    if columns is not None:
+        table = table.select([c for c in columns if c in table.column_names])
+    return table, bytes_read
+
+
+def load_silver(silver_dir: str = SILVER_DIR, columns: list = None, filters: list = None,
+                max_workers: int = SILVER_READ_WORKERS,
+                use_snapshot: bool = SILVER_SNAPSHOT) -> pd.DataFrame:
+    """
+    Lê a versão atual da camada Silver (particionada por brewery_type, ver
+    'storage.list_silver_files') e retorna um único DataFrame consolidado.
+
+    Se houver um snapshot Arrow IPC da versão atual (ver 'snapshot.py'), ele é
+    aberto com memory map, sem decodificar Parquet. Caso contrário, apenas os
+    bytes necessários são lidos: as colunas pedidas, os arquivos cuja partição
+    'brewery_type=' atende aos filtros e os row groups cujas estatísticas
+    Parquet não os excluem. Os arquivos são lidos em paralelo.
+
     Args:
         silver_dir (str): Caminho para o diretório da camada Silver.
-        
+        columns (list, opcional): Colunas a carregar (ex.: 'GOLD_COLUMNS'). Padrão: todas.
+        filters (list, opcional): Filtros em conjunção, no formato do pyarrow:
+            [("country", "==", "United States"), ("brewery_type", "in", ["micro", "nano"])].
+            Operadores: ==, !=, <, <=, >, >=, in, not in.
+        max_workers (int): Máximo de arquivos lidos simultaneamente.
+        use_snapshot (bool): Se True, usa o snapshot da versão atual, se existir.
+
     Returns:
         pd.DataFrame: DataFrame consolidado.
-        
+
     Raises:
         FileNotFoundError: Se nenhum arquivo Parquet for encontrado.
     """
-    parquet_files = glob.glob(
-        os.path.join(silver_dir, "brewery_type=*", "*.parquet")
-    )
+    wanted = list(dict.fromkeys(columns + [c for c, _, _ in filters or []])) if columns is not None else None
+    table = open_silver_snapshot(silver_dir, wanted) if use_snapshot else None
+    if table is not None:
+        if filters:
+            table = table.filter(pq.filters_to_expression(filters))
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        df = apply_categorical_schema(table.to_pandas())
+        logger.info(
+            f"Carregados {len(df)} registros do snapshot Silver (memory map"
+            + (f", colunas: {columns}" if columns is not None else "")
+            + (f", filtros: {filters}" if filters else "") + ")."
+        )
+        return df
+
+    parquet_files = list_silver_files(silver_dir)
     if not parquet_files:
         raise FileNotFoundError(f"Nenhum arquivo Parquet encontrado na camada Silver: {silver_dir}")
 
-    dfs = []
-    for fp in parquet_files:
-        df_part = pd.read_parquet(fp, engine="pyarrow")
-        # Recupera o valor da partição do nome da pasta se a coluna estiver ausente
-        if "brewery_type" not in df_part.columns:
-            btype = os.path.basename(os.path.dirname(fp)).split("=", 1)[-1]
-            df_part["brewery_type"] = btype
-        dfs.append(df_part)
-
-    df = pd.concat(dfs, ignore_index=True)
-    logger.info(f"Carregados {len(df)} registros de {len(parquet_files)} arquivo(s) Silver.")
+    # Poda por partição: filtros sobre 'brewery_type' descartam pastas inteiras
+    type_filters = [f for f in filters or [] if f[0] == "brewery_type"]
+    files = parquet_files
+    if type_filters:
+        btypes = [os.path.basename(os.path.dirname(fp)).split("=", 1)[-1] for fp in parquet_files]
+        keep = pa.table({"brewery_type": btypes}).append_column("index", pa.array(range(len(btypes))))
+        keep = keep.filter(pq.filters_to_expression(type_filters))["index"].to_pylist()
+        files = [parquet_files[i] for i in keep]
+    if not files:
+        files = parquet_files[:1]  # Mantém o esquema no resultado vazio
+
+    if len(files) < len(parquet_files):
+        logger.info(f"Poda por partição: {len(files)} de {len(parquet_files)} arquivo(s) Silver.")
+    return read_silver_files(files, columns, filters, max_workers)
+
+
+def read_silver_files(files: list, columns: list = None, filters: list = None,
+                      max_workers: int = SILVER_READ_WORKERS) -> pd.DataFrame:
+    """
+    Lê um conjunto de arquivos Silver em paralelo (ver '_read_silver_file') e
+    retorna um único DataFrame, com as colunas de baixa cardinalidade categóricas.
+
+    Args:
+        files (list): Caminhos dos arquivos Parquet (ao menos um).
+        columns (list, opcional): Colunas a carregar. Padrão: todas.
+        filters (list, opcional): Filtros em conjunção, como em 'load_silver'.
+        max_workers (int): Máximo de arquivos lidos simultaneamente.
+
+    Returns:
+        pd.DataFrame: DataFrame consolidado.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="gold") as executor:
+        results = list(executor.map(lambda fp: _read_silver_file(fp, columns, filters), files))
+    tables = [table for table, _ in results]
+
+    # Colunas de baixa cardinalidade chegam como dicionários (ver 'schema.py'); a
+    # tabela é convertida para pandas uma única vez, já com as categorias unificadas.
+    # Arquivos legados (texto) misturados a arquivos novos são lidos como texto.
+    try:
+        table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        table = pa.concat_tables([decode_dictionaries(t) for t in tables], promote_options="permissive")
+    df = apply_categorical_schema(table.to_pandas())
+    logger.info(
+        f"Carregados {len(df)} registros de {len(files)} arquivo(s) Silver "
+        f"({sum(b for _, b in results) / 2 ** 20:.2f} MB lidos"
+        + (f", colunas: {columns}" if columns is not None else "")
+        + (f", filtros: {filters}" if filters else "") + ")."
+    )
     return df
 
 
@@ -80,135 +236,533 @@ def load_silver(silver_dir: str = SILVER_DIR) -> pd.DataFrame:
 # Agregações
 # ---------------------------------------------------------------------------
 
-def agg_breweries_by_type_and_state(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Agregação 1 – Quantidade de cervejarias por tipo e estado.
+# Chaves do cubo base: todas as tabelas Gold agrupam por subconjuntos delas
+CUBE_KEYS = ["country", "state_province", "city", "brewery_type"]
+
+# Medidas aditivas do cubo base
+CUBE_MEASURES = ["rows", "id_count", "digitally_ready", "completeness_sum"]
+
+# Campos críticos do Data Trust Score
+TRUST_CRITICAL_COLUMNS = ["address_1", "phone", "website_url"]
+
+
+def build_base_cube(df: pd.DataFrame) -> pd.DataFrame:
     """
-    result = (
-        df.groupby(["brewery_type", "state_province"], dropna=False)
-        .agg(brewery_count=("id", "count"))
-        .reset_index()
-        .sort_values(["state_province", "brewery_count"], ascending=[True, False])
-    )
-    logger.info(f"[agg_by_type_and_state] Produzidas {len(result)} linhas.")
-    return result
+    Agrega a Silver, em uma única passada, no cubo base por
+    (country, state_province, city, brewery_type), com as medidas de que as
+    tabelas Gold precisam:
+
+    - rows: quantidade de registros;
+    - id_count: registros com 'id' não nulo;
+    - digitally_ready: registros com site e telefone;
+    - completeness_sum: soma, por registro, dos campos críticos preenchidos.
+
+    As tabelas Gold (ver 'GOLD_TABLE_SPECS') partem do cubo (poucos milhares
+    de linhas) em vez da Silver inteira; incluir uma nova tabela não acrescenta
+    passadas sobre os dados. Chaves nulas formam grupos próprios, como em 'dropna=False'.
 
+    A Silver não é alterada nem copiada: as medidas são arrays transitórios
+    (uma máscara por campo e contadores int8) e o agrupamento usa as próprias
+    colunas-chave do DataFrame, que pode ser compartilhado, somente leitura,
+    por execuções simultâneas.
 
-def agg_breweries_by_country_and_type(df: pd.DataFrame) -> pd.DataFrame:
+    Args:
+        df (pd.DataFrame): Silver (ao menos as colunas de 'GOLD_COLUMNS').
+
+    Returns:
+        pd.DataFrame: Cubo base, uma linha por combinação observada das chaves.
     """
-    Agregação 2 – Quantidade de cervejarias por país e tipo.
+    present = {col: df[col].notna().to_numpy() for col in ["id", *TRUST_CRITICAL_COLUMNS]}
+    completeness = np.zeros(len(df), dtype=np.int8)
+    for col in TRUST_CRITICAL_COLUMNS:
+        completeness += present[col]
+
+    measures = pd.DataFrame({
+        "id_count": present["id"],
+        "digitally_ready": present["website_url"] & present["phone"],
+        "completeness_sum": completeness,
+    }, index=df.index, copy=False)
+    grouped = measures.groupby([df[key] for key in CUBE_KEYS], dropna=False, observed=True)
+    cube = grouped.sum()
+    cube.insert(0, "rows", grouped.size())
+    cube = _normalize_cube(cube.reset_index())
+    logger.info(f"[base_cube] {len(df)} registros agregados em {len(cube)} células.")
+    return cube
+
+
+def _normalize_cube(cube: pd.DataFrame) -> pd.DataFrame:
     """
-    result = (
-        df.groupby(["country", "brewery_type"], dropna=False)
-        .agg(brewery_count=("id", "count"))
-        .reset_index()
-        .sort_values(["country", "brewery_count"], ascending=[True, False])
-    )
-    logger.info(f"[agg_by_country_and_type] Produzidas {len(result)} linhas.")
-    return result
+    Forma canônica do cubo: sem células vazias e com as categorias das chaves
+    restritas aos valores presentes (cubos iguais têm tipos iguais, qualquer
+    que seja a origem).
+    """
+    cube = cube[cube["rows"] != 0].reset_index(drop=True)
+    for key in CUBE_KEYS:
+        cube[key] = cube[key].cat.remove_unused_categories()
+    return cube
 
 
-def agg_top_cities(df: pd.DataFrame, top_n: int = 20) -> pd.DataFrame:
+def combine_cubes(cubes: list, signs: list = None) -> pd.DataFrame:
     """
-    Agregação 3 – Top N cidades por contagem total de cervejarias.
+    Soma cubos base célula a célula (as medidas são aditivas). Com 'signs',
+    cada cubo é somado (+1) ou subtraído (-1), o que permite retirar do estado
+    as linhas de arquivos Silver que deixaram de existir.
+
+    Returns:
+        pd.DataFrame: Cubo resultante, na forma canônica.
     """
-    result = (
-        df.groupby(["city", "state_province", "country"], dropna=False)
-        .agg(brewery_count=("id", "count"))
+    signs = signs or [1] * len(cubes)
+    parts = [
+        cube if sign > 0 else cube.assign(**{m: -cube[m] for m in CUBE_MEASURES})
+        for cube, sign in zip(cubes, signs)
+    ]
+    combined = (
+        concat_categorical(parts)
+        .groupby(CUBE_KEYS, dropna=False, observed=True)[CUBE_MEASURES]
+        .sum()
         .reset_index()
-        .sort_values("brewery_count", ascending=False)
-        .head(top_n)
     )
-    logger.info(f"[agg_top_cities] Top {top_n} cidades calculadas.")
-    return result
+    return _normalize_cube(combined)
 
 
-def agg_geo_coverage(df: pd.DataFrame) -> pd.DataFrame:
+# ---------------------------------------------------------------------------
+# Especificações das Tabelas Gold (OLAP declarativo sobre o cubo base)
+# ---------------------------------------------------------------------------
+
+# Cada tabela Gold é descrita por uma especificação, sem código próprio:
+#
+# - dimensions: chaves de agrupamento (subconjunto de 'CUBE_KEYS'), na ordem das colunas;
+# - dropna: se False (padrão), chaves nulas formam grupos próprios;
+# - filters: filtros de igualdade sobre as dimensões do cubo, {coluna: valor ou lista};
+# - measures: colunas calculadas, em ordem, de um dos tipos:
+#     {"sum": medida}                         soma de uma medida de 'CUBE_MEASURES';
+#     {"sum": medida, "where": {col: valor}}  soma apenas das células com col == valor;
+#     {"nunique": dimensão}                   valores distintos (não nulos) da dimensão;
+#     {"ratio": (num, den), "scale": 100, "divisor": k, "round": 2}
+#                                             num / k / den * scale, entre medidas anteriores;
+# - columns: colunas publicadas (padrão: dimensões e todas as medidas);
+# - sort: [(coluna, ascendente)]; top: primeiras N linhas após a ordenação.
+#
+# Incluir uma métrica é incluir uma especificação: 'compile_gold_plan' reúne as
+# dimensões pedidas em conjuntos de agrupamento (GROUPING SETS) calculados uma
+# única vez, cada um a partir do menor conjunto já calculado que o contém (ou
+# do cubo base), e todas as tabelas são servidas desses conjuntos.
+GOLD_TABLE_SPECS = {
+    "breweries_by_type_and_state": {
+        "dimensions": ["brewery_type", "state_province"],
+        "measures": {"brewery_count": {"sum": "id_count"}},
+        "sort": [("state_province", True), ("brewery_count", False)],
+    },
+    "breweries_by_country_and_type": {
+        "dimensions": ["country", "brewery_type"],
+        "measures": {"brewery_count": {"sum": "id_count"}},
+        "sort": [("country", True), ("brewery_count", False)],
+    },
+    "top_cities_by_brewery_count": {
+        "dimensions": ["city", "state_province", "country"],
+        "measures": {"brewery_count": {"sum": "id_count"}},
+        "sort": [("brewery_count", False)],
+        "top": 20,
+    },
+    "geo_coverage_by_state": {
+        "dimensions": ["country", "state_province", "city"],
+        "measures": {"brewery_count": {"sum": "id_count"}},
+        "sort": [("country", True), ("state_province", True), ("brewery_count", False)],
+    },
+    # Maturidade Digital: cervejarias com site e telefone por estado
+    "digital_maturity": {
+        "dimensions": ["state_province"],
+        "dropna": True,
+        "measures": {
+            "total_breweries": {"sum": "id_count"},
+            "digitally_ready_count": {"sum": "digitally_ready"},
+            "maturity_score": {"ratio": ("digitally_ready_count", "total_breweries"), "scale": 100, "round": 2},
+        },
+        "sort": [("maturity_score", False)],
+    },
+    # Diversidade Regional: tipos únicos de cervejaria por estado
+    "regional_diversity": {
+        "dimensions": ["state_province"],
+        "dropna": True,
+        "measures": {"unique_brewery_types": {"nunique": "brewery_type"}},
+        "sort": [("unique_brewery_types", False)],
+    },
+    # Especialização de Mercado: contagem total e 'micro' por estado
+    "market_specialization": {
+        "dimensions": ["state_province"],
+        "dropna": True,
+        "measures": {
+            "total_brewery_count": {"sum": "rows"},
+            "micro_brewery_count": {"sum": "rows", "where": {"brewery_type": "micro"}},
+        },
+        "sort": [("total_brewery_count", False)],
+    },
+    # Data Trust Score: completude dos campos críticos (Address, Phone, Website) por estado
+    "data_trust_score": {
+        "dimensions": ["state_province"],
+        "dropna": True,
+        "measures": {
+            "completeness_sum": {"sum": "completeness_sum"},
+            "rows": {"sum": "rows"},
+            "trust_score": {
+                "ratio": ("completeness_sum", "rows"),
+                "divisor": len(TRUST_CRITICAL_COLUMNS), "scale": 100, "round": 2,
+            },
+        },
+        "columns": ["state_province", "trust_score"],
+        "sort": [("trust_score", False)],
+    },
+}
+
+
+def _sum_column(measure: dict) -> str:
+    """Nome, nos conjuntos de agrupamento, da soma pedida por uma medida 'sum'."""
+    where = measure.get("where")
+    if not where:
+        return measure["sum"]
+    condition = ",".join(f"{col}={value}" for col, value in sorted(where.items()))
+    return f"{measure['sum']}[{condition}]"
+
+
+def _as_list(value) -> list:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def compile_gold_plan(specs: dict = None) -> dict:
     """
-    Agregação 4 – Quantidade de cervejarias por país, estado e cidade.
+    Compila especificações de tabelas Gold (ver 'GOLD_TABLE_SPECS') em um plano
+    de execução único sobre o cubo base.
+
+    O plano contém:
+
+    - sums: somas calculadas em todos os conjuntos de agrupamento (as medidas
+      do cubo e as somas condicionais pedidas, ex.: 'rows[brewery_type=micro]');
+    - grouping_sets: conjuntos (dimensões, filtros) distintos, do mais
+      detalhado ao mais agregado, cada um com a sua origem: o índice do menor
+      conjunto anterior que contém as suas dimensões, filtros e colunas de
+      'nunique' (um rollup), ou None para o cubo base;
+    - tables: para cada tabela, o índice do seu conjunto e a especificação.
+
+    Raises:
+        ValueError: Se alguma especificação usar dimensões, medidas ou
+            referências desconhecidas.
     """
-    result = (
-        df.groupby(["country", "state_province", "city"], dropna=False)
-        .agg(brewery_count=("id", "count"))
-        .reset_index()
-        .sort_values(["country", "state_province", "brewery_count"], ascending=[True, True, False])
-    )
-    logger.info(f"[agg_per_location] Produzidas {len(result)} linhas.")
+    specs = GOLD_TABLE_SPECS if specs is None else specs
+    sums = list(CUBE_MEASURES)
+    conditions = {}
+    sets = {}
+    tables = {}
+
+    for name, spec in specs.items():
+        dimensions = list(spec["dimensions"])
+        filters = {col: _as_list(value) for col, value in (spec.get("filters") or {}).items()}
+        unknown = [c for c in dimensions + list(filters) if c not in CUBE_KEYS]
+        if unknown or not dimensions:
+            raise ValueError(f"Tabela '{name}': dimensões inválidas {unknown or dimensions}. Use {CUBE_KEYS}.")
+
+        distinct = []
+        for measure_name, measure in spec["measures"].items():
+            previous = list(spec["measures"])[:list(spec["measures"]).index(measure_name)]
+            if "sum" in measure:
+                if measure["sum"] not in CUBE_MEASURES:
+                    raise ValueError(f"Tabela '{name}': medida desconhecida {measure['sum']}. Use {CUBE_MEASURES}.")
+                if any(col not in CUBE_KEYS for col in measure.get("where") or {}):
+                    raise ValueError(f"Tabela '{name}': condição inválida em '{measure_name}'.")
+                column = _sum_column(measure)
+                if column not in sums:
+                    sums.append(column)
+                    conditions[column] = (measure["sum"], measure["where"])
+            elif "nunique" in measure:
+                if measure["nunique"] not in CUBE_KEYS:
+                    raise ValueError(f"Tabela '{name}': dimensão desconhecida {measure['nunique']}.")
+                distinct.append(measure["nunique"])
+            elif "ratio" in measure:
+                if any(ref not in previous for ref in measure["ratio"]):
+                    raise ValueError(f"Tabela '{name}': '{measure_name}' usa medidas não definidas antes dela.")
+            else:
+                raise ValueError(f"Tabela '{name}': tipo de medida desconhecido em '{measure_name}'.")
+
+        key = (tuple(dimensions), tuple(sorted((col, tuple(values)) for col, values in filters.items())))
+        sets.setdefault(key, set()).update(distinct)
+        tables[name] = {"set": key, "spec": spec}
+
+    # Do mais detalhado ao mais agregado: cada conjunto parte do menor conjunto
+    # anterior (sem filtros) que contenha tudo de que ele precisa
+    ordered = sorted(sets, key=lambda k: (-len(k[0]), k[1] != (), k))
+    grouping_sets = []
+    for dimensions, filters in ordered:
+        needed = set(dimensions) | {col for col, _ in filters} | sets[(dimensions, filters)]
+        candidates = [
+            i for i, g in enumerate(grouping_sets) if not g["filters"] and needed <= set(g["dimensions"])
+        ]
+        source = min(candidates, key=lambda i: len(grouping_sets[i]["dimensions"])) if candidates else None
+        grouping_sets.append({
+            "dimensions": list(dimensions),
+            "filters": dict(filters),
+            "distinct": sorted(sets[(dimensions, filters)]),
+            "source": source,
+        })
+
+    index = {(tuple(g["dimensions"]), tuple(sorted(g["filters"].items()))): i for i, g in enumerate(grouping_sets)}
+    return {
+        "sums": sums,
+        "conditions": conditions,
+        "grouping_sets": grouping_sets,
+        "tables": {name: {"set": index[t["set"]], "spec": t["spec"]} for name, t in tables.items()},
+    }
+
+
+def _group(source: pd.DataFrame, grouping_set: dict, sums: list) -> pd.DataFrame:
+    """Agrega um conjunto de agrupamento a partir do cubo base ou de um conjunto mais detalhado."""
+    for col, values in grouping_set["filters"].items():
+        source = source[source[col].isin(values)]
+    grouped = source.groupby(grouping_set["dimensions"], dropna=False, observed=True)
+    result = grouped[sums].sum()
+    for col in grouping_set["distinct"]:
+        # Células vazias não existem no cubo (ver '_normalize_cube'), então os
+        # valores presentes em cada grupo são exatamente os observados na Silver
+        result[f"nunique[{col}]"] = grouped[col].nunique()
+    return result.reset_index()
+
+
+def _build_table(grouping_set: pd.DataFrame, spec: dict) -> pd.DataFrame:
+    """Monta uma tabela Gold a partir do seu conjunto de agrupamento."""
+    dimensions = list(spec["dimensions"])
+    df = grouping_set
+    if spec.get("dropna", False):
+        df = df.dropna(subset=dimensions).reset_index(drop=True)
+
+    result = df[dimensions].copy()
+    for name, measure in spec["measures"].items():
+        if "sum" in measure:
+            result[name] = df[_sum_column(measure)]
+        elif "nunique" in measure:
+            result[name] = df[f"nunique[{measure['nunique']}]"]
+        else:
+            numerator, denominator = (result[ref] for ref in measure["ratio"])
+            if measure.get("divisor"):
+                numerator = numerator / measure["divisor"]
+            value = numerator / denominator * measure.get("scale", 1)
+            result[name] = value.round(measure["round"]) if "round" in measure else value
+
+    result = result[spec.get("columns") or dimensions + list(spec["measures"])]
+    if spec.get("sort"):
+        result = result.sort_values(
+            [col for col, _ in spec["sort"]], ascending=[asc for _, asc in spec["sort"]]
+        )
+    if spec.get("top") is not None:
+        result = result.head(spec["top"])
     return result
 
 
-def agg_digital_maturity(df: pd.DataFrame) -> pd.DataFrame:
+def execute_gold_plan(plan: dict, cube: pd.DataFrame, max_workers: int = GOLD_AGG_WORKERS) -> dict:
     """
-    Agregação 5 – Maturidade Digital: Cervejarias com site e telefone por estado.
+    Executa um plano de 'compile_gold_plan' sobre um cubo base: calcula cada
+    conjunto de agrupamento uma única vez (a partir da sua origem) e monta as
+    tabelas (ver 'build_gold_tables'). O cubo não é alterado.
+
+    Returns:
+        dict: {nome da tabela: DataFrame}, na ordem das especificações.
+    """
+    sums = plan["sums"]
+    base = cube
+    if plan["conditions"]:
+        base = cube.assign(**{
+            column: cube[measure].where(
+                np.logical_and.reduce([cube[col] == value for col, value in where.items()]), 0
+            )
+            for column, (measure, where) in plan["conditions"].items()
+        })
+
+    computed = []
+    for grouping_set in plan["grouping_sets"]:
+        source = base if grouping_set["source"] is None else computed[grouping_set["source"]]
+        computed.append(_group(source, grouping_set, sums))
+    return build_gold_tables(plan, computed, max_workers)
+
+
+def build_gold_tables(plan: dict, computed: list, max_workers: int = GOLD_AGG_WORKERS) -> dict:
     """
-    df["has_website"] = df["website_url"].notnull()
-    df["has_phone"] = df["phone"].notnull()
-    df["digitally_ready"] = df["has_website"] & df["has_phone"]
+    Monta as tabelas de um plano a partir dos seus conjuntos de agrupamento já
+    calculados (um DataFrame por conjunto, na ordem de 'plan["grouping_sets"]'),
+    simultaneamente (até 'max_workers' por vez; 1 = sequencial).
 
-    result = (
-        df.groupby("state_province")
-        .agg(
-            total_breweries=("id", "count"),
-            digitally_ready_count=("digitally_ready", "sum")
-        )
-        .assign(maturity_score=lambda x: (x["digitally_ready_count"] / x["total_breweries"] * 100).round(2))
-        .reset_index()
-        .sort_values("maturity_score", ascending=False)
-    )
-    logger.info(f"[agg_digital_maturity] Calculada maturidade para {len(result)} estados.")
-    return result
+    Returns:
+        dict: {nome da tabela: DataFrame}, na ordem das especificações.
+    """
+    def build(name, table):
+        result = _build_table(computed[table["set"]], table["spec"])
+        logger.info(f"[{name}] Produzidas {len(result)} linhas.")
+        return result
+
+    if max_workers <= 1:
+        return {name: build(name, table) for name, table in plan["tables"].items()}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(build, name, table) for name, table in plan["tables"].items()}
+        return {name: future.result() for name, future in futures.items()}
 
 
-def agg_regional_diversity(df: pd.DataFrame) -> pd.DataFrame:
+def aggregate_cube(cube: pd.DataFrame, max_workers: int = GOLD_AGG_WORKERS, specs: dict = None) -> dict:
     """
-    Agregação 6 – Diversidade Regional: Quantidade de tipos únicos de cervejaria por estado.
+    Deriva de um cubo base todas as tabelas de 'specs' (padrão:
+    'GOLD_TABLE_SPECS'), com um único plano de execução.
     """
-    result = (
-        df.groupby("state_province")["brewery_type"]
-        .nunique()
-        .rename("unique_brewery_types")
-        .reset_index()
-        .sort_values("unique_brewery_types", ascending=False)
-    )
-    logger.info(f"[agg_regional_diversity] Calculada diversidade para {len(result)} estados.")
-    return result
+    return execute_gold_plan(compile_gold_plan(specs), cube, max_workers)
 
 
-def agg_market_specialization(df: pd.DataFrame) -> pd.DataFrame:
+def run_aggregations(df: pd.DataFrame, max_workers: int = GOLD_AGG_WORKERS, specs: dict = None) -> dict:
     """
-    Agregação 7 – Especialização de Mercado: Contagem total e 'micro' por estado.
+    Calcula todas as tabelas de 'specs' (padrão: 'GOLD_TABLE_SPECS') a partir
+    de um único cubo base (ver 'build_base_cube'), sem alterar 'df'.
+
+    Args:
+        df (pd.DataFrame): Silver (ao menos as colunas de 'GOLD_COLUMNS').
+        max_workers (int): Máximo de tabelas montadas simultaneamente.
+        specs (dict, opcional): Especificações das tabelas. Padrão: 'GOLD_TABLE_SPECS'.
+
+    Returns:
+        dict: {nome da tabela: DataFrame}.
     """
-    micro_counts = df[df["brewery_type"] == "micro"].groupby("state_province").size().rename("micro_brewery_count")
-    total_counts = df.groupby("state_province").size().rename("total_brewery_count")
+    return aggregate_cube(build_base_cube(df), max_workers, specs)
 
-    result = (
-        pd.concat([total_counts, micro_counts], axis=1)
-        .fillna(0)
-        .astype(int)
-        .reset_index()
-        .sort_values("total_brewery_count", ascending=False)
-    )
-    logger.info(f"[agg_market_specialization] Calculada especialização para {len(result)} estados.")
-    return result
+
+# ---------------------------------------------------------------------------
+# Estado Incremental (cubo base persistido)
+# ---------------------------------------------------------------------------
+
+def _cube_from_files(silver_dir: str, relpaths, max_workers: int = SILVER_READ_WORKERS):
+    """Cubo base de um conjunto de arquivos Silver (None se o conjunto for vazio)."""
+    if not relpaths:
+        return None
+    files = [os.path.join(silver_dir, p) for p in sorted(relpaths)]
+    return build_base_cube(read_silver_files(files, GOLD_COLUMNS, max_workers=max_workers))
 
 
-def agg_data_trust_score(df: pd.DataFrame) -> pd.DataFrame:
+def _pending_changes(state: dict, manifest: dict):
     """
-    Agregação 8 – Data Trust Score: Completude de campos críticos (Address, Phone, Website) por estado.
+    Registros de mudanças em nível de linha (ver 'silver.merge_silver') das
+    versões da Silver posteriores ao estado, ou None se alguma versão não os
+    tiver (ex.: reescrita completa) ou já tiver saído do histórico.
+
+    Returns:
+        tuple ou None: (arquivos com linhas inseridas, arquivos com linhas removidas).
     """
-    critical_cols = ["address_1", "phone", "website_url"]
-    df["completeness"] = df[critical_cols].notnull().sum(axis=1) / len(critical_cols)
-    
-    result = (
-        df.groupby("state_province")["completeness"]
-        .mean()
-        .rename("trust_score")
-        .reset_index()
-        .assign(trust_score=lambda x: (x["trust_score"] * 100).round(2))
-        .sort_values("trust_score", ascending=False)
+    if not state or not manifest or state.get("silver_version") is None:
+        return None
+    entries = [e for e in manifest.get("history", []) if e["version"] > state["silver_version"]]
+    if len(entries) != manifest["version"] - state["silver_version"]:
+        return None
+    if any(e.get("changes") is None for e in entries):
+        return None
+    inserted = [p for e in entries for p in e["changes"]["inserted"]]
+    removed = [e["changes"]["removed"] for e in entries if e["changes"]["removed"]]
+    return inserted, removed
+
+
+def update_gold_state(silver_dir: str = SILVER_DIR, gold_dir: str = GOLD_DIR,
+                      max_workers: int = SILVER_READ_WORKERS) -> pd.DataFrame:
+    """
+    Atualiza o cubo base persistido da Gold com as mudanças da Silver desde a
+    última execução e retorna o cubo atual. Como as medidas do cubo são aditivas,
+
+        cubo atual = cubo anterior + cubo(linhas inseridas) - cubo(linhas removidas)
+
+    (uma atualização é a remoção da versão anterior da linha mais a inserção da
+    nova). As linhas vêm, em ordem de preferência, de:
+
+    1. "changes": registros de mudanças dos merges da Silver (apenas as linhas
+       inseridas, atualizadas e removidas são lidas; compactações não custam nada);
+    2. "files": diferença entre os conjuntos de arquivos da versão do estado e da
+       atual (arquivos imutáveis; lê os arquivos novos e os retirados);
+    3. "full": recálculo a partir da Silver completa (primeira execução, reescrita
+       completa da Silver ou arquivos necessários já removidos pelo vacuum).
+
+    O estado ('GOLD_STATE_FILE') registra a versão e os arquivos da Silver
+    refletidos no cubo; ele é substituído atomicamente depois que o novo cubo
+    está gravado, então uma falha no meio do processo mantém o estado anterior.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        gold_dir (str): Caminho para o diretório da camada Gold.
+        max_workers (int): Máximo de arquivos Silver lidos simultaneamente.
+
+    Returns:
+        pd.DataFrame: Cubo base da versão atual da Silver.
+
+    Raises:
+        FileNotFoundError: Se nenhum arquivo Parquet for encontrado na Silver.
+    """
+    files = {os.path.relpath(f, silver_dir) for f in list_silver_files(silver_dir)}
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo Parquet encontrado na camada Silver: {silver_dir}")
+    manifest = read_silver_manifest(silver_dir)
+    silver_version = manifest["version"] if manifest else None
+
+    state_path = os.path.join(gold_dir, GOLD_STATE_FILE)
+    state = read_json(state_path)
+    previous = set(state["silver_files"]) if state else set()
+    if state and files == previous and state.get("silver_version") == silver_version:
+        logger.info(f"Estado Gold já reflete a Silver (versão {silver_version}).")
+        return pd.read_parquet(os.path.join(gold_dir, state["cube_file"]))
+
+    exists = lambda paths: all(os.path.exists(os.path.join(silver_dir, p)) for p in paths)
+    pending = _pending_changes(state, manifest)
+    if pending is not None and exists(pending[0] + pending[1]):
+        mode, (inserted, removed) = "changes", pending
+    elif state and len(previous - files) < len(previous) and exists(previous - files):
+        mode, inserted, removed = "files", files - previous, previous - files
+    else:
+        mode, inserted, removed = "full", files, []
+
+    parts = [(_cube_from_files(silver_dir, inserted, max_workers), 1),
+             (_cube_from_files(silver_dir, removed, max_workers), -1)]
+    if mode != "full":
+        parts.insert(0, (pd.read_parquet(os.path.join(gold_dir, state["cube_file"])), 1))
+    parts = [(c, sign) for c, sign in parts if c is not None]
+    cube = combine_cubes([c for c, _ in parts], [sign for _, sign in parts]) if len(parts) > 1 else parts[0][0]
+
+    # Novo cubo em arquivo próprio; o estado só passa a apontá-lo no final
+    sequence = state["sequence"] + 1 if state else 1
+    cube_file = os.path.join(os.path.dirname(GOLD_STATE_FILE), f"base_cube_{sequence:06d}.parquet")
+    with atomic_path(os.path.join(gold_dir, cube_file)) as tmp_path:
+        cube.to_parquet(tmp_path, index=False, engine="pyarrow")
+    atomic_write_json(state_path, {
+        "sequence": sequence,
+        "silver_version": silver_version,
+        "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": mode,
+        "cube_file": cube_file,
+        "cube_cells": len(cube),
+        "silver_rows": int(cube["rows"].sum()),
+        "silver_files": sorted(files),
+    })
+    if state and os.path.exists(os.path.join(gold_dir, state["cube_file"])):
+        os.remove(os.path.join(gold_dir, state["cube_file"]))
+
+    logger.info(
+        f"Estado Gold atualizado (modo {mode}, Silver versão {silver_version}): "
+        f"{len(inserted)} arquivo(s) somado(s), {len(removed)} subtraído(s); cubo com {len(cube)} células."
     )
-    logger.info(f"[agg_data_trust_score] Calculado trust score para {len(result)} estados.")
-    return result
+    return cube
+
+
+def check_gold_consistency(aggregations: dict, silver_dir: str = SILVER_DIR) -> None:
+    """
+    Modo de verificação: recalcula todas as tabelas a partir da Silver completa
+    e confirma que são idênticas às informadas (ex.: produzidas pelo estado incremental).
+
+    Raises:
+        ValueError: Se alguma tabela divergir do recálculo completo.
+    """
+    expected = run_aggregations(load_silver(silver_dir, columns=GOLD_COLUMNS))
+    mismatched = [
+        name for name, df in expected.items()
+        if name not in aggregations
+        or not df.reset_index(drop=True).equals(aggregations[name].reset_index(drop=True))
+    ]
+    if mismatched:
+        raise ValueError(f"Tabelas Gold divergentes do recálculo completo: {mismatched}")
+    logger.info(f"Verificação de consistência: {len(expected)} tabelas idênticas ao recálculo completo.")
 
 
 # ---------------------------------------------------------------------------
@@ -239,61 +793,163 @@ def run_gold_dq(aggregations: dict):
 # Escrita dos Dados
 # ---------------------------------------------------------------------------
 
-def save_gold(df: pd.DataFrame, name: str, gold_dir: str = GOLD_DIR) -> str:
+def save_gold(df: pd.DataFrame, name: str, gold_dir: str = GOLD_DIR,
+              write_csv: bool = WRITE_CSV_COPIES, version: str = None) -> str:
     """
-    Salva um DataFrame de agregação Gold nos formatos Parquet e CSV.
-    Salva uma versão com timestamp e uma versão 'latest' para cada formato.
+    Salva um DataFrame de agregação Gold em Parquet (e em CSV, se 'write_csv';
+    sob demanda, use 'export.py'), em uma versão com timestamp. Os arquivos são
+    gravados atomicamente, mas só passam a ser a versão atual ("latest") da
+    tabela quando publicados no manifesto (ver 'publish_gold').
     
     Args:
         df (pd.DataFrame): DataFrame de agregação.
         name (str): Nome da tabela/agregação.
         gold_dir (str): Caminho para o diretório da camada Gold.
+        write_csv (bool): Se True, grava também uma cópia CSV.
+        version (str, opcional): Identificador da versão no nome dos arquivos.
+            Padrão: timestamp atual (UTC, YYYYmmdd_HHMMSS).
         
     Returns:
         str: Caminho do arquivo Parquet com timestamp gerado.
     """
-    os.makedirs(gold_dir, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    version = version or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     
     # --- Parquet ---
     # Salva versão com timestamp
-    ts_parquet_path = os.path.join(gold_dir, f"{name}_{timestamp}.parquet")
-    df.to_parquet(ts_parquet_path, index=False, engine="pyarrow")
+    ts_parquet_path = os.path.join(gold_dir, f"{name}_{version}.parquet")
+    with atomic_path(ts_parquet_path) as tmp_path:
+        df.to_parquet(tmp_path, index=False, engine="pyarrow")
     
-    # --- CSV ---
+    # --- CSV (opcional) ---
     # Salva versão com timestamp
-    ts_csv_path = os.path.join(gold_dir, f"{name}_{timestamp}.csv")
-    df.to_csv(ts_csv_path, index=False)
-    
-    logger.info(f"Tabela Gold '{name}' salva (Parquet & CSV) com timestamp {timestamp}")
-    print(f"  OK {name}: {len(df)} linhas salvas (Parquet & CSV).")
+    if write_csv:
+        with atomic_path(os.path.join(gold_dir, f"{name}_{version}.csv")) as tmp_path:
+            df.to_csv(tmp_path, index=False)
+
+    formats = "Parquet & CSV" if write_csv else "Parquet"
+    logger.info(f"Tabela Gold '{name}' salva ({formats}) na versão {version}")
     return ts_parquet_path
 
 
+def publish_gold(aggregations: dict, gold_dir: str = GOLD_DIR, write_csv: bool = WRITE_CSV_COPIES,
+                 max_workers: int = GOLD_WRITE_WORKERS) -> dict:
+    """
+    Grava todas as tabelas Gold simultaneamente (até 'max_workers' por vez) e
+    publica o conjunto como a versão atual, substituindo o manifesto da Gold
+    ('GOLD_MANIFEST_FILE') atomicamente.
+
+    O manifesto aponta o arquivo atual de cada tabela: leitores resolvem a
+    versão "latest" com uma única leitura (ver 'storage.gold_table_path'), sem
+    listar o diretório, e nunca enxergam um conjunto parcial. Se alguma tabela
+    falhar, o erro é propagado depois que as demais terminam e o manifesto não
+    muda. Tabelas ausentes de 'aggregations' mantêm a versão anterior; os
+    arquivos de versões anteriores permanecem no disco como histórico (o nome
+    de cada arquivo leva o timestamp e o número da versão do manifesto, e uma
+    publicação nunca sobrescreve arquivos já publicados).
+
+    Args:
+        aggregations (dict): Tabelas Gold, {nome: DataFrame}.
+        gold_dir (str): Caminho para o diretório da camada Gold.
+        write_csv (bool): Se True, grava também uma cópia CSV de cada tabela.
+        max_workers (int): Máximo de tabelas gravadas simultaneamente (1 = sequencial).
+
+    Returns:
+        dict: Manifesto publicado.
+
+    Raises:
+        RuntimeError: Se outra publicação substituir o manifesto durante a escrita.
+    """
+    current = read_gold_manifest(gold_dir) or {"version": 0, "tables": {}}
+    # Sufixo aleatório: publicações simultâneas nunca gravam no mesmo arquivo
+    version = (
+        f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        f"_v{current['version'] + 1:06d}_{uuid.uuid4().hex[:6]}"
+    )
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="gold") as executor:
+        futures = {
+            name: executor.submit(save_gold, df, name, gold_dir, write_csv, version)
+            for name, df in aggregations.items()
+        }
+    paths = {name: future.result() for name, future in futures.items()}
+
+    formats = "Parquet & CSV" if write_csv else "Parquet"
+    for name, df in aggregations.items():
+        print(f"  OK {name}: {len(df)} linhas salvas ({formats}).")
+
+    # Outra publicação no meio do processo: publicar agora descartaria as tabelas dela
+    latest = read_gold_manifest(gold_dir) or {"version": 0}
+    if latest["version"] != current["version"]:
+        raise RuntimeError(
+            f"A Gold mudou durante a publicação (versão {current['version']} -> "
+            f"{latest['version']}). Execute a publicação novamente."
+        )
+    published_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    tables = dict(current["tables"])
+    for name, path in paths.items():
+        file_name = os.path.basename(path)
+        tables[name] = {
+            "parquet": file_name,
+            "csv": file_name.replace(".parquet", ".csv") if write_csv else None,
+            "rows": len(aggregations[name]),
+            "published_at": published_at,
+        }
+    manifest = {
+        "version": current["version"] + 1,
+        "updated_at": published_at,
+        "tables": dict(sorted(tables.items())),
+    }
+    atomic_write_json(os.path.join(gold_dir, GOLD_MANIFEST_FILE), manifest)
+    logger.info(f"Manifesto Gold publicado: versão {manifest['version']} ({len(paths)} tabela(s)).")
+    return manifest
 
 
 # ---------------------------------------------------------------------------
 # Lógica Principal (Orquestração local)
 # ---------------------------------------------------------------------------
 
-def process_gold():
-    """Lógica principal de processamento para a camada Gold."""
-    logger.info("=== Início da agregação Gold ===")
-    
-    # 1. Carrega todos os dados da Silver
-    silver_df = load_silver()
+GOLD_ENGINES = ("pandas", "duckdb")
+
+
+def process_gold(silver_dir: str = SILVER_DIR, gold_dir: str = GOLD_DIR,
+                 incremental: bool = GOLD_INCREMENTAL, check: bool = False,
+                 engine: str = GOLD_ENGINE) -> dict:
+    """
+    Lógica principal de processamento para a camada Gold.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        gold_dir (str): Caminho para o diretório da camada Gold.
+        incremental (bool): Se True, parte do cubo base persistido e aplica apenas
+            as mudanças da Silver (ver 'update_gold_state'); se False, recalcula
+            tudo a partir da Silver completa.
+        check (bool): Se True, confirma que as tabelas são idênticas às de um
+            recálculo completo (ver 'check_gold_consistency').
+        engine (str): "pandas" (cubo base) ou "duckdb" (SQL sobre os arquivos
+            Parquet da Silver, ver 'gold_duckdb.py'; sempre um recálculo completo).
+
+    Returns:
+        dict: Tabelas Gold produzidas, {nome: DataFrame}.
+
+    Raises:
+        ValueError: Se o motor não for suportado.
+    """
+    if engine not in GOLD_ENGINES:
+        raise ValueError(f"Motor Gold não suportado: {engine}. Use um de {list(GOLD_ENGINES)}.")
+    incremental = incremental and engine == "pandas"
+    logger.info(
+        f"=== Início da agregação Gold ({'incremental' if incremental else 'completa'}, motor {engine}) ==="
+    )
     
-    # 2. Executa as agregações
-    aggregations = {
-        "breweries_by_type_and_state": agg_breweries_by_type_and_state(silver_df),
-        "breweries_by_country_and_type": agg_breweries_by_country_and_type(silver_df),
-        "top_cities_by_brewery_count": agg_top_cities(silver_df, top_n=20),
-        "geo_coverage_by_state": agg_geo_coverage(silver_df),
-        "digital_maturity": agg_digital_maturity(silver_df),
-        "regional_diversity": agg_regional_diversity(silver_df),
-        "market_specialization": agg_market_specialization(silver_df),
-        "data_trust_score": agg_data_trust_score(silver_df),
-    }
+    # 1-2. Cubo base (uma passada sobre a Silver ou apenas sobre as mudanças) e agregações
+    if engine == "duckdb":
+        import gold_duckdb
+        aggregations = gold_duckdb.run_aggregations(silver_dir)
+    elif incremental:
+        aggregations = aggregate_cube(update_gold_state(silver_dir, gold_dir))
+    else:
+        aggregations = run_aggregations(load_silver(silver_dir, columns=GOLD_COLUMNS))
+    if check:
+        check_gold_consistency(aggregations, silver_dir)
 
     # 3. Verificações de Qualidade
     run_gold_dq(aggregations)
@@ -301,12 +957,12 @@ def process_gold():
     # 4. Atualiza Documentação e gera PDFs
     doc.run_documentation_pipeline(aggregations=aggregations)
 
-    # 5. Salva os resultados
+    # 5. Salva os resultados e publica a nova versão de cada tabela
     print(f"\nSalvando {len(aggregations)} tabelas Gold:")
-    for table_name, agg_df in aggregations.items():
-        save_gold(agg_df, table_name)
+    publish_gold(aggregations, gold_dir)
 
     logger.info("=== Agregação Gold finalizada com sucesso ===")
+    return aggregations
 
 
 # ---------------------------------------------------------------------------
@@ -314,9 +970,18 @@ def process_gold():
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Agregação da camada Gold.")
+    parser.add_argument("--full", action="store_true",
+                        help="Recalcula tudo a partir da Silver completa (ignora o estado incremental).")
+    parser.add_argument("--check", action="store_true",
+                        help="Confirma que as tabelas são idênticas às de um recálculo completo.")
+    parser.add_argument("--engine", choices=GOLD_ENGINES, default=GOLD_ENGINE,
+                        help="Motor das agregações (duckdb: SQL sobre os arquivos Parquet da Silver).")
+    args = parser.parse_args()
+
     try:
         print("Iniciando agregacao da camada Gold...")
-        process_gold()
+        process_gold(incremental=GOLD_INCREMENTAL and not args.full, check=args.check, engine=args.engine)
         print("\nCamada Gold completa!")
     except Exception as e:
         logger.error(f"Falha na agregacao Gold: {e}")
@@ -0,0 +1,198 @@
+"""
+gold_duckdb.py – Motor SQL (DuckDB) das agregações Gold.
+
+Alternativa ao caminho pandas de 'gold.py': o cubo base e os conjuntos de
+agrupamento do plano de 'gold.compile_gold_plan' são calculados em SQL por um
+motor colunar embutido (DuckDB, em processo e com várias threads), diretamente
+sobre os arquivos Parquet da versão atual da Silver. A Silver não é carregada
+no pandas: cada arquivo é lido uma única vez, apenas nas colunas usadas, e o
+cubo fica em uma tabela temporária do DuckDB, de onde todos os conjuntos
+saem com 'GROUPING SETS'.
+
+As tabelas são montadas pelo mesmo código do caminho pandas
+('gold.build_gold_tables'), a partir de conjuntos com as mesmas linhas, ordem,
+tipos e categorias; o resultado é idêntico ao de 'gold.run_aggregations' (e os
+arquivos publicados, byte a byte). Selecione com
+'gold.process_gold(engine="duckdb")'.
+
+Requer o pacote opcional 'duckdb' (pip install duckdb).
+"""
+
+import pandas as pd
+
+from config import SILVER_DIR, GOLD_AGG_WORKERS, GOLD_DUCKDB_THREADS
+from gold import (
+    logger, compile_gold_plan, build_gold_tables, CUBE_KEYS, TRUST_CRITICAL_COLUMNS,
+)
+from storage import list_silver_files
+
+try:
+    import duckdb
+except ImportError:  # Dependência opcional, necessária apenas para o motor "duckdb"
+    duckdb = None
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _not_null(column: str) -> str:
+    return f"CAST({_quote(column)} IS NOT NULL AS INTEGER)"
+
+
+# Expressão, por registro da Silver, de cada medida do cubo base (as mesmas
+# definições de 'gold.build_base_cube')
+MEASURE_EXPRESSIONS = {
+    "rows": "1",
+    "id_count": _not_null("id"),
+    "digitally_ready": f"CAST({_quote('website_url')} IS NOT NULL AND {_quote('phone')} IS NOT NULL AS INTEGER)",
+    "completeness_sum": " + ".join(_not_null(col) for col in TRUST_CRITICAL_COLUMNS),
+}
+
+
+# ---------------------------------------------------------------------------
+# Tradução do Plano para SQL
+# ---------------------------------------------------------------------------
+
+def build_cube_sql() -> str:
+    """Consulta do cubo base sobre a view 'silver': uma passada, agrupada por 'CUBE_KEYS'."""
+    keys = ", ".join(_quote(key) for key in CUBE_KEYS)
+    measures = ", ".join(
+        f"CAST(SUM({expression}) AS BIGINT) AS {_quote(measure)}"
+        for measure, expression in MEASURE_EXPRESSIONS.items()
+    )
+    return f"SELECT {keys}, {measures} FROM silver GROUP BY {keys}"
+
+
+def _grouping_mask(dimensions: list, keys: list) -> int:
+    """Valor de 'GROUPING(keys)' nas linhas do conjunto 'dimensions' (bit 1 = coluna agregada)."""
+    return sum(1 << (len(keys) - 1 - i) for i, key in enumerate(keys) if key not in dimensions)
+
+
+def build_queries(plan: dict) -> list:
+    """
+    Traduz um plano de 'gold.compile_gold_plan' em consultas SQL sobre a
+    tabela 'cube' (ver 'build_cube_sql'): uma por combinação de filtros, cada
+    uma com todos os seus conjuntos em 'GROUPING SETS'. As linhas de cada
+    conjunto são identificadas pelo valor de 'GROUPING(...)' (coluna '_grouping').
+
+    Returns:
+        list: [{"sql", "params", "sets": {índice do conjunto: valor de '_grouping'}}].
+    """
+    groups = {}
+    for index, grouping_set in enumerate(plan["grouping_sets"]):
+        filters = tuple(sorted((col, tuple(values)) for col, values in grouping_set["filters"].items()))
+        groups.setdefault(filters, []).append(index)
+
+    queries = []
+    for filters, indices in groups.items():
+        sets = [plan["grouping_sets"][i] for i in indices]
+        keys = [key for key in CUBE_KEYS if any(key in g["dimensions"] for g in sets)]
+        distinct = [key for key in CUBE_KEYS if any(key in g["distinct"] for g in sets)]
+
+        params = []
+        select = [_quote(key) for key in keys]
+        select.append(f"GROUPING({', '.join(select)}) AS _grouping")
+        for column in plan["sums"]:
+            if column in plan["conditions"]:
+                measure, where = plan["conditions"][column]
+                condition = " AND ".join(f"{_quote(col)} = ?" for col in where)
+                params.extend(where.values())
+                expression = f"COALESCE(SUM({_quote(measure)}) FILTER (WHERE {condition}), 0)"
+            else:
+                expression = f"SUM({_quote(column)})"
+            select.append(f"CAST({expression} AS BIGINT) AS {_quote(column)}")
+        # No cubo só existem combinações observadas: os valores distintos de cada
+        # grupo são os mesmos da Silver
+        select.extend(f"COUNT(DISTINCT {_quote(col)}) AS {_quote(f'nunique[{col}]')}" for col in distinct)
+
+        where_sql = ""
+        if filters:
+            where_sql = " WHERE " + " AND ".join(
+                f"{_quote(col)} IN ({', '.join('?' for _ in values)})" for col, values in filters
+            )
+            params.extend(value for _, values in filters for value in values)
+
+        # Conjuntos com as mesmas chaves em outra ordem são agrupados uma única vez
+        grouping_sets = sorted(
+            {tuple(key for key in keys if key in g["dimensions"]) for g in sets}, key=lambda dims: (-len(dims), dims)
+        )
+        group_by = ", ".join(f"({', '.join(_quote(key) for key in dims)})" for dims in grouping_sets)
+        queries.append({
+            "sql": f"SELECT {', '.join(select)} FROM cube{where_sql} GROUP BY GROUPING SETS ({group_by})",
+            "params": params,
+            "sets": {i: _grouping_mask(g["dimensions"], keys) for i, g in zip(indices, sets)},
+        })
+    return queries
+
+
+def _grouping_set_frame(rows: pd.DataFrame, grouping_set: dict, sums: list, categories: dict) -> pd.DataFrame:
+    """
+    Conjunto de agrupamento na forma de 'gold._group': chaves categóricas (com
+    as categorias do cubo base), ordenado pelas chaves com nulos por último.
+    """
+    dimensions = grouping_set["dimensions"]
+    frame = rows[dimensions + sums + [f"nunique[{col}]" for col in grouping_set["distinct"]]]
+    frame = frame.assign(**{
+        key: pd.Categorical(frame[key], dtype=pd.CategoricalDtype(categories[key])) for key in dimensions
+    })
+    return frame.sort_values(dimensions, na_position="last").reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------------------
+
+def run_aggregations(silver_dir: str = SILVER_DIR, specs: dict = None,
+                     threads: int = GOLD_DUCKDB_THREADS, max_workers: int = GOLD_AGG_WORKERS) -> dict:
+    """
+    Calcula as tabelas de 'specs' (padrão: 'GOLD_TABLE_SPECS') em SQL sobre os
+    arquivos Parquet da versão atual da Silver.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        specs (dict, opcional): Especificações das tabelas. Padrão: 'GOLD_TABLE_SPECS'.
+        threads (int): Threads do DuckDB na leitura e na agregação.
+        max_workers (int): Máximo de tabelas montadas simultaneamente a partir dos conjuntos.
+
+    Returns:
+        dict: {nome da tabela: DataFrame}, idênticos aos de 'gold.run_aggregations'.
+
+    Raises:
+        ImportError: Se o pacote 'duckdb' não estiver instalado.
+        FileNotFoundError: Se nenhum arquivo Parquet for encontrado.
+    """
+    if duckdb is None:
+        raise ImportError("O motor Gold 'duckdb' requer o pacote 'duckdb' (pip install duckdb).")
+    files = list_silver_files(silver_dir)
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo Parquet encontrado na camada Silver: {silver_dir}")
+
+    plan = compile_gold_plan(specs)
+    computed = [None] * len(plan["grouping_sets"])
+    with duckdb.connect(config={"threads": max(1, int(threads))}) as con:
+        # 'brewery_type' também vem do nome da pasta, para arquivos legados sem a coluna
+        con.read_parquet(files, hive_partitioning=True, union_by_name=True).create_view("silver")
+        con.execute(f"CREATE TEMP TABLE cube AS {build_cube_sql()}")
+        cells = con.execute("SELECT COUNT(*) FROM cube").fetchone()[0]
+
+        # Categorias das chaves: os valores presentes no cubo, em ordem crescente (ver 'gold._normalize_cube')
+        categories = {
+            key: pd.Index(
+                [row[0] for row in con.execute(f"SELECT DISTINCT {_quote(key)} FROM cube").fetchall()
+                 if row[0] is not None]
+            ).sort_values()
+            for key in CUBE_KEYS
+        }
+        for query in build_queries(plan):
+            rows = con.execute(query["sql"], query["params"]).df()
+            for index, mask in query["sets"].items():
+                computed[index] = _grouping_set_frame(
+                    rows[rows["_grouping"] == mask], plan["grouping_sets"][index], plan["sums"], categories
+                )
+
+    logger.info(
+        f"[duckdb] Cubo base com {cells} células e {len(plan['grouping_sets'])} conjunto(s) de "
+        f"agrupamento calculados sobre {len(files)} arquivo(s) Silver."
+    )
+    return build_gold_tables(plan, computed, max_workers)
@@ -0,0 +1,334 @@
+"""
+gold_service.py – Serviço local de consulta das tabelas da camada Gold.
+
+Atende dashboards e outros consumidores a partir de um cache em memória das
+versões atuais das tabelas Gold (as apontadas pelo manifesto publicado por
+'gold.publish_gold'), em vez de reler arquivos a cada requisição. Cada consulta
+custa uma verificação do manifesto ('os.stat'); as tabelas só são relidas
+(com memory map) quando o manifesto aponta um arquivo novo, e os resultados
+filtrados ficam em um cache LRU.
+
+Uso em processo:
+    store = GoldStore()
+    store.query("top_cities_by_brewery_count", state="Texas", top=5)
+
+Uso via HTTP:
+    python gold_service.py --port 8766
+    GET /tables                                          # tabelas e versão do manifesto
+    GET /tables/geo_coverage_by_state?country=Ireland&top=10
+"""
+
+import os
+import re
+import glob
+import json
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
+
+import pyarrow.parquet as pq
+
+from config import GOLD_DIR, GOLD_MANIFEST_FILE
+from storage import read_gold_manifest
+
+logger = logging.getLogger(__name__)
+
+# Filtros aceitos e a coluna das tabelas Gold a que cada um se aplica
+FILTER_COLUMNS = {
+    "state": "state_province",
+    "country": "country",
+    "city": "city",
+    "brewery_type": "brewery_type",
+}
+
+# Arquivo de uma versão Gold sem manifesto (layout legado): <tabela>_<YYYYmmdd_HHMMSS>.parquet
+LEGACY_FILE_PATTERN = re.compile(r"^(?P<table>.+)_\d{8}_\d{6}\.parquet$")
+
+
+# ---------------------------------------------------------------------------
+# Cache das Tabelas
+# ---------------------------------------------------------------------------
+
+class GoldStore:
+    """
+    Cache em memória das versões atuais das tabelas Gold, seguro entre threads.
+
+    A cada acesso, o manifesto da Gold é verificado por 'os.stat' (tamanho,
+    mtime e inode mudam quando ele é substituído); só então ele é relido e
+    apenas as tabelas que passaram a apontar outro arquivo são descartadas do
+    cache. Sem manifesto (layout legado), vale a versão com o maior timestamp
+    de cada tabela, e a verificação usa o mtime do diretório.
+
+    Args:
+        gold_dir (str): Caminho para o diretório da camada Gold.
+        cache_size (int): Máximo de resultados de consultas mantidos no cache LRU.
+    """
+
+    CACHE_SIZE = 256
+
+    def __init__(self, gold_dir: str = GOLD_DIR, cache_size: int = CACHE_SIZE):
+        self.gold_dir = gold_dir
+        self.cache_size = cache_size
+        self.version = None
+        self._signature = None
+        self._paths = {}
+        self._tables = {}
+        self._results = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {"reloads": 0, "table_loads": 0, "hits": 0, "misses": 0}
+
+    def _current_signature(self):
+        manifest_path = os.path.join(self.gold_dir, GOLD_MANIFEST_FILE)
+        for path in (manifest_path, self.gold_dir):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            return path, st.st_ino, st.st_size, st.st_mtime_ns
+        return None
+
+    def refresh(self) -> bool:
+        """
+        Atualiza a lista de versões atuais se o manifesto mudou.
+
+        Returns:
+            bool: True se o manifesto (ou o diretório legado) mudou desde a última verificação.
+        """
+        signature = self._current_signature()
+        with self._lock:
+            if signature == self._signature:
+                return False
+            manifest = read_gold_manifest(self.gold_dir)
+            if manifest is not None:
+                self.version = manifest["version"]
+                paths = {
+                    name: os.path.join(self.gold_dir, entry["parquet"])
+                    for name, entry in manifest["tables"].items()
+                }
+            else:
+                self.version = None
+                paths = {}
+                for path in sorted(glob.glob(os.path.join(self.gold_dir, "*.parquet"))):
+                    match = LEGACY_FILE_PATTERN.match(os.path.basename(path))
+                    if match:
+                        paths[match["table"]] = path
+
+            # Descarta apenas as tabelas (e os resultados) cujo arquivo mudou
+            self._tables = {n: df for n, df in self._tables.items() if paths.get(n) == self._paths.get(n)}
+            self._results = OrderedDict(
+                (key, value) for key, value in self._results.items() if key[0] in self._tables
+            )
+            self._paths = paths
+            self._signature = signature
+            self.stats["reloads"] += 1
+            logger.info(f"Gold recarregada (versão {self.version}): {len(paths)} tabela(s).")
+            return True
+
+    def tables(self) -> dict:
+        """
+        Tabelas disponíveis e o arquivo atual de cada uma.
+
+        Returns:
+            dict: {nome da tabela: nome do arquivo Parquet}.
+        """
+        self.refresh()
+        with self._lock:
+            return {name: os.path.basename(path) for name, path in sorted(self._paths.items())}
+
+    def table(self, name: str):
+        """
+        Versão atual de uma tabela Gold, lida do disco só na primeira consulta
+        após cada publicação.
+
+        Returns:
+            pd.DataFrame: Tabela (cópia rasa; alterações não afetam o cache).
+
+        Raises:
+            KeyError: Se a tabela não existir na Gold.
+        """
+        self.refresh()
+        with self._lock:
+            return self._load(name).copy(deep=False)
+
+    def _load(self, name: str):
+        if name not in self._paths:
+            raise KeyError(name)
+        if name not in self._tables:
+            self._tables[name] = pq.read_table(self._paths[name], memory_map=True).to_pandas()
+            self.stats["table_loads"] += 1
+        return self._tables[name]
+
+    def query(self, name: str, top: int = None, **filters):
+        """
+        Consulta uma tabela Gold com filtros de igualdade e um limite opcional.
+
+        Args:
+            name (str): Nome da tabela (ex.: 'geo_coverage_by_state').
+            top (int, opcional): Primeiras N linhas, na ordem da tabela (as
+                tabelas Gold já são ordenadas pela métrica principal).
+            **filters: Filtros de 'FILTER_COLUMNS' (ex.: state="Texas"); uma
+                lista de valores aceita qualquer um deles.
+
+        Returns:
+            pd.DataFrame: Linhas selecionadas (cópia rasa do resultado em cache).
+
+        Raises:
+            KeyError: Se a tabela não existir na Gold.
+            ValueError: Se um filtro for desconhecido ou não se aplicar à tabela,
+                ou se 'top' for negativo.
+        """
+        if top is not None and top < 0:
+            raise ValueError(f"'top' deve ser maior ou igual a zero: {top}")
+        criteria = tuple(sorted(
+            (key, tuple(sorted(value)) if isinstance(value, (list, tuple, set)) else (value,))
+            for key, value in filters.items() if value is not None
+        ))
+
+        self.refresh()
+        with self._lock:
+            key = (name, criteria, top)
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._results[key].copy(deep=False)
+
+            df = self._load(name)
+            self.stats["misses"] += 1
+            mask = None
+            for filter_name, values in criteria:
+                column = FILTER_COLUMNS.get(filter_name)
+                if column is None:
+                    raise ValueError(f"Filtro desconhecido: {filter_name}. Use um de {list(FILTER_COLUMNS)}.")
+                if column not in df.columns:
+                    raise ValueError(f"A tabela '{name}' não possui a coluna '{column}' (filtro '{filter_name}').")
+                selected = df[column].isin(values)
+                mask = selected if mask is None else mask & selected
+            result = df[mask] if mask is not None else df
+            if top is not None:
+                result = result.head(top)
+            result = result.reset_index(drop=True)
+
+            self._results[key] = result
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+            return result.copy(deep=False)
+
+
+# ---------------------------------------------------------------------------
+# Servidor HTTP
+# ---------------------------------------------------------------------------
+
+class GoldServer(ThreadingHTTPServer):
+    """
+    Servidor HTTP somente leitura sobre um 'GoldStore'.
+
+    Args:
+        address (tuple): (host, porta). Porta 0 escolhe uma porta livre.
+        store (GoldStore): Cache das tabelas servidas.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, store: GoldStore):
+        super().__init__(address, GoldHandler)
+        self.store = store
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/tables"
+
+
+class GoldHandler(BaseHTTPRequestHandler):
+    """
+    Trata 'GET /tables' (lista) e 'GET /tables/<nome>' (linhas da tabela, com os
+    filtros de 'FILTER_COLUMNS' e 'top' na query string).
+    """
+
+    protocol_version = "HTTP/1.1"  # Mantém conexões keep-alive
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = [unquote(p) for p in parsed.path.strip("/").split("/")]
+        if parts[0] != "tables" or len(parts) > 2:
+            self._send_json(404, {"message": "Not Found"})
+            return
+
+        store = self.server.store
+        if len(parts) == 1:
+            tables = store.tables()
+            self._send_json(200, {"version": store.version, "tables": tables})
+            return
+
+        query = parse_qs(parsed.query)
+        try:
+            top = query.pop("top", [None])[0]
+            if top is not None and not top.isdigit():
+                raise ValueError(f"'top' deve ser um inteiro não negativo: {top}")
+            df = store.query(parts[1], top=int(top) if top is not None else None, **query)
+        except KeyError:
+            self._send_json(404, {"message": f"Tabela Gold não encontrada: {parts[1]}"})
+            return
+        except ValueError as e:
+            self._send_json(400, {"message": str(e)})
+            return
+        self._send_body(200, df.to_json(orient="records", force_ascii=False).encode("utf-8"))
+
+    def _send_json(self, status, payload):
+        self._send_body(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def _send_body(self, status, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+@contextmanager
+def run_gold_server(store: GoldStore = None, host="127.0.0.1", port=0):
+    """
+    Inicia o servidor em uma thread em segundo plano durante o bloco 'with'.
+
+    Yields:
+        GoldServer: Servidor em execução ('server.url' aponta para '/tables').
+    """
+    server = GoldServer((host, port), store or GoldStore())
+    thread = threading.Thread(target=server.serve_forever, name="gold-service", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço local de consulta das tabelas Gold.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--gold-dir", default=GOLD_DIR)
+    parser.add_argument("--cache-size", type=int, default=GoldStore.CACHE_SIZE,
+                        help="Máximo de resultados de consultas mantidos em cache.")
+    args = parser.parse_args()
+
+    server = GoldServer((args.host, args.port), GoldStore(args.gold_dir, args.cache_size))
+    print(f"Tabelas Gold de {args.gold_dir} em {server.url} (Ctrl+C para encerrar)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
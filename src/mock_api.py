@@ -0,0 +1,350 @@
+"""
+mock_api.py – Servidor local que simula a API Open Brewery DB.
+
+Atende o mesmo contrato de paginação da API real ('GET /v1/breweries?page=&per_page=')
+a partir de um arquivo de fixture (CSV, JSON ou NDJSON da camada Bronze) ou de um
+conjunto sintético realista gerado sob demanda (ver 'synthetic.py'), o que permite
+simular milhões de registros sem mantê-los em memória. Também injeta latência e
+erros (429 com 'Retry-After' e 5xx) para exercitar e medir a ingestão da camada
+Bronze sem acesso à rede.
+
+Uso:
+    python mock_api.py --records 100000 --latency 0.05 --error-rate 0.02
+    python mock_api.py --fixture ../data/bronze/ingestion_date=2026-02-22/breweries_raw_182935.csv
+    python mock_api.py --bench --records 50000 --throttle-rate 0.05
+"""
+
+import csv
+import json
+import time
+import random
+import functools
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import synthetic
+from storage import iter_ndjson, NDJSON_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+# Limite de registros por página imposto pela API real
+MAX_PER_PAGE = 200
+
+API_PATHS = {"/v1/breweries", "/breweries"}
+
+
+# ---------------------------------------------------------------------------
+# Conjuntos de Dados
+# ---------------------------------------------------------------------------
+
+class FixtureDataset:
+    """
+    Conjunto de dados carregado de um arquivo da camada Bronze (CSV, JSON ou NDJSON).
+    """
+
+    def __init__(self, path: str):
+        self.records = list(_read_fixture(path))
+
+    def __len__(self):
+        return len(self.records)
+
+    def slice(self, start: int, stop: int) -> list:
+        return self.records[start:stop]
+
+
+class SyntheticDataset:
+    """
+    Conjunto de dados sintético e determinístico (ver 'synthetic.py'): os registros
+    são gerados em blocos sob demanda, então páginas arbitrárias são servidas sem
+    materializar o conjunto inteiro.
+
+    Args:
+        size (int): Quantidade total de registros.
+        seed (int): Semente para geração reprodutível.
+        profile (dict, opcional): Perfil de distribuições. Padrão: snapshot Bronze mais recente.
+    """
+
+    BLOCK_SIZE = 1_000
+
+    def __init__(self, size: int, seed: int = 42, profile: dict = None):
+        self.size = size
+        self.seed = seed
+        self.profile = profile or synthetic.build_profile()
+        self._block = functools.lru_cache(maxsize=64)(self._generate_block)
+
+    def __len__(self):
+        return self.size
+
+    def _generate_block(self, block_index: int) -> list:
+        size = min(self.BLOCK_SIZE, self.size - block_index * self.BLOCK_SIZE)
+        block = synthetic.generate_block(block_index, size, self.profile, self.seed)
+        return synthetic.block_records(block)
+
+    def slice(self, start: int, stop: int) -> list:
+        stop = min(stop, self.size)
+        records = []
+        for block_index in range(start // self.BLOCK_SIZE, (stop - 1) // self.BLOCK_SIZE + 1):
+            offset = block_index * self.BLOCK_SIZE
+            block = self._block(block_index)
+            records.extend(block[max(0, start - offset):stop - offset])
+        return records
+
+
+def _read_fixture(path: str):
+    """Lê os registros de um arquivo de fixture de acordo com a extensão."""
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                record = {key: (value if value != "" else None) for key, value in row.items()}
+                for coord in ("longitude", "latitude"):
+                    if record.get(coord) is not None:
+                        record[coord] = float(record[coord])
+                yield record
+    elif path.endswith(NDJSON_EXTENSIONS):
+        yield from iter_ndjson(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f)
+
+
+# ---------------------------------------------------------------------------
+# Servidor HTTP
+# ---------------------------------------------------------------------------
+
+class MockBreweryServer(ThreadingHTTPServer):
+    """
+    Servidor HTTP que simula a API, com injeção de latência e erros.
+
+    Args:
+        address (tuple): (host, porta). Porta 0 escolhe uma porta livre.
+        dataset: FixtureDataset ou SyntheticDataset.
+        latency (float): Latência base por requisição, em segundos.
+        jitter (float): Variação aleatória somada à latência, em segundos.
+        error_rate (float): Probabilidade (0–1) de responder 500/502/503.
+        throttle_rate (float): Probabilidade (0–1) de responder 429.
+        retry_after (float): Valor do cabeçalho 'Retry-After' nas respostas 429.
+        seed (int, opcional): Semente para a injeção de erros e latência.
+        fail_pages (iterable, opcional): Páginas que sempre respondem 503, sem
+            latência (simula uma falha persistente no meio da paginação; altere
+            'server.fail_pages' para "recuperar" a API).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, dataset, latency=0.0, jitter=0.0, error_rate=0.0,
+                 throttle_rate=0.0, retry_after=1.0, seed=None, fail_pages=()):
+        super().__init__(address, MockBreweryHandler)
+        self.dataset = dataset
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.fail_pages = set(fail_pages)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "ok": 0, "throttled": 0, "errors": 0, "records_served": 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1/breweries"
+
+    def _draw(self):
+        """Sorteia (latência, falha injetada) de forma segura entre threads."""
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, self._rng.choice([500, 502, 503])
+        return delay, None
+
+    def _count(self, key, records=0):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[key] += 1
+            self.stats["records_served"] += records
+
+
+class MockBreweryHandler(BaseHTTPRequestHandler):
+    """Trata 'GET /v1/breweries' com o contrato 'page'/'per_page' da API real."""
+
+    protocol_version = "HTTP/1.1"  # Mantém conexões keep-alive
+    # Cabeçalhos e corpo saem em escritas separadas; sem TCP_NODELAY, o atraso
+    # de ACK do cliente soma ~40 ms a cada resposta em conexões keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip("/") not in API_PATHS:
+            self._send_json(404, {"message": "Not Found"})
+            return
+
+        query = parse_qs(parsed.query)
+        try:
+            page = max(1, int(query.get("page", ["1"])[0]))
+            per_page = min(MAX_PER_PAGE, max(1, int(query.get("per_page", ["50"])[0])))
+        except ValueError:
+            self._send_json(400, {"message": "Parâmetros 'page' e 'per_page' devem ser inteiros."})
+            return
+
+        if page in self.server.fail_pages:
+            self.server._count("errors")
+            self._send_json(503, {"message": "Injected failure"})
+            return
+
+        delay, failure = self.server._draw()
+        if delay > 0:
+            time.sleep(delay)
+
+        if failure == 429:
+            self.server._count("throttled")
+            self._send_json(429, {"message": "Too Many Requests"},
+                            {"Retry-After": f"{self.server.retry_after:g}"})
+            return
+        if failure is not None:
+            self.server._count("errors")
+            self._send_json(failure, {"message": "Injected failure"})
+            return
+
+        start = (page - 1) * per_page
+        records = self.server.dataset.slice(start, start + per_page)
+        self.server._count("ok", len(records))
+        self._send_json(200, records)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+@contextmanager
+def run_mock_server(dataset, host="127.0.0.1", port=0, **options):
+    """
+    Inicia o servidor em uma thread em segundo plano durante o bloco 'with'.
+
+    Exemplo:
+        with run_mock_server(SyntheticDataset(10_000), latency=0.01) as server:
+            data = bronze.fetch_data(server.url)
+
+    Yields:
+        MockBreweryServer: Servidor em execução ('server.url' aponta para a API simulada).
+    """
+    server = MockBreweryServer((host, port), dataset, **options)
+    thread = threading.Thread(target=server.serve_forever, name="mock-api", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+# ---------------------------------------------------------------------------
+# Benchmark de Ingestão
+# ---------------------------------------------------------------------------
+
+def benchmark_ingestion(dataset, modes=("sequential", "threads", "async"), **options) -> list:
+    """
+    Mede a vazão da ingestão Bronze contra o servidor simulado.
+
+    Args:
+        dataset: Conjunto de dados servido.
+        modes (tuple): Modos medidos: 'sequential' (1 requisição por vez),
+            'threads' (fetch_data concorrente) e 'async' (fetch_data_async).
+        **options: Opções repassadas ao servidor (latência, erros, etc.).
+
+    Returns:
+        list: Um dicionário por modo com tempo, registros/s e estatísticas do servidor.
+    """
+    import asyncio
+    import bronze
+
+    results = []
+    for mode in modes:
+        with run_mock_server(dataset, **options) as server:
+            start = time.perf_counter()
+            if mode == "sequential":
+                data = bronze.fetch_data(server.url, max_workers=1, rate_limit=None)
+            elif mode == "threads":
+                data = bronze.fetch_data(server.url, rate_limit=None)
+            elif mode == "async":
+                data = asyncio.run(bronze.fetch_data_async(server.url, rate_limit=None))
+            else:
+                raise ValueError(f"Modo de benchmark desconhecido: {mode}")
+            elapsed = time.perf_counter() - start
+
+            results.append({
+                "mode": mode,
+                "records": len(data),
+                "seconds": round(elapsed, 3),
+                "records_per_second": round(len(data) / elapsed, 1) if elapsed else None,
+                "server": dict(server.stats),
+            })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+def build_dataset(args):
+    """Cria o conjunto de dados a partir dos argumentos de linha de comando."""
+    if args.fixture:
+        return FixtureDataset(args.fixture)
+    return SyntheticDataset(args.records, seed=args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local que simula a API Open Brewery DB.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixture", help="Arquivo CSV/JSON/NDJSON usado como conjunto de dados.")
+    parser.add_argument("--records", type=int, default=10_000,
+                        help="Quantidade de registros sintéticos (ignorado com --fixture).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência base, em segundos.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Variação de latência, em segundos.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidade de 5xx (0–1).")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Probabilidade de 429 (0–1).")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="'Retry-After' das respostas 429.")
+    parser.add_argument("--bench", action="store_true",
+                        help="Mede a vazão da ingestão Bronze contra o servidor e imprime JSON.")
+    args = parser.parse_args()
+
+    dataset = build_dataset(args)
+    options = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+
+    if args.bench:
+        print(json.dumps(benchmark_ingestion(dataset, **options), indent=2))
+    else:
+        server = MockBreweryServer((args.host, args.port), dataset, **options)
+        print(f"API simulada com {len(dataset)} registros em {server.url} (Ctrl+C para encerrar)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -50,15 +50,12 @@ def run_pipeline():
     try:
         # 1. Camada Bronze
         print("Passo 1: Camada Bronze (Ingestao)")
-        data = bronze.fetch_data(bronze.API_URL)
-        bronze.save_raw_data(data)
+        bronze.ingest(bronze.API_URL)
         logger.info("Camada Bronze concluida com sucesso.")
 
         # 2. Camada Silver
         print("\nPasso 2: Camada Silver (Transformacao)")
-        raw_df = silver.load_latest_bronze()
-        clean_df = silver.transform(raw_df)
-        silver.save_silver(clean_df)
+        silver.process_silver()
         logger.info("Camada Silver concluida com sucesso.")
 
         # 3. Camada Gold
@@ -0,0 +1,159 @@
+"""
+schema.py – Esquema da camada Silver compartilhado pelas camadas Silver e Gold.
+
+Colunas de baixa cardinalidade (tipo, país, estado e cidade) são mantidas como
+categóricas no pandas e como arrays de dicionário no Arrow / Parquet, da
+transformação Silver até os agrupamentos da Gold. As categorias são sempre
+ordenadas (e, para 'brewery_type', fixas), de modo que ordenações e
+agrupamentos dão o mesmo resultado que sobre as strings originais.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# ---------------------------------------------------------------------------
+# Tipos de cervejarias conhecidos (documentação da Open Brewery DB)
+# ---------------------------------------------------------------------------
+
+KNOWN_BREWERY_TYPES = {
+    "micro", "nano", "regional", "brewpub", "large",
+    "planning", "bar", "contract", "proprietor", "taproom", "closed",
+}
+
+# Valor atribuído a tipos fora da lista acima
+UNKNOWN_BREWERY_TYPE = "unknown"
+
+# Dicionário fixo da coluna 'brewery_type', idêntico em todas as partições
+BREWERY_TYPE_CATEGORIES = sorted(KNOWN_BREWERY_TYPES | {UNKNOWN_BREWERY_TYPE})
+
+
+# ---------------------------------------------------------------------------
+# Colunas
+# ---------------------------------------------------------------------------
+
+# Colunas de baixa cardinalidade armazenadas como categóricas / dicionário
+CATEGORICAL_COLUMNS = ["brewery_type", "country", "state_province", "state", "city"]
+
+# Colunas numéricas da Silver; as demais são texto
+SILVER_NUMERIC_COLUMNS = ("longitude", "latitude")
+
+# Colunas removidas por serem majoritariamente nulas ou redundantes
+REDUNDANT_COLUMNS = ["address_2", "address_3", "street"]
+
+# Tipo Arrow das colunas categóricas
+DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+def to_categorical(column: str, values: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna para categórica: dicionário fixo para 'brewery_type' e,
+    nas demais, os valores não nulos presentes, em ordem crescente. Colunas que
+    já são categóricas apenas têm as categorias reordenadas, se preciso.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if column == "brewery_type":
+            target = pd.Index(BREWERY_TYPE_CATEGORIES)
+        else:
+            target = categories if categories.is_monotonic_increasing else categories.sort_values()
+        return values if categories.equals(target) else values.cat.set_categories(target)
+
+    # 'factorize' ordenado é bem mais rápido que 'astype' para uma lista de categorias
+    codes, uniques = pd.factorize(values, sort=True)
+    if column == "brewery_type":
+        # Valores fora do dicionário fixo viram nulos, como em 'astype'
+        positions = pd.Index(BREWERY_TYPE_CATEGORIES).get_indexer(uniques)
+        codes = np.append(positions, -1)[codes]
+        uniques = BREWERY_TYPE_CATEGORIES
+    categorical = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(uniques))
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+
+def apply_categorical_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte as colunas de 'CATEGORICAL_COLUMNS' presentes no DataFrame para
+    categóricas com categorias ordenadas (operação idempotente).
+    """
+    df = df.copy(deep=False)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = to_categorical(col, df[col])
+    return df
+
+
+def concat_categorical(dfs: list) -> pd.DataFrame:
+    """
+    Concatena DataFrames preservando as colunas categóricas: as categorias de
+    cada coluna são unificadas (e ordenadas) antes da concatenação, evitando
+    que o pandas as converta de volta para texto.
+    """
+    dfs = [apply_categorical_schema(df) for df in dfs]
+    for col in CATEGORICAL_COLUMNS:
+        dtypes = [df[col].dtype for df in dfs if col in df.columns]
+        if len(set(dtypes)) <= 1:
+            continue
+        categories = dtypes[0].categories
+        for dtype in dtypes[1:]:
+            categories = categories.union(dtype.categories)
+        for df in dfs:
+            if col in df.columns:
+                df[col] = df[col].cat.set_categories(categories)
+    return pd.concat(dfs, ignore_index=True)
+
+
+def dictionary_encode(column: str, values) -> pa.ChunkedArray:
+    """
+    Equivalente Arrow de 'to_categorical': codifica a coluna como array de
+    dicionário com o mesmo dicionário (ordenado) que o pandas usaria.
+    """
+    values = pc.cast(values, pa.string())
+    if column == "brewery_type":
+        dictionary = pa.array(BREWERY_TYPE_CATEGORIES, pa.string())
+    else:
+        dictionary = pc.unique(values.combine_chunks().drop_null()).sort()
+    indices = pc.cast(pc.index_in(values, value_set=dictionary), pa.int32())
+    return pa.chunked_array(
+        [pa.DictionaryArray.from_arrays(chunk, dictionary) for chunk in indices.chunks],
+        DICTIONARY_TYPE,
+    )
+
+
+def apply_dictionary_schema(table: pa.Table) -> pa.Table:
+    """
+    Equivalente Arrow de 'apply_categorical_schema' (colunas de 'CATEGORICAL_COLUMNS'
+    como arrays de dicionário).
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in table.column_names:
+            index = table.column_names.index(col)
+            table = table.set_column(index, col, dictionary_encode(col, table[col]))
+    return table
+
+
+def decode_dictionaries(table: pa.Table) -> pa.Table:
+    """Converte as colunas de dicionário de volta para texto (ex.: para gravar CSV)."""
+    return table.cast(pa.schema([
+        pa.field(f.name, f.type.value_type if pa.types.is_dictionary(f.type) else f.type)
+        for f in table.schema
+    ]))
+
+
+def silver_schema(columns: list) -> pa.Schema:
+    """
+    Esquema Arrow fixo da Silver para as colunas brutas informadas, usado para
+    que todos os lotes gravados em um mesmo arquivo tenham tipos idênticos.
+    """
+    fields = []
+    for col in columns:
+        if col in REDUNDANT_COLUMNS:
+            continue
+        if col in SILVER_NUMERIC_COLUMNS:
+            fields.append(pa.field(col, pa.float64()))
+        elif col in CATEGORICAL_COLUMNS:
+            fields.append(pa.field(col, DICTIONARY_TYPE))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields + [pa.field("processed_at", pa.string())])
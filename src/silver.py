@@ -2,12 +2,32 @@ import os
 import json
 import glob
 import logging
+import itertools
 import re
+import argparse
+import tempfile
+from contextlib import ExitStack, closing
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from config import BRONZE_DIR, SILVER_DIR, LOGS_DIR
+from config import (
+    BRONZE_DIR, SILVER_DIR, LOGS_DIR, BRONZE_CHECKPOINT_FILE, SILVER_BATCH_SIZE, SILVER_ENGINE,
+    SILVER_WRITE_MODE, SILVER_WRITE_WORKERS, SILVER_MANIFEST_FILE, SILVER_CHANGES_DIR, SILVER_SNAPSHOT,
+    WRITE_CSV_COPIES, SYNTHETIC_MARKER_FILE,
+)
+from schema import (
+    KNOWN_BREWERY_TYPES, UNKNOWN_BREWERY_TYPE, REDUNDANT_COLUMNS, apply_categorical_schema,
+    concat_categorical, silver_schema,
+)
+from storage import (
+    read_json, iter_ndjson, atomic_path, atomic_write_json, read_silver_manifest, list_silver_files,
+    NDJSON_EXTENSIONS,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -35,56 +55,215 @@ def setup_logger() -> logging.Logger:
 
 logger = setup_logger()
 
+# Extensões de arquivo aceitas como dados na camada Bronze
+BRONZE_EXTENSIONS = (".json",) + NDJSON_EXTENSIONS
 
-# ---------------------------------------------------------------------------
-# Tipos de cervejarias conhecidos (documentação da Open Brewery DB)
-# ---------------------------------------------------------------------------
 
-KNOWN_BREWERY_TYPES = {
-    "micro", "nano", "regional", "brewpub", "large",
-    "planning", "bar", "contract", "proprietor", "taproom", "closed",
-}
+# Padrão de caracteres removidos dos telefones: tudo que não é dígito ASCII.
+# Como string (e não re.Pattern), 'str.replace' usa o kernel de regex
+# vetorizado do Arrow. A classe é explícita porque '\D' é Unicode no 're' e
+# ASCII no RE2 do Arrow; com '[^0-9]' os dois motores (e o fallback 're' do
+# pandas) descartam igualmente dígitos não ASCII (ex.: '１２３').
+PHONE_NON_DIGITS = r"[^0-9]"
 
 
 # ---------------------------------------------------------------------------
 # Carga de Dados
 # ---------------------------------------------------------------------------
 
-def load_latest_bronze(bronze_dir: str = BRONZE_DIR) -> pd.DataFrame:
+def latest_bronze_partition(bronze_dir: str = BRONZE_DIR) -> str:
+    """
+    Retorna o caminho da partição 'ingestion_date' mais recente na camada Bronze.
+
+    Raises:
+        FileNotFoundError: Se nenhuma partição for encontrada.
+    """
+    partitions = sorted(glob.glob(os.path.join(bronze_dir, "ingestion_date=*")))
+    if not partitions:
+        raise FileNotFoundError(f"Nenhuma partição Bronze encontrada em: {bronze_dir}")
+    return partitions[-1]
+
+
+def _bronze_run_order(file_path: str) -> tuple:
+    """
+    Chave de ordenação cronológica dos arquivos Bronze, pelo horário da execução
+    no nome (ex.: 'breweries_raw_182935', 'breweries_delta_190102').
+    """
+    name = os.path.basename(file_path)
+    match = re.search(r"_(\d{6})(?=[_.])", name)
+    return (match.group(1) if match else "", name)
+
+
+def incomplete_checkpoint(partition: str):
+    """
+    Retorna o checkpoint da partição se a ingestão registrada nele não terminou
+    (ver 'bronze.ingest'), ou None se ela estiver completa ou não houver checkpoint.
+    """
+    checkpoint = read_json(os.path.join(partition, BRONZE_CHECKPOINT_FILE))
+    if checkpoint is not None and not checkpoint.get("complete"):
+        return checkpoint
+    return None
+
+
+def list_bronze_files(partition: str, allow_incomplete: bool = False, allow_synthetic: bool = False) -> list:
+    """
+    Lista, em ordem de execução, os arquivos de dados de uma partição Bronze:
+    NDJSON (comprimido ou não) e JSON legado (lista de registros).
+
+    Arquivos iniciados por '_' são metadados (ex.: manifesto de checkpoint) e são ignorados.
+
+    Uma partição cuja ingestão ficou incompleta (checkpoint com 'complete': false)
+    tem apenas parte da fonte: tratada como snapshot, ela apagaria da Silver
+    todos os registros ainda não baixados. Por isso ela só é lida com
+    'allow_incomplete=True'; normalmente basta executar 'bronze.ingest' de
+    novo, que retoma a ingestão a partir do checkpoint.
+
+    Uma partição gerada por 'synthetic.py' (com o marcador SYNTHETIC_MARKER_FILE)
+    só é lida com 'allow_synthetic=True', para que dados sintéticos nunca
+    cheguem à Silver de produção.
+
+    Args:
+        partition (str): Caminho da partição 'ingestion_date=...'.
+        allow_incomplete (bool): Se True, lista os arquivos mesmo com a ingestão incompleta.
+        allow_synthetic (bool): Se True, lista também os arquivos de uma partição sintética.
+
+    Raises:
+        FileNotFoundError: Se nenhum arquivo de dados for encontrado.
+        ValueError: Se a partição for sintética e 'allow_synthetic' for False, ou se
+            a ingestão estiver incompleta e 'allow_incomplete' for False.
+    """
+    if not allow_synthetic and os.path.exists(os.path.join(partition, SYNTHETIC_MARKER_FILE)):
+        raise ValueError(
+            f"A partição {partition} contém dados sintéticos ({SYNTHETIC_MARKER_FILE}). "
+            f"Use allow_synthetic=True para processá-la."
+        )
+
+    checkpoint = incomplete_checkpoint(partition)
+    if checkpoint is not None:
+        message = (
+            f"A ingestão {checkpoint.get('run_id')} da partição {partition} está incompleta "
+            f"(última página: {checkpoint.get('last_page')})."
+        )
+        if not allow_incomplete:
+            raise ValueError(
+                f"{message} Execute 'bronze.ingest' para retomá-la ou use allow_incomplete=True "
+                f"para aplicar os dados disponíveis apenas como upserts."
+            )
+        logger.warning(f"{message} Carregando os dados disponíveis.")
+
+    data_files = sorted(
+        (
+            os.path.join(partition, name) for name in os.listdir(partition)
+            if name.endswith(BRONZE_EXTENSIONS) and not name.startswith("_")
+        ),
+        key=_bronze_run_order,
+    )
+    if not data_files:
+        raise FileNotFoundError(f"Nenhum arquivo JSON/NDJSON encontrado na partição: {partition}")
+    return data_files
+
+
+def iter_bronze_records(file_path: str):
+    """
+    Lê os registros de um arquivo Bronze. Arquivos NDJSON são lidos linha a linha;
+    arquivos JSON legados (uma única lista) são carregados por inteiro.
+    """
+    if file_path.endswith(".json"):
+        with open(file_path, encoding="utf-8") as f:
+            yield from json.load(f)
+    else:
+        yield from iter_ndjson(file_path)
+
+
+def bronze_delta_files(partition: str, allow_incomplete: bool = False, allow_synthetic: bool = False) -> list:
+    """
+    Lista os arquivos de uma partição Bronze gravados pela ingestão incremental
+    (registros com a coluna '_op'). Apenas o primeiro registro de cada arquivo é lido.
+    """
+    delta_files = []
+    for file_path in list_bronze_files(partition, allow_incomplete, allow_synthetic):
+        with closing(iter_bronze_records(file_path)) as records:
+            if "_op" in next(records, {}):
+                delta_files.append(file_path)
+    return delta_files
+
+
+def iter_bronze_batches(partition: str, batch_size: int = SILVER_BATCH_SIZE, allow_incomplete: bool = False,
+                        allow_synthetic: bool = False):
     """
-    Carrega todos os arquivos JSON da partição 'ingestion_date' mais recente
+    Lê uma partição Bronze em lotes de até 'batch_size' registros.
+
+    Args:
+        partition (str): Caminho da partição 'ingestion_date=...'.
+        batch_size (int): Quantidade máxima de registros por lote.
+        allow_incomplete (bool): Se True, lê também uma partição com ingestão incompleta.
+        allow_synthetic (bool): Se True, lê também uma partição sintética.
+
+    Yields:
+        pd.DataFrame: Lote de registros brutos.
+    """
+    for file_path in list_bronze_files(partition, allow_incomplete, allow_synthetic):
+        records = iter_bronze_records(file_path)
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                break
+            yield pd.DataFrame(batch)
+
+
+def load_latest_bronze(bronze_dir: str = BRONZE_DIR, include_deletes: bool = False,
+                       allow_incomplete: bool = False, allow_synthetic: bool = False) -> pd.DataFrame:
+    """
+    Carrega todos os arquivos da partição 'ingestion_date' mais recente
     na camada Bronze e retorna um único DataFrame.
+
+    Os arquivos são lidos em lotes (ver 'iter_bronze_batches'), sem acumular
+    uma lista de dicionários com todos os registros.
+
+    Partições delta (ingestão incremental) trazem a coluna '_op'
+    ('insert', 'update' ou 'delete'). Por padrão, as remoções são descartadas
+    e '_op' é removida, de modo que o resultado contém apenas registros completos.
     
     Args:
         bronze_dir (str): Caminho para o diretório da camada Bronze.
+        include_deletes (bool): Se True, mantém as linhas de remoção e a coluna '_op'.
+        allow_incomplete (bool): Se True, carrega também uma partição com ingestão
+            incompleta (ver 'list_bronze_files').
+        allow_synthetic (bool): Se True, carrega também uma partição sintética.
         
     Returns:
         pd.DataFrame: DataFrame contendo os registros brutos consolidados.
         
     Raises:
-        FileNotFoundError: Se nenhuma partição ou arquivo JSON for encontrado.
+        FileNotFoundError: Se nenhuma partição ou arquivo de dados for encontrado.
+        ValueError: Se a partição for sintética ou tiver a ingestão incompleta, sem
+            a permissão correspondente (ver 'list_bronze_files').
     """
-    partitions = sorted(glob.glob(os.path.join(bronze_dir, "ingestion_date=*")))
-    if not partitions:
-        raise FileNotFoundError(f"Nenhuma partição Bronze encontrada em: {bronze_dir}")
-
-    latest_partition = partitions[-1]
+    latest_partition = latest_bronze_partition(bronze_dir)
     logger.info(f"Carregando partição Bronze: {latest_partition}")
 
-    json_files = glob.glob(os.path.join(latest_partition, "*.json"))
-    if not json_files:
-        raise FileNotFoundError(f"Nenhum arquivo JSON encontrado na partição: {latest_partition}")
-
-    records = []
-    for file_path in json_files:
-        with open(file_path, encoding="utf-8") as f:
-            records.extend(json.load(f))
+    batches = list(iter_bronze_batches(latest_partition, allow_incomplete=allow_incomplete,
+                                       allow_synthetic=allow_synthetic))
+    df = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    logger.info(f"Carregados {len(df)} registros brutos em {len(batches)} lote(s).")
 
-    df = pd.DataFrame(records)
-    logger.info(f"Carregados {len(df)} registros brutos de {len(json_files)} arquivo(s).")
+    if not include_deletes:
+        df = drop_deletes(df)
     return df
 
 
+def drop_deletes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Descarta as linhas de remoção de uma partição delta e a coluna '_op'.
+    """
+    if "_op" not in df.columns:
+        return df
+    deletes = df["_op"] == "delete"
+    if deletes.any():
+        logger.info(f"Partição delta: {deletes.sum()} remoção(ões) ignorada(s).")
+    return df[~deletes].drop(columns="_op").reset_index(drop=True)
+
+
 # ---------------------------------------------------------------------------
 # Transformações
 # ---------------------------------------------------------------------------
@@ -113,14 +292,17 @@ def clean_strings(df: pd.DataFrame) -> pd.DataFrame:
 
 def normalize_phone(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Mantém apenas os dígitos na coluna de telefone.
+    Mantém apenas os dígitos ASCII (0-9) na coluna de telefone.
     """
     if "phone" in df.columns:
-        df["phone"] = df["phone"].apply(
-            lambda x: re.sub(r"\D", "", str(x)) if pd.notna(x) else None
-        )
-        # Substitui strings vazias por None
-        df["phone"] = df["phone"].replace("", None)
+        phone = df["phone"]
+        not_null = phone.notna()
+        if not_null.any():
+            digits = phone[not_null].astype(str).str.replace(PHONE_NON_DIGITS, "", regex=True)
+            # Strings vazias viram nulo
+            df["phone"] = digits.where(digits != "").reindex(df.index)
+        elif len(phone):
+            df["phone"] = pd.Series([None] * len(phone), index=df.index, dtype=object)
     logger.info("Números de telefone normalizados (apenas dígitos).")
     return df
 
@@ -160,9 +342,9 @@ def standardize_brewery_type(df: pd.DataFrame) -> pd.DataFrame:
     Padroniza o tipo de cervejaria: minúsculo e mapeia valores desconhecidos para 'unknown'.
     """
     if "brewery_type" in df.columns:
-        df["brewery_type"] = df["brewery_type"].str.lower().str.strip()
-        df["brewery_type"] = df["brewery_type"].apply(
-            lambda x: x if x in KNOWN_BREWERY_TYPES else "unknown"
+        brewery_type = df["brewery_type"].str.lower().str.strip()
+        df["brewery_type"] = brewery_type.where(
+            brewery_type.isin(KNOWN_BREWERY_TYPES), UNKNOWN_BREWERY_TYPE
         )
     logger.info("Tipo de cervejaria (brewery_type) padronizado.")
     return df
@@ -172,12 +354,22 @@ def drop_redundant_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Remove colunas que são majoritariamente nulas ou redundantes.
     """
-    cols_to_drop = [c for c in ["address_2", "address_3", "street"] if c in df.columns]
+    cols_to_drop = [c for c in REDUNDANT_COLUMNS if c in df.columns]
     df = df.drop(columns=cols_to_drop)
     logger.info(f"Colunas redundantes removidas: {cols_to_drop}")
     return df
 
 
+def categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte as colunas de baixa cardinalidade (tipo, país, estado, cidade) para
+    categóricas com dicionário ordenado (ver 'schema.py').
+    """
+    df = apply_categorical_schema(df)
+    logger.info("Colunas de baixa cardinalidade convertidas para categóricas.")
+    return df
+
+
 def add_metadata(df: pd.DataFrame) -> pd.DataFrame:
     """
     Adiciona uma coluna 'processed_at' com o timestamp do processamento.
@@ -204,6 +396,7 @@ def transform(df: pd.DataFrame) -> pd.DataFrame:
     df = validate_coordinates(df)
     df = standardize_brewery_type(df)
     df = drop_redundant_columns(df)
+    df = categorize(df)
     df = add_metadata(df)
     return df
 
@@ -212,47 +405,704 @@ def transform(df: pd.DataFrame) -> pd.DataFrame:
 # Escrita dos Dados
 # ---------------------------------------------------------------------------
 
-def save_silver(df: pd.DataFrame, silver_dir: str = SILVER_DIR) -> None:
+def write_partition_file(df: pd.DataFrame, silver_dir: str, brewery_type: str, file_name: str,
+                         write_csv: bool = WRITE_CSV_COPIES) -> str:
+    """
+    Grava um arquivo Parquet na partição 'brewery_type=<tipo>' (e, se 'write_csv',
+    o CSV correspondente; sob demanda, use 'export.py').
+
+    Returns:
+        str: Caminho do Parquet relativo ao diretório Silver (como registrado no manifesto).
+    """
+    relpath = os.path.join(f"brewery_type={brewery_type}", file_name)
+    file_path = os.path.join(silver_dir, relpath)
+
+    df = apply_categorical_schema(df)
+    with atomic_path(file_path) as tmp_path:
+        df.to_parquet(tmp_path, index=False, engine="pyarrow")
+    if write_csv:
+        with atomic_path(file_path.replace(".parquet", ".csv")) as tmp_path:
+            df.to_csv(tmp_path, index=False)
+
+    logger.info(f"Salvos {len(df)} registros -> {file_path}" + (" (Parquet & CSV)" if write_csv else ""))
+    return relpath
+
+
+def write_partitions(write, groups, max_workers: int = SILVER_WRITE_WORKERS) -> dict:
+    """
+    Grava as partições em paralelo, em até 'max_workers' threads (a codificação
+    e a compressão Parquet do pyarrow liberam o GIL).
+
+    Cada arquivo é gravado em um caminho temporário e renomeado ao final (ver
+    'storage.atomic_path'). Se alguma partição falhar, o erro é propagado depois
+    que as demais terminam e nenhuma versão é publicada.
+
+    Args:
+        write (callable): Função (brewery_type, grupo) -> caminho relativo gravado.
+        groups: Pares (brewery_type, grupo), consumidos sob demanda.
+        max_workers (int): Máximo de partições gravadas simultaneamente (1 = sequencial).
+
+    Returns:
+        dict: {brewery_type: [caminho relativo]}, no formato de 'commit_silver_version'.
+    """
+    max_workers = max(1, int(max_workers))
+    if max_workers == 1:
+        return {brewery_type: [write(brewery_type, group)] for brewery_type, group in groups}
+
+    # No máximo 'max_workers' grupos materializados ao mesmo tempo
+    futures, pending = {}, set()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="silver") as executor:
+        for brewery_type, group in groups:
+            if len(pending) >= max_workers:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            futures[brewery_type] = executor.submit(write, brewery_type, group)
+            pending.add(futures[brewery_type])
+    return {brewery_type: [future.result()] for brewery_type, future in futures.items()}
+
+
+def save_silver(df: pd.DataFrame, silver_dir: str = SILVER_DIR, write_csv: bool = WRITE_CSV_COPIES,
+                max_workers: int = SILVER_WRITE_WORKERS) -> None:
     """
-    Grava o DataFrame transformado em arquivos Parquet particionados por 'brewery_type'.
+    Grava o DataFrame transformado em arquivos Parquet particionados por 'brewery_type'
+    (em paralelo, ver 'write_partitions') e publica os arquivos gravados como uma
+    nova versão completa no manifesto.
     
     Args:
         df (pd.DataFrame): DataFrame transformado.
         silver_dir (str): Caminho para o diretório da camada Silver.
+        write_csv (bool): Se True, grava também uma cópia CSV de cada partição.
+        max_workers (int): Máximo de partições gravadas simultaneamente (1 = sequencial).
     """
     os.makedirs(silver_dir, exist_ok=True)
+    file_name = f"breweries_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+
+    partitions = write_partitions(
+        lambda brewery_type, group: write_partition_file(group, silver_dir, brewery_type, file_name, write_csv),
+        df.groupby("brewery_type", observed=True),
+        max_workers,
+    )
+
+    commit_silver_version(silver_dir, partitions, "overwrite", records=len(df))
+    logger.info(f"Camada Silver concluida. Total de registros gravados: {len(df)}")
+    print(f"Camada Silver concluida! {len(df)} registros gravados em: {silver_dir}")
+
+
+# ---------------------------------------------------------------------------
+# Manifesto de Versões
+# ---------------------------------------------------------------------------
+
+# Quantidade de entradas mantidas no histórico do manifesto
+MANIFEST_HISTORY_SIZE = 100
+
+
+def commit_silver_version(silver_dir: str, partitions: dict, operation: str, **stats) -> dict:
+    """
+    Publica uma nova versão da camada Silver, substituindo o manifesto atomicamente.
+
+    Leitores que usam o manifesto (ver 'storage.list_silver_files') passam a ver
+    exatamente os arquivos informados; arquivos de versões anteriores continuam
+    no disco até a execução de 'vacuum_silver'.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        partitions (dict): Conjunto completo de arquivos da nova versão,
+            {brewery_type: [caminhos relativos ao diretório Silver]}.
+        operation (str): Operação que originou a versão ("overwrite", "merge", ...).
+        **stats: Métricas registradas no histórico (ex.: registros inseridos).
+
+    Returns:
+        dict: Manifesto publicado.
+    """
+    current = read_silver_manifest(silver_dir) or {"version": 0, "history": []}
+    version = current["version"] + 1
+    entry = {
+        "version": version,
+        "operation": operation,
+        "committed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **stats,
+    }
+    manifest = {
+        "version": version,
+        "updated_at": entry["committed_at"],
+        "partitions": {t: sorted(paths) for t, paths in sorted(partitions.items()) if paths},
+        "bronze_files": stats.get("bronze_files", current.get("bronze_files")),
+        "history": (current.get("history", []) + [entry])[-MANIFEST_HISTORY_SIZE:],
+    }
+    atomic_write_json(os.path.join(silver_dir, SILVER_MANIFEST_FILE), manifest)
+    logger.info(f"Manifesto Silver publicado: versão {version} ({operation}).")
+    return manifest
+
+
+def vacuum_silver(silver_dir: str = SILVER_DIR) -> int:
+    """
+    Remove os arquivos de dados que não fazem parte da versão atual do manifesto
+    (versões anteriores e arquivos legados) e os registros de mudanças de versões
+    que já saíram do histórico. Arquivos temporários de escritas em andamento
+    (iniciados por '.') são preservados.
+
+    Deve ser executado quando não houver leitores usando versões anteriores.
+
+    Returns:
+        int: Quantidade de arquivos removidos.
+    """
+    manifest = read_silver_manifest(silver_dir)
+    if manifest is None:
+        logger.warning(f"Vacuum ignorado: {silver_dir} não possui manifesto.")
+        return 0
+
+    referenced = set()
+    for paths in manifest["partitions"].values():
+        for path in paths:
+            referenced.add(os.path.normpath(os.path.join(silver_dir, path)))
+            referenced.add(os.path.normpath(os.path.join(silver_dir, path.replace(".parquet", ".csv"))))
+
+    removed = 0
+    for file_path in glob.glob(os.path.join(silver_dir, "brewery_type=*", "*")):
+        name = os.path.basename(file_path)
+        if name.startswith(".") or not name.endswith((".parquet", ".csv")):
+            continue
+        if os.path.normpath(file_path) not in referenced:
+            os.remove(file_path)
+            removed += 1
+    for partition_dir in glob.glob(os.path.join(silver_dir, "brewery_type=*")):
+        if not os.listdir(partition_dir):
+            os.rmdir(partition_dir)
+
+    change_files = {
+        os.path.normpath(os.path.join(silver_dir, entry["changes"]["removed"]))
+        for entry in manifest.get("history", [])
+        if (entry.get("changes") or {}).get("removed")
+    }
+    for file_path in glob.glob(os.path.join(silver_dir, SILVER_CHANGES_DIR, "*.parquet")):
+        if os.path.normpath(file_path) not in change_files:
+            os.remove(file_path)
+            removed += 1
+
+    logger.info(f"Vacuum Silver: {removed} arquivo(s) fora da versão {manifest['version']} removido(s).")
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Merge Incremental (upsert por 'id')
+# ---------------------------------------------------------------------------
+
+def _read_partition_file(silver_dir: str, relpath: str, columns: list = None) -> pd.DataFrame:
+    """Lê um arquivo da Silver, recuperando 'brewery_type' do nome da pasta se ausente."""
+    df = pd.read_parquet(os.path.join(silver_dir, relpath), columns=columns, engine="pyarrow")
+    if columns is None and "brewery_type" not in df.columns:
+        df["brewery_type"] = os.path.dirname(relpath).split("=", 1)[-1]
+    return df
+
+
+def bootstrap_silver_manifest(silver_dir: str = SILVER_DIR):
+    """
+    Converte uma camada Silver legada (sem manifesto, com um arquivo por execução
+    em cada partição) em uma primeira versão com manifesto: os arquivos são lidos
+    em ordem cronológica, cada 'id' mantém apenas a ocorrência mais recente e cada
+    partição é regravada em um único arquivo.
+
+    Returns:
+        dict ou None: Manifesto publicado, ou None se não houver dados legados.
+    """
+    legacy_files = sorted(list_silver_files(silver_dir), key=lambda f: (os.path.basename(f), f))
+    if not legacy_files:
+        return None
+
+    df = concat_categorical(
+        [_read_partition_file(silver_dir, os.path.relpath(f, silver_dir)) for f in legacy_files]
+    )
+    before = len(df)
+    df = df.drop_duplicates(subset="id", keep="last")
+    logger.info(
+        f"Bootstrap Silver: {len(legacy_files)} arquivo(s) legado(s), "
+        f"{before - len(df)} cópia(s) de registros descartada(s)."
+    )
+
+    file_name = f"breweries_{datetime.now().strftime('%Y%m%d_%H%M%S')}_v000001.parquet"
+    partitions = {
+        brewery_type: [write_partition_file(group, silver_dir, brewery_type, file_name)]
+        for brewery_type, group in df.groupby("brewery_type", observed=True)
+    }
+    return commit_silver_version(silver_dir, partitions, "bootstrap", records=len(df))
+
+
+# Colunas ignoradas na comparação de conteúdo do merge (chave e metadados)
+MERGE_IGNORED_COLUMNS = {"id", "processed_at"}
+
+
+def _row_hashes(df: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Hash de 64 bits do conteúdo de cada linha nas colunas informadas. Os valores
+    são comparados como texto (categóricas pelo valor, nulos como ausentes), de
+    modo que uma linha recém-transformada e a mesma linha lida do Parquet têm o
+    mesmo hash; colunas ausentes contam como nulas.
+    """
+    values = pd.DataFrame(
+        {
+            col: df[col].astype(object).where(df[col].notna(), None).astype(str) if col in df.columns else "None"
+            for col in columns
+        },
+        index=df.index,
+    )
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def unchanged_rows(incoming: pd.DataFrame, current: pd.DataFrame) -> np.ndarray:
+    """
+    Indica, para cada linha de 'incoming', se o mesmo 'id' já existe em 'current'
+    com conteúdo idêntico (ver 'MERGE_IGNORED_COLUMNS').
+
+    Returns:
+        np.ndarray: Máscara booleana alinhada às linhas de 'incoming'.
+    """
+    columns = sorted((set(incoming.columns) | set(current.columns)) - MERGE_IGNORED_COLUMNS)
+    current = current.drop_duplicates(subset="id", keep="last")
+    positions = pd.Index(current["id"]).get_indexer(incoming["id"])
+    found = positions >= 0
+    same = np.zeros(len(incoming), dtype=bool)
+    if found.any():
+        same[found] = _row_hashes(incoming[found], columns) == _row_hashes(current, columns)[positions[found]]
+    return same
+
+
+def merge_silver(bronze_dir: str = BRONZE_DIR, silver_dir: str = SILVER_DIR, allow_incomplete: bool = False,
+                 allow_synthetic: bool = False):
+    """
+    Aplica a partição Bronze mais recente sobre o estado atual da Silver como
+    upserts e remoções por 'id', publicando uma nova versão no manifesto.
+
+    - Partições delta (ingestão incremental, coluna '_op'): inserções e
+      atualizações são upserts; remoções apagam o 'id' da Silver.
+    - Partições completas (sem '_op'): os ids ausentes do snapshot são removidos.
+
+    Os registros recebidos são comparados com as linhas atuais pelo hash do
+    conteúdo (ver 'unchanged_rows'): registros idênticos aos da Silver são
+    ignorados, de modo que o custo da escrita, do registro de mudanças e da Gold
+    incremental é proporcional ao que mudou, e não ao tamanho da tabela. Apenas
+    os arquivos que contêm ids alterados são regravados (sem essas linhas);
+    os registros novos ou atualizados de cada 'brewery_type' são gravados em um
+    novo arquivo da partição. Um registro cujo tipo mudou sai do arquivo da
+    partição antiga e entra na nova. Em uma Silver legada (sem manifesto), o
+    primeiro merge executa 'bootstrap_silver_manifest'.
+
+    Com 'allow_incomplete=True', uma partição cuja ingestão ficou incompleta é
+    aplicada apenas como upserts: os ids ainda não baixados não são removidos,
+    e a partição não é registrada como aplicada (ela é aplicada de novo depois
+    que a ingestão terminar).
+
+    A entrada de histórico registra as mudanças em nível de linha ('changes'):
+    os arquivos com as linhas inseridas ou atualizadas e um arquivo em
+    'SILVER_CHANGES_DIR' com as versões anteriores das linhas atualizadas ou
+    removidas. Consumidores incrementais (ver 'gold.update_gold_state') leem
+    apenas esses arquivos.
+
+    Args:
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        allow_incomplete (bool): Se True, aplica os dados disponíveis de uma
+            partição com ingestão incompleta (ver 'list_bronze_files').
+        allow_synthetic (bool): Se True, aplica também uma partição sintética.
+
+    Returns:
+        dict ou None: Entrada de histórico da versão publicada, ou None se a
+        partição Bronze já tiver sido aplicada.
+
+    Raises:
+        ValueError: Se a partição for sintética ou tiver a ingestão incompleta, sem
+            a permissão correspondente, ou se a partição só tiver deltas e ainda não
+            houver Silver.
+    """
+    latest_partition = latest_bronze_partition(bronze_dir)
+    bronze_files = [
+        os.path.relpath(f, bronze_dir) for f in list_bronze_files(latest_partition, allow_incomplete, allow_synthetic)
+    ]
+    complete = incomplete_checkpoint(latest_partition) is None
+
+    manifest = read_silver_manifest(silver_dir) or bootstrap_silver_manifest(silver_dir)
+    if manifest is None:
+        if len(bronze_delta_files(latest_partition, allow_incomplete, allow_synthetic)) == len(bronze_files):
+            raise ValueError(
+                f"A partição {latest_partition} contém apenas deltas da ingestão incremental e não há "
+                f"Silver sobre a qual aplicá-los. Execute uma ingestão completa ('bronze.ingest')."
+            )
+        manifest = {"version": 0, "partitions": {}}
+    elif manifest.get("bronze_files") == bronze_files:
+        logger.info(f"Merge Silver ignorado: {latest_partition} já aplicada na versão {manifest['version']}.")
+        print(f"Camada Silver já está atualizada (versão {manifest['version']}).")
+        return None
+
+    raw = load_latest_bronze(bronze_dir, include_deletes=True, allow_incomplete=allow_incomplete,
+                             allow_synthetic=allow_synthetic)
+    # Vale a última operação de cada id na partição
+    raw = raw.drop_duplicates(subset="id", keep="last").reset_index(drop=True)
+    snapshot = "_op" not in raw.columns
+    if snapshot:
+        upserts, deleted_ids = raw, pd.Series([], dtype="str")
+    else:
+        is_delete = raw["_op"] == "delete"
+        upserts = raw[~is_delete].drop(columns="_op").reset_index(drop=True)
+        deleted_ids = raw.loc[is_delete, "id"]
+    changes = transform(upserts) if len(upserts) else None
+
+    # Ids de cada arquivo da versão atual (apenas a coluna 'id' é lida)
+    file_ids = {
+        (brewery_type, relpath): _read_partition_file(silver_dir, relpath, columns=["id"])["id"]
+        for brewery_type, paths in manifest["partitions"].items()
+        for relpath in paths
+    }
+    current_ids = pd.concat(file_ids.values(), ignore_index=True) if file_ids else pd.Series([], dtype="str")
+    if snapshot and complete:
+        deleted_ids = current_ids[~current_ids.isin(raw["id"])]
+    elif snapshot:
+        logger.warning(
+            f"Partição {latest_partition} incompleta: registros aplicados apenas como upserts, sem remoções."
+        )
+
+    # Descarta os registros idênticos às linhas atuais; só os arquivos que
+    # contêm algum dos ids recebidos são lidos por inteiro
+    unchanged = 0
+    if changes is not None:
+        current_rows = []
+        for (brewery_type, relpath), ids in file_ids.items():
+            hit = ids.isin(changes["id"]).to_numpy()
+            if hit.any():
+                current_rows.append(_read_partition_file(silver_dir, relpath)[hit])
+        if current_rows:
+            same = unchanged_rows(changes, concat_categorical(current_rows))
+            unchanged = int(same.sum())
+            changes = changes[~same].reset_index(drop=True)
+        if changes.empty:
+            changes = None
+
+    upsert_ids = changes["id"] if changes is not None else pd.Series([], dtype="str")
+    touched = pd.concat([upsert_ids, deleted_ids], ignore_index=True)
+
+    version = manifest["version"] + 1
+    prefix = f"breweries_{datetime.now().strftime('%Y%m%d_%H%M%S')}_v{version:06d}"
+    partitions = {t: list(paths) for t, paths in manifest["partitions"].items()}
+    rewritten = 0
+    removed_rows, inserted_files = [], []
+
+    for (brewery_type, relpath), ids in file_ids.items():
+        hit = ids.isin(touched).to_numpy()
+        if not hit.any():
+            continue
+        partitions[brewery_type].remove(relpath)
+        current = _read_partition_file(silver_dir, relpath)
+        removed_rows.append(current[hit])
+        kept = current[~hit]
+        if len(kept):
+            partitions[brewery_type].append(
+                write_partition_file(kept, silver_dir, brewery_type, f"{prefix}_{rewritten:03d}.parquet")
+            )
+        rewritten += 1
+
+    if changes is not None:
+        for brewery_type, group in changes.groupby("brewery_type", observed=True):
+            inserted_files.append(write_partition_file(group, silver_dir, brewery_type, f"{prefix}.parquet"))
+            partitions.setdefault(brewery_type, []).append(inserted_files[-1])
+
+    # Registro das mudanças em nível de linha desta versão: arquivos com as linhas
+    # novas (ou novas versões) e arquivo com as versões anteriores removidas
+    removed_file = None
+    if removed_rows:
+        removed_file = os.path.join(SILVER_CHANGES_DIR, f"removed_v{version:06d}.parquet")
+        with atomic_path(os.path.join(silver_dir, removed_file)) as tmp_path:
+            concat_categorical(removed_rows).to_parquet(tmp_path, index=False, engine="pyarrow")
+
+    inserted = int((~upsert_ids.isin(current_ids)).sum())
+    stats = {
+        # Uma partição incompleta não conta como aplicada
+        "bronze_files": bronze_files if complete else None,
+        "inserted": inserted,
+        "updated": len(upsert_ids) - inserted,
+        "deleted": int(current_ids.isin(deleted_ids).sum()),
+        "unchanged": unchanged,
+        "files_rewritten": rewritten,
+        "changes": {"inserted": inserted_files, "removed": removed_file},
+    }
+    manifest = commit_silver_version(silver_dir, partitions, "merge", **stats)
+    entry = manifest["history"][-1]
+
+    logger.info(
+        f"Merge Silver (versão {entry['version']}): {entry['inserted']} inserido(s), "
+        f"{entry['updated']} atualizado(s), {entry['deleted']} removido(s), "
+        f"{entry['unchanged']} inalterado(s), {rewritten} arquivo(s) regravado(s)."
+    )
+    print(
+        f"Camada Silver atualizada (versão {entry['version']}): {entry['inserted']} inserções, "
+        f"{entry['updated']} atualizações, {entry['deleted']} remoções."
+    )
+    return entry
+
+
+# ---------------------------------------------------------------------------
+# Transformação em Lotes (fora da memória)
+# ---------------------------------------------------------------------------
+
+# Quantidade de arquivos (baldes) do índice de ids em disco
+ID_INDEX_BUCKETS = 64
+
+_INDEX_DTYPE = np.dtype([("hash", "<u8"), ("row", "<i8")])
+
+
+def _id_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash de 64 bits de cada 'id' (ids nulos compartilham o mesmo hash, como no 'drop_duplicates')."""
+    return pd.util.hash_pandas_object(df["id"], index=False).to_numpy()
+
+
+def build_id_index(partition: str, batch_size: int = SILVER_BATCH_SIZE, work_dir: str = None,
+                   allow_synthetic: bool = False):
+    """
+    Primeira passada da transformação em lotes: identifica, para cada registro
+    da partição (remoções excluídas), se ele é a última ocorrência do seu 'id'.
+
+    Os pares (hash do id, posição) são distribuídos em baldes no disco pelos bits
+    mais altos do hash; cada balde é carregado e resolvido isoladamente, de modo
+    que a memória usada é limitada ao tamanho de um balde mais uma máscara de
+    1 byte por registro.
+
+    Args:
+        partition (str): Caminho da partição 'ingestion_date=...'.
+        batch_size (int): Quantidade máxima de registros por lote.
+        work_dir (str, opcional): Diretório para os baldes. Padrão: diretório temporário.
+        allow_synthetic (bool): Se True, lê também uma partição sintética.
+
+    Returns:
+        tuple: (máscara booleana 'manter' por posição, colunas na ordem em que aparecem).
+    """
+    shift = np.uint64(64 - int(np.log2(ID_INDEX_BUCKETS)))
+    columns = {}
+    total = 0
+
+    with tempfile.TemporaryDirectory(dir=work_dir, prefix="silver_id_index_") as index_dir:
+        paths = [os.path.join(index_dir, f"bucket_{i:03d}.bin") for i in range(ID_INDEX_BUCKETS)]
+        with ExitStack() as stack:
+            buckets = [stack.enter_context(open(path, "wb")) for path in paths]
+            for df in iter_bronze_batches(partition, batch_size, allow_synthetic=allow_synthetic):
+                df = drop_deletes(df)
+                columns.update(dict.fromkeys(df.columns))
+                entries = np.empty(len(df), dtype=_INDEX_DTYPE)
+                entries["hash"] = _id_hashes(df)
+                entries["row"] = np.arange(total, total + len(df))
+                total += len(df)
+                bucket_of = entries["hash"] >> shift
+                for bucket in np.unique(bucket_of):
+                    entries[bucket_of == bucket].tofile(buckets[bucket])
+
+        keep = np.zeros(total, dtype=bool)
+        for path in paths:
+            entries = np.fromfile(path, dtype=_INDEX_DTYPE)
+            if not len(entries):
+                continue
+            # Dentro de um balde as posições já estão em ordem crescente; a ordenação
+            # estável por hash deixa a última ocorrência no fim de cada sequência
+            entries = entries[np.argsort(entries["hash"], kind="stable")]
+            last = np.append(entries["hash"][1:] != entries["hash"][:-1], True)
+            keep[entries["row"][last]] = True
+
+    logger.info(
+        f"Índice de ids: {total} registro(s), {total - int(keep.sum())} duplicado(s) a remover."
+    )
+    return keep, [c for c in columns if c != "_op"]
+
+
+def process_silver_streaming(bronze_dir: str = BRONZE_DIR, silver_dir: str = SILVER_DIR,
+                             batch_size: int = SILVER_BATCH_SIZE,
+                             write_csv: bool = WRITE_CSV_COPIES, allow_synthetic: bool = False) -> None:
+    """
+    Executa a camada Silver em lotes de tamanho limitado, sem carregar a partição inteira.
+
+    A primeira passada monta o índice de ids ('build_id_index'); a segunda relê a
+    partição lote a lote, mantém apenas a última ocorrência de cada 'id', aplica
+    'transform' e anexa cada lote ao arquivo Parquet (e ao CSV, se 'write_csv')
+    da sua partição 'brewery_type'. O resultado é equivalente ao de
+    'transform' + 'save_silver'.
+
+    Args:
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        batch_size (int): Quantidade máxima de registros por lote.
+        write_csv (bool): Se True, grava também uma cópia CSV de cada partição.
+        allow_synthetic (bool): Se True, processa também uma partição sintética.
+    """
+    latest_partition = latest_bronze_partition(bronze_dir)
+    logger.info(f"Transformação Silver em lotes de {batch_size}: {latest_partition}")
+
+    keep, columns = build_id_index(latest_partition, batch_size, allow_synthetic=allow_synthetic)
+    schema = silver_schema(columns)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    total_written = 0
+    written = {}
+    offset = 0
 
-    for brewery_type, group in df.groupby("brewery_type"):
-        partition_dir = os.path.join(silver_dir, f"brewery_type={brewery_type}")
-        os.makedirs(partition_dir, exist_ok=True)
+    # Os arquivos são escritos em caminhos temporários e só substituem os
+    # definitivos ao final; uma falha no meio do processo não deixa arquivos parciais
+    with ExitStack() as stack:
+        writers = {}
+        for df in iter_bronze_batches(latest_partition, batch_size, allow_synthetic=allow_synthetic):
+            df = drop_deletes(df)
+            mask = keep[offset:offset + len(df)]
+            offset += len(df)
+            df = df[mask].reset_index(drop=True)
+            if df.empty:
+                continue
 
-        file_path = os.path.join(partition_dir, f"breweries_{timestamp}.parquet")
-        group.to_parquet(file_path, index=False, engine="pyarrow")
+            df = transform(df).reindex(columns=schema.names)
+            for brewery_type, group in df.groupby("brewery_type", observed=True):
+                if brewery_type not in writers:
+                    partition_dir = os.path.join(silver_dir, f"brewery_type={brewery_type}")
+                    file_path = os.path.join(partition_dir, f"breweries_{timestamp}.parquet")
+                    parquet_tmp = stack.enter_context(atomic_path(file_path))
+                    csv_tmp = (
+                        stack.enter_context(atomic_path(file_path.replace(".parquet", ".csv")))
+                        if write_csv else None
+                    )
+                    writers[brewery_type] = (
+                        stack.enter_context(pq.ParquetWriter(parquet_tmp, schema)), csv_tmp
+                    )
+                    written[brewery_type] = 0
 
-        csv_path = file_path.replace(".parquet", ".csv")
-        group.to_csv(csv_path, index=False)
+                parquet_writer, csv_tmp = writers[brewery_type]
+                parquet_writer.write_table(
+                    pa.Table.from_pandas(group, schema=schema, preserve_index=False)
+                )
+                if csv_tmp is not None:
+                    group.to_csv(csv_tmp, mode="a", header=written[brewery_type] == 0, index=False)
+                written[brewery_type] += len(group)
 
+    for brewery_type, count in sorted(written.items()):
         logger.info(
-            f"Salvos {len(group)} registros -> {file_path} (Parquet & CSV)"
+            f"Salvos {count} registros -> brewery_type={brewery_type}" + (" (Parquet & CSV)" if write_csv else "")
         )
-        total_written += len(group)
-
+    total_written = sum(written.values())
+    commit_silver_version(
+        silver_dir,
+        {t: [os.path.join(f"brewery_type={t}", f"breweries_{timestamp}.parquet")] for t in written},
+        "overwrite", records=total_written,
+    )
     logger.info(f"Camada Silver concluida. Total de registros gravados: {total_written}")
     print(f"Camada Silver concluida! {total_written} registros gravados em: {silver_dir}")
 
 
+# ---------------------------------------------------------------------------
+# Execução da Camada
+# ---------------------------------------------------------------------------
+
+SILVER_ENGINES = ("pandas", "arrow")
+
+SILVER_WRITE_MODES = ("overwrite", "merge")
+
+
+def process_silver(bronze_dir: str = BRONZE_DIR, silver_dir: str = SILVER_DIR,
+                   engine: str = SILVER_ENGINE, streaming: bool = False,
+                   batch_size: int = SILVER_BATCH_SIZE, mode: str = SILVER_WRITE_MODE,
+                   write_workers: int = SILVER_WRITE_WORKERS, snapshot: bool = SILVER_SNAPSHOT,
+                   allow_incomplete: bool = False, allow_synthetic: bool = False) -> None:
+    """
+    Executa a camada Silver completa: carga da Bronze, transformações e escrita.
+
+    Args:
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        engine (str): "pandas" (DataFrame) ou "arrow" (pyarrow.compute, ver 'silver_arrow.py').
+        streaming (bool): Se True, processa a partição em lotes de memória limitada
+            (ver 'process_silver_streaming'). Disponível no motor "pandas".
+        batch_size (int): Quantidade máxima de registros por lote no modo em lotes.
+        mode (str): "overwrite" (grava uma nova versão completa) ou "merge"
+            (aplica upserts e remoções por 'id', ver 'merge_silver'; motor "pandas").
+        write_workers (int): Partições gravadas simultaneamente no modo "overwrite" sem lotes.
+        snapshot (bool): Se True, atualiza ao final o snapshot Arrow IPC da nova
+            versão (ver 'snapshot.py').
+        allow_incomplete (bool): Se True, aplica os dados disponíveis de uma
+            partição Bronze com ingestão incompleta, como merge (ver 'merge_silver').
+        allow_synthetic (bool): Se True, processa também uma partição gerada por
+            'synthetic.py' (ex.: benchmarks); a Silver de produção nunca deve usá-lo.
+
+    Uma partição Bronze com deltas da ingestão incremental (registros com '_op',
+    ver 'bronze_delta_files') nunca é publicada como versão completa: ela não
+    contém a tabela inteira e suas remoções seriam perdidas. Nesse caso o modo
+    "overwrite" é substituído por "merge", em qualquer motor.
+
+    Raises:
+        ValueError: Se o motor ou o modo de escrita não forem suportados, se a
+            partição for sintética ou tiver a ingestão incompleta, sem a permissão
+            correspondente (ver 'list_bronze_files'), ou se a partição só tiver deltas e ainda não
+            houver Silver (ver 'merge_silver').
+    """
+    if engine not in SILVER_ENGINES:
+        raise ValueError(f"Motor Silver não suportado: {engine}. Use um de {list(SILVER_ENGINES)}.")
+    if mode not in SILVER_WRITE_MODES:
+        raise ValueError(f"Modo de escrita Silver não suportado: {mode}. Use um de {list(SILVER_WRITE_MODES)}.")
+    if streaming and engine != "pandas":
+        raise ValueError("O modo em lotes (streaming) está disponível apenas no motor 'pandas'.")
+    if mode == "merge" and (streaming or engine != "pandas"):
+        raise ValueError("O modo 'merge' está disponível apenas no motor 'pandas', sem lotes.")
+
+    latest_partition = latest_bronze_partition(bronze_dir)
+    # Sem 'allow_incomplete', falha aqui; com ele, a partição parcial nunca vira versão completa
+    list_bronze_files(latest_partition, allow_incomplete, allow_synthetic)
+    if mode == "overwrite" and incomplete_checkpoint(latest_partition):
+        print("Partição Bronze incompleta: aplicando os dados disponíveis com merge.")
+        mode = "merge"
+    if mode == "overwrite":
+        delta_files = bronze_delta_files(latest_partition, allow_synthetic=allow_synthetic)
+        if delta_files:
+            logger.warning(
+                f"Partição Bronze com {len(delta_files)} arquivo(s) delta (ingestão incremental): "
+                f"aplicando como merge em vez de uma nova versão completa."
+            )
+            print("Partição Bronze incremental detectada: aplicando as mudanças com merge.")
+            mode = "merge"
+    logger.info(
+        f"Motor de transformação Silver: {engine}{' (em lotes)' if streaming else ''}, modo {mode}"
+    )
+
+    if mode == "merge":
+        merge_silver(bronze_dir, silver_dir, allow_incomplete, allow_synthetic)
+    elif streaming:
+        process_silver_streaming(bronze_dir, silver_dir, batch_size, allow_synthetic=allow_synthetic)
+    elif engine == "arrow":
+        import silver_arrow
+        table = silver_arrow.load_latest_bronze(bronze_dir, allow_synthetic=allow_synthetic)
+        silver_arrow.save_silver(silver_arrow.transform(table), silver_dir, max_workers=write_workers)
+    else:
+        raw_df = load_latest_bronze(bronze_dir, allow_synthetic=allow_synthetic)
+        save_silver(transform(raw_df), silver_dir, max_workers=write_workers)
+
+    if snapshot:
+        from snapshot import refresh_silver_snapshot
+        refresh_silver_snapshot(silver_dir)
+
+
 # ---------------------------------------------------------------------------
 # Ponto de Entrada
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transformação da camada Silver.")
+    parser.add_argument("--engine", choices=SILVER_ENGINES, default=SILVER_ENGINE,
+                        help="Motor de transformação.")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Processa a partição Bronze em lotes de memória limitada.")
+    parser.add_argument("--batch-size", type=int, default=SILVER_BATCH_SIZE,
+                        help="Registros por lote no modo --streaming.")
+    parser.add_argument("--mode", choices=SILVER_WRITE_MODES, default=SILVER_WRITE_MODE,
+                        help="Escrita: nova versão completa ou merge (upsert por id).")
+    parser.add_argument("--write-workers", type=int, default=SILVER_WRITE_WORKERS,
+                        help="Partições gravadas simultaneamente (1 = sequencial).")
+    parser.add_argument("--allow-incomplete", action="store_true",
+                        help="Aplica, apenas como upserts, uma partição Bronze com ingestão incompleta.")
+    parser.add_argument("--vacuum", action="store_true",
+                        help="Remove, ao final, os arquivos fora da versão atual do manifesto.")
+    args = parser.parse_args()
+
     try:
         logger.info("=== Início da transformação Silver ===")
-        raw_df = load_latest_bronze()
-        clean_df = transform(raw_df)
-        save_silver(clean_df)
+        process_silver(engine=args.engine, streaming=args.streaming,
+                       batch_size=args.batch_size, mode=args.mode, write_workers=args.write_workers,
+                       allow_incomplete=args.allow_incomplete)
+        if args.vacuum:
+            vacuum_silver()
         logger.info("=== Transformação Silver finalizada com sucesso ===")
     except Exception as e:
         logger.error(f"Falha na transformacao Silver: {e}")
@@ -0,0 +1,355 @@
+"""
+silver_arrow.py – Motor Arrow da transformação Silver.
+
+Alternativa ao caminho pandas de 'silver.py': a partição Bronze é carregada
+diretamente em um 'pyarrow.Table' e as mesmas transformações (deduplicação,
+limpeza de texto, telefone, código postal, coordenadas e tipo de cervejaria)
+são aplicadas com kernels de 'pyarrow.compute'. A escrita da Silver também
+parte da tabela Arrow, sem materializar colunas 'object' em pandas.
+
+O resultado é equivalente ao de 'silver.transform' + 'silver.save_silver'
+(mesmas linhas, colunas e partições). Selecione com
+'silver.process_silver(engine="arrow")'.
+"""
+
+import os
+import itertools
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.json as pajson
+import pyarrow.parquet as pq
+
+from config import BRONZE_DIR, SILVER_DIR, SILVER_BATCH_SIZE, SILVER_WRITE_WORKERS, WRITE_CSV_COPIES
+from schema import (
+    KNOWN_BREWERY_TYPES, UNKNOWN_BREWERY_TYPE, REDUNDANT_COLUMNS, apply_dictionary_schema, decode_dictionaries,
+)
+from silver import (
+    logger, latest_bronze_partition, list_bronze_files, iter_bronze_records, commit_silver_version,
+    write_partitions, PHONE_NON_DIGITS,
+)
+from storage import atomic_path
+
+# Coordenadas e seus intervalos válidos
+COORDINATE_RANGES = {"longitude": (-180, 180), "latitude": (-90, 90)}
+
+# Número decimal (com sinal e expoente opcionais), como aceito por 'pd.to_numeric'
+NUMERIC_PATTERN = r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+
+
+# ---------------------------------------------------------------------------
+# Carga de Dados
+# ---------------------------------------------------------------------------
+
+def _records_to_table(records: list) -> pa.Table:
+    """
+    Converte uma lista de registros em tabela. Colunas com tipos mistos
+    (ex.: coordenadas ora numéricas, ora texto) são convertidas para texto.
+    """
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    arrays = []
+    for col in columns:
+        values = [record.get(col) for record in records]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array([None if v is None else str(v) for v in values], pa.string()))
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def read_bronze_file(file_path: str, batch_size: int = SILVER_BATCH_SIZE) -> pa.Table:
+    """
+    Lê um arquivo Bronze como tabela Arrow.
+
+    Arquivos NDJSON (comprimidos ou não) são lidos pelo leitor JSON nativo do
+    Arrow. Se a inferência de tipos falhar (tipos mistos em uma coluna) ou o
+    arquivo for JSON legado, os registros são convertidos em lotes.
+    """
+    if not file_path.endswith(".json"):
+        try:
+            return pajson.read_json(file_path)
+        except pa.ArrowInvalid as e:
+            logger.warning(f"Leitura nativa de {file_path} falhou ({e}). Convertendo em lotes.")
+
+    records = iter_bronze_records(file_path)
+    tables = []
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            break
+        tables.append(_records_to_table(batch))
+    return concat_tables(tables)
+
+
+def concat_tables(tables: list) -> pa.Table:
+    """
+    Concatena tabelas com esquemas possivelmente diferentes. Colunas ausentes
+    viram nulas e colunas cujos tipos não podem ser unificados viram texto.
+    """
+    tables = [t for t in tables if t.num_columns]
+    if not tables:
+        return pa.table({})
+
+    types = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+    to_string = {
+        name for name, found in types.items()
+        if len(found) > 1 and not all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in found)
+    }
+    if to_string:
+        tables = [
+            t.cast(pa.schema([
+                pa.field(f.name, pa.string()) if f.name in to_string else f for f in t.schema
+            ]))
+            for t in tables
+        ]
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def load_latest_bronze(bronze_dir: str = BRONZE_DIR, include_deletes: bool = False,
+                       allow_synthetic: bool = False) -> pa.Table:
+    """
+    Carrega a partição 'ingestion_date' mais recente da camada Bronze como
+    uma única tabela Arrow (equivalente a 'silver.load_latest_bronze').
+
+    Args:
+        bronze_dir (str): Caminho para o diretório da camada Bronze.
+        include_deletes (bool): Se True, mantém as linhas de remoção e a coluna '_op'.
+        allow_synthetic (bool): Se True, carrega também uma partição sintética.
+
+    Returns:
+        pa.Table: Registros brutos consolidados.
+
+    Raises:
+        FileNotFoundError: Se nenhuma partição ou arquivo de dados for encontrado.
+        ValueError: Se a partição for sintética ou tiver a ingestão incompleta
+            (ver 'silver.list_bronze_files').
+    """
+    latest_partition = latest_bronze_partition(bronze_dir)
+    logger.info(f"Carregando partição Bronze (Arrow): {latest_partition}")
+
+    files = list_bronze_files(latest_partition, allow_synthetic=allow_synthetic)
+    table = concat_tables([read_bronze_file(f) for f in files])
+    logger.info(f"Carregados {table.num_rows} registros brutos de {len(files)} arquivo(s).")
+
+    if "_op" in table.column_names and not include_deletes:
+        deletes = pc.fill_null(pc.equal(table["_op"], "delete"), False)
+        removed = pc.sum(deletes).as_py() or 0
+        if removed:
+            logger.info(f"Partição delta: {removed} remoção(ões) ignorada(s).")
+        table = table.filter(pc.invert(deletes)).drop_columns("_op")
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Transformações
+# ---------------------------------------------------------------------------
+
+def _set_column(table: pa.Table, name: str, values) -> pa.Table:
+    return table.set_column(table.column_names.index(name), name, values)
+
+
+def deduplicate(table: pa.Table) -> pa.Table:
+    """
+    Remove registros duplicados pelo 'id', mantendo a última ocorrência
+    (e a ordem original das linhas mantidas).
+    """
+    before = table.num_rows
+    rows = table.select(["id"]).append_column("__row", pa.array(range(before), pa.int64()))
+    last = rows.group_by("id", use_threads=False).aggregate([("__row", "max")])
+    keep = last["__row_max"]
+    table = table.take(pc.take(keep, pc.sort_indices(keep)))
+    logger.info(
+        f"Deduplicação: removidos {before - table.num_rows} duplicado(s). Restantes: {table.num_rows}"
+    )
+    return table
+
+
+def clean_strings(table: pa.Table) -> pa.Table:
+    """
+    Remove espaços em branco no início e no fim de todas as colunas de texto.
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(i, field.name, pc.utf8_trim_whitespace(table.column(i)))
+    logger.info("Colunas de texto limpas (espaços removidos).")
+    return table
+
+
+def normalize_phone(table: pa.Table) -> pa.Table:
+    """
+    Mantém apenas os dígitos ASCII (0-9) na coluna de telefone (vazio vira nulo).
+    """
+    if "phone" in table.column_names and not pa.types.is_null(table.schema.field("phone").type):
+        phone = pc.cast(table["phone"], pa.string())
+        digits = pc.replace_substring_regex(phone, PHONE_NON_DIGITS, "")
+        table = _set_column(table, "phone", pc.if_else(pc.equal(digits, ""), None, digits))
+    logger.info("Números de telefone normalizados (apenas dígitos).")
+    return table
+
+
+def normalize_postal_code(table: pa.Table) -> pa.Table:
+    """
+    Normaliza o código postal: remove espaços e converte para maiúsculo.
+    """
+    if "postal_code" in table.column_names and not pa.types.is_null(table.schema.field("postal_code").type):
+        postal = pc.utf8_trim_whitespace(pc.cast(table["postal_code"], pa.string()))
+        table = _set_column(table, "postal_code", pc.utf8_upper(postal))
+    logger.info("Códigos postais normalizados.")
+    return table
+
+
+def _to_float(values) -> pa.ChunkedArray:
+    """Converte para float64; textos não numéricos viram nulo (como 'pd.to_numeric(errors="coerce")')."""
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        numeric = pc.fill_null(pc.match_substring_regex(values, NUMERIC_PATTERN), False)
+        values = pc.if_else(numeric, values, None)
+    return pc.cast(values, pa.float64())
+
+
+def validate_coordinates(table: pa.Table) -> pa.Table:
+    """
+    Anula longitude/latitude fora dos intervalos geográficos válidos.
+    Válido: longitude [-180, 180], latitude [-90, 90].
+    """
+    for col, (low, high) in COORDINATE_RANGES.items():
+        if col not in table.column_names:
+            continue
+        values = _to_float(table[col])
+        valid = pc.fill_null(pc.and_(pc.greater_equal(values, low), pc.less_equal(values, high)), False)
+        invalid = table.num_rows - (pc.sum(valid).as_py() or 0)
+        table = _set_column(table, col, pc.if_else(valid, values, None))
+        logger.info(f"Coordenadas: {invalid} {col}(s) inválida(s) anulada(s).")
+    return table
+
+
+def standardize_brewery_type(table: pa.Table) -> pa.Table:
+    """
+    Padroniza o tipo de cervejaria: minúsculo e mapeia valores desconhecidos para 'unknown'.
+    """
+    if "brewery_type" in table.column_names:
+        brewery_type = table["brewery_type"]
+        if pa.types.is_null(brewery_type.type):
+            brewery_type = pc.cast(brewery_type, pa.string())
+        brewery_type = pc.utf8_trim_whitespace(pc.utf8_lower(brewery_type))
+        known = pc.is_in(brewery_type, value_set=pa.array(sorted(KNOWN_BREWERY_TYPES)))
+        table = _set_column(table, "brewery_type", pc.if_else(known, brewery_type, UNKNOWN_BREWERY_TYPE))
+    logger.info("Tipo de cervejaria (brewery_type) padronizado.")
+    return table
+
+
+def drop_redundant_columns(table: pa.Table) -> pa.Table:
+    """
+    Remove colunas que são majoritariamente nulas ou redundantes.
+    """
+    cols_to_drop = [c for c in REDUNDANT_COLUMNS if c in table.column_names]
+    table = table.drop_columns(cols_to_drop)
+    logger.info(f"Colunas redundantes removidas: {cols_to_drop}")
+    return table
+
+
+def categorize(table: pa.Table) -> pa.Table:
+    """
+    Codifica as colunas de baixa cardinalidade como arrays de dicionário (ver 'schema.py').
+    """
+    table = apply_dictionary_schema(table)
+    logger.info("Colunas de baixa cardinalidade convertidas para categóricas.")
+    return table
+
+
+def add_metadata(table: pa.Table) -> pa.Table:
+    """
+    Adiciona uma coluna 'processed_at' com o timestamp do processamento.
+    """
+    processed_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    table = table.append_column("processed_at", pa.repeat(processed_at, table.num_rows))
+    logger.info("Metadados (processed_at) adicionados.")
+    return table
+
+
+def transform(table: pa.Table) -> pa.Table:
+    """
+    Aplica todas as transformações da camada Silver em ordem (equivalente a 'silver.transform').
+
+    Args:
+        table (pa.Table): Tabela bruta.
+
+    Returns:
+        pa.Table: Tabela transformada.
+    """
+    table = deduplicate(table)
+    table = clean_strings(table)
+    table = normalize_phone(table)
+    table = normalize_postal_code(table)
+    table = validate_coordinates(table)
+    table = standardize_brewery_type(table)
+    table = drop_redundant_columns(table)
+    table = categorize(table)
+    table = add_metadata(table)
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Escrita dos Dados
+# ---------------------------------------------------------------------------
+
+def write_partition_file(table: pa.Table, silver_dir: str, brewery_type: str, file_name: str,
+                         write_csv: bool = WRITE_CSV_COPIES) -> str:
+    """
+    Grava um arquivo Parquet na partição 'brewery_type=<tipo>' (e, se 'write_csv',
+    o CSV correspondente), equivalente a 'silver.write_partition_file'.
+
+    Returns:
+        str: Caminho do Parquet relativo ao diretório Silver.
+    """
+    relpath = os.path.join(f"brewery_type={brewery_type}", file_name)
+    file_path = os.path.join(silver_dir, relpath)
+
+    with atomic_path(file_path) as tmp_path:
+        pq.write_table(table, tmp_path)
+    if write_csv:
+        with atomic_path(file_path.replace(".parquet", ".csv")) as tmp_path:
+            pacsv.write_csv(decode_dictionaries(table), tmp_path, pacsv.WriteOptions(quoting_style="needed"))
+
+    logger.info(
+        f"Salvos {table.num_rows} registros -> {file_path}" + (" (Parquet & CSV)" if write_csv else "")
+    )
+    return relpath
+
+
+def save_silver(table: pa.Table, silver_dir: str = SILVER_DIR, write_csv: bool = WRITE_CSV_COPIES,
+                max_workers: int = SILVER_WRITE_WORKERS) -> None:
+    """
+    Grava a tabela transformada em arquivos Parquet particionados por 'brewery_type',
+    com o mesmo layout de 'silver.save_silver' (partições gravadas em paralelo),
+    e publica uma nova versão no manifesto.
+
+    Args:
+        table (pa.Table): Tabela transformada.
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        write_csv (bool): Se True, grava também uma cópia CSV de cada partição.
+        max_workers (int): Máximo de partições gravadas simultaneamente (1 = sequencial).
+    """
+    os.makedirs(silver_dir, exist_ok=True)
+    file_name = f"breweries_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+
+    brewery_types = pc.cast(table["brewery_type"], pa.string())
+    groups = (
+        (brewery_type, table.filter(pc.equal(brewery_types, brewery_type)))
+        for brewery_type in sorted(pc.unique(brewery_types).drop_null().to_pylist())
+    )
+    partitions = write_partitions(
+        lambda brewery_type, group: write_partition_file(group, silver_dir, brewery_type, file_name, write_csv),
+        groups,
+        max_workers,
+    )
+
+    total_written = int(pc.sum(pc.is_valid(brewery_types)).as_py() or 0)
+    commit_silver_version(silver_dir, partitions, "overwrite", records=total_written)
+    logger.info(f"Camada Silver concluida. Total de registros gravados: {total_written}")
+    print(f"Camada Silver concluida! {total_written} registros gravados em: {silver_dir}")
@@ -0,0 +1,176 @@
+"""
+snapshot.py – Snapshot Arrow IPC da versão atual da camada Silver.
+
+A Silver é consolidada em um único arquivo Arrow IPC (formato Feather v2, sem
+compressão), com as colunas de baixa cardinalidade como dicionários únicos e
+ordenados (ver 'schema.py'). O arquivo é aberto com memory map: a leitura não
+decodifica nem copia os dados, e processos diferentes (Gold, verificador,
+notebooks) compartilham as mesmas páginas pelo cache do sistema operacional.
+
+O snapshot pertence a uma versão do manifesto da Silver: um ponteiro
+('SILVER_SNAPSHOT_FILE') registra a versão e o arquivo, e é substituído
+atomicamente depois que o novo arquivo está gravado. Um snapshot de outra
+versão é ignorado pelos leitores, que voltam aos arquivos Parquet.
+
+Uso:
+    python snapshot.py                 # atualiza o snapshot, se necessário
+    python snapshot.py --force
+"""
+
+import os
+import glob
+import logging
+import argparse
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import SILVER_DIR, SILVER_READ_WORKERS, SILVER_SNAPSHOT_FILE
+from schema import apply_dictionary_schema, decode_dictionaries
+from storage import atomic_path, atomic_write_json, read_json, read_silver_manifest, list_silver_files
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Leitura
+# ---------------------------------------------------------------------------
+
+def open_silver_snapshot(silver_dir: str = SILVER_DIR, columns: list = None):
+    """
+    Abre, com memory map, o snapshot da versão atual da Silver.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        columns (list, opcional): Colunas a selecionar (as ausentes são ignoradas). Padrão: todas.
+
+    Returns:
+        pa.Table ou None: Tabela consolidada, ou None se não houver snapshot da
+        versão atual do manifesto.
+    """
+    pointer = read_json(os.path.join(silver_dir, SILVER_SNAPSHOT_FILE))
+    manifest = read_silver_manifest(silver_dir)
+    if pointer is None or manifest is None or pointer["silver_version"] != manifest["version"]:
+        return None
+
+    path = os.path.join(silver_dir, pointer["file"])
+    try:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except FileNotFoundError:
+        return None
+    if columns is not None:
+        table = table.select([c for c in columns if c in table.column_names])
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Escrita
+# ---------------------------------------------------------------------------
+
+def _read_file(file_path: str) -> pa.Table:
+    """Lê um arquivo Silver, recuperando 'brewery_type' do nome da pasta se ausente."""
+    table = pq.read_table(file_path).replace_schema_metadata(None)
+    if "brewery_type" not in table.column_names:
+        btype = os.path.basename(os.path.dirname(file_path)).split("=", 1)[-1]
+        table = table.append_column("brewery_type", pa.repeat(btype, table.num_rows))
+    return table
+
+
+def build_silver_snapshot(silver_dir: str = SILVER_DIR, max_workers: int = SILVER_READ_WORKERS):
+    """
+    Consolida a versão atual da Silver em um novo snapshot e o publica.
+
+    Os arquivos são lidos em paralelo e concatenados na ordem de
+    'storage.list_silver_files' (a mesma de 'gold.load_silver'). Snapshots
+    anteriores são removidos após a publicação; leitores que já os abriram
+    continuam lendo o mapeamento até fechá-lo.
+
+    Args:
+        silver_dir (str): Caminho para o diretório da camada Silver.
+        max_workers (int): Máximo de arquivos lidos simultaneamente.
+
+    Returns:
+        dict ou None: Ponteiro publicado, ou None se a Silver não tiver manifesto
+        (layout legado) ou arquivos.
+    """
+    manifest = read_silver_manifest(silver_dir)
+    files = list_silver_files(silver_dir)
+    if manifest is None or not files:
+        logger.warning(f"Snapshot Silver ignorado: {silver_dir} não possui manifesto ou arquivos.")
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="snapshot") as executor:
+        tables = list(executor.map(_read_file, files))
+    try:
+        table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        table = pa.concat_tables([decode_dictionaries(t) for t in tables], promote_options="permissive")
+    # Um único dicionário por coluna, como exige o formato de arquivo IPC
+    table = apply_dictionary_schema(table)
+
+    snapshot_dir = os.path.join(silver_dir, os.path.dirname(SILVER_SNAPSHOT_FILE))
+    relpath = os.path.join(os.path.dirname(SILVER_SNAPSHOT_FILE), f"silver_v{manifest['version']:06d}.arrow")
+    with atomic_path(os.path.join(silver_dir, relpath)) as tmp_path:
+        with pa.ipc.new_file(tmp_path, table.schema) as writer:
+            writer.write_table(table)
+
+    pointer = {
+        "silver_version": manifest["version"],
+        "file": relpath,
+        "rows": table.num_rows,
+        "bytes": os.path.getsize(os.path.join(silver_dir, relpath)),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    atomic_write_json(os.path.join(silver_dir, SILVER_SNAPSHOT_FILE), pointer)
+
+    for old_path in glob.glob(os.path.join(snapshot_dir, "silver_v*.arrow")):
+        if os.path.normpath(old_path) != os.path.normpath(os.path.join(silver_dir, relpath)):
+            os.remove(old_path)
+
+    logger.info(
+        f"Snapshot Silver publicado: versão {manifest['version']}, {table.num_rows} registros "
+        f"de {len(files)} arquivo(s), {pointer['bytes'] / 2 ** 20:.2f} MB."
+    )
+    return pointer
+
+
+def refresh_silver_snapshot(silver_dir: str = SILVER_DIR, force: bool = False):
+    """
+    Gera o snapshot se ele não corresponder à versão atual do manifesto da Silver.
+
+    Returns:
+        dict ou None: Ponteiro do snapshot atual (None se não houver snapshot possível).
+    """
+    pointer = read_json(os.path.join(silver_dir, SILVER_SNAPSHOT_FILE))
+    manifest = read_silver_manifest(silver_dir)
+    current = (
+        pointer is not None and manifest is not None
+        and pointer["silver_version"] == manifest["version"]
+        and os.path.exists(os.path.join(silver_dir, pointer["file"]))
+    )
+    if current and not force:
+        return pointer
+    return build_silver_snapshot(silver_dir)
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot Arrow IPC da versão atual da camada Silver.")
+    parser.add_argument("--silver-dir", default=SILVER_DIR)
+    parser.add_argument("--force", action="store_true", help="Regrava o snapshot mesmo se estiver atual.")
+    args = parser.parse_args()
+
+    pointer = refresh_silver_snapshot(args.silver_dir, force=args.force)
+    if pointer is None:
+        print("Nenhum snapshot gerado (Silver sem manifesto ou vazia).")
+    else:
+        print(
+            f"Snapshot da versão {pointer['silver_version']}: {pointer['rows']} registros, "
+            f"{pointer['bytes'] / 2 ** 20:.2f} MB em {os.path.join(args.silver_dir, pointer['file'])}"
+        )
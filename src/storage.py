@@ -0,0 +1,314 @@
+"""
+storage.py – Utilitários de leitura e escrita em disco compartilhados pelas camadas do Data Lake.
+
+As escritas de arquivos completos são atômicas: o conteúdo é gravado em um
+arquivo temporário no mesmo diretório e depois movido para o destino com
+'os.replace', de modo que leitores nunca enxergam um arquivo parcialmente escrito.
+
+Arquivos NDJSON (um registro JSON por linha) são gravados em blocos anexados ao
+final do arquivo. Com compressão, cada bloco é um membro gzip / frame zstd
+independente, o que permite anexar sem reescrever e ler tudo como um único fluxo.
+"""
+
+import io
+import os
+import csv
+import glob
+import gzip
+import json
+import tempfile
+from contextlib import contextmanager
+
+from config import SILVER_MANIFEST_FILE, GOLD_MANIFEST_FILE
+
+try:
+    import zstandard
+except ImportError:  # Dependência opcional, necessária apenas para compressão 'zstd'
+    zstandard = None
+
+
+# ---------------------------------------------------------------------------
+# Escrita Atômica
+# ---------------------------------------------------------------------------
+
+def _read_umask() -> int:
+    """Lê a umask do processo (os.umask só permite lê-la trocando o valor)."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Lida uma única vez, na importação: trocar a umask durante escritas em outras
+# threads afetaria as permissões dos arquivos criados por elas
+_UMASK = _read_umask()
+
+# Permissões dos arquivos gravados, as mesmas de um 'open(path, "w")'
+FILE_MODE = 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_path(path: str):
+    """
+    Fornece um caminho temporário no diretório de 'path'. Ao final do bloco,
+    o arquivo temporário substitui 'path' atomicamente; em caso de erro, é removido.
+
+    O 'mkstemp' cria o temporário com permissão 0600; antes da troca ele recebe
+    as permissões de um arquivo comum ('FILE_MODE'), para que leitores de
+    outros usuários (workers, dashboards) continuem enxergando os dados.
+
+    Exemplo:
+        with atomic_path(file_path) as tmp_path:
+            df.to_parquet(tmp_path)
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, obj) -> None:
+    """
+    Grava 'obj' como JSON em 'path' de forma atômica.
+
+    Args:
+        path (str): Caminho de destino.
+        obj: Objeto serializável em JSON.
+    """
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def read_json(path: str, default=None):
+    """
+    Lê um arquivo JSON, retornando 'default' se ele não existir.
+    """
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------------------------------------------------------------------------
+# NDJSON (JSON delimitado por linhas), opcionalmente comprimido
+# ---------------------------------------------------------------------------
+
+# Extensão de arquivo associada a cada compressão suportada
+COMPRESSION_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+NDJSON_EXTENSIONS = tuple(f".ndjson{ext}" for ext in COMPRESSION_EXTENSIONS.values())
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError("A compressão 'zstd' requer o pacote 'zstandard' (pip install zstandard).")
+
+
+def compression_from_path(path: str):
+    """Retorna a compressão ('gzip', 'zstd' ou None) inferida pela extensão do arquivo."""
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def ndjson_file_name(base_name: str, compression=None) -> str:
+    """
+    Monta o nome de um arquivo NDJSON com a extensão da compressão escolhida.
+
+    Raises:
+        ValueError: Se a compressão não for suportada.
+    """
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(
+            f"Compressão não suportada: {compression}. Use uma de {list(COMPRESSION_EXTENSIONS)}."
+        )
+    return f"{base_name}.ndjson{COMPRESSION_EXTENSIONS[compression]}"
+
+
+def compress_block(payload: bytes, compression=None) -> bytes:
+    """
+    Comprime um bloco de bytes como um membro gzip / frame zstd independente.
+    """
+    if compression == "gzip":
+        return gzip.compress(payload, compresslevel=6)
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    return payload
+
+
+def encode_ndjson(records, compression=None) -> bytes:
+    """
+    Serializa uma lista de registros como um bloco NDJSON (comprimido, se solicitado).
+    """
+    payload = "".join(
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for record in records
+    ).encode("utf-8")
+    return compress_block(payload, compression)
+
+
+def append_block(path: str, block: bytes) -> int:
+    """
+    Anexa um bloco de bytes ao final de um arquivo e força a gravação em disco.
+
+    Returns:
+        int: Tamanho do arquivo, em bytes, após a escrita.
+    """
+    with open(path, "ab") as f:
+        f.write(block)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def append_ndjson(path: str, records, compression=None) -> int:
+    """
+    Anexa um bloco de registros ao final de um arquivo NDJSON e força a gravação em disco.
+
+    Args:
+        path (str): Caminho do arquivo (criado se não existir).
+        records (list): Registros a serem anexados.
+        compression (str, opcional): None, 'gzip' ou 'zstd'.
+
+    Returns:
+        int: Tamanho do arquivo, em bytes, após a escrita.
+    """
+    return append_block(path, encode_ndjson(records, compression))
+
+
+def open_text(path: str):
+    """
+    Abre um arquivo de texto para leitura, descomprimindo de acordo com a extensão.
+    """
+    compression = compression_from_path(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "zstd":
+        _require_zstandard()
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def iter_ndjson(path: str):
+    """
+    Lê um arquivo NDJSON registro a registro, sem carregá-lo inteiro em memória.
+
+    Yields:
+        dict: Um registro por linha não vazia.
+    """
+    with open_text(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_records_csv(iter_records, output: str) -> int:
+    """
+    Grava registros (dicionários) em CSV, em fluxo e com escrita atômica.
+
+    'iter_records' é chamado duas vezes e deve retornar um novo iterador a cada
+    chamada: a primeira passada reúne a união das colunas, na ordem em que
+    aparecem (colunas que só surgem em registros posteriores não são
+    descartadas); a segunda grava as linhas. Apenas os nomes das colunas ficam
+    em memória.
+
+    Returns:
+        int: Quantidade de registros gravados.
+    """
+    fieldnames = list(dict.fromkeys(key for record in iter_records() for key in record))
+    rows = 0
+    with atomic_path(output) as tmp_path, open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for record in iter_records():
+            writer.writerow(record)
+            rows += 1
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Manifesto da Camada Silver
+# ---------------------------------------------------------------------------
+
+def read_silver_manifest(silver_dir: str):
+    """
+    Lê o manifesto de versões da camada Silver ('_manifest.json').
+
+    Returns:
+        dict ou None: Manifesto atual, ou None se a Silver ainda não tiver um.
+    """
+    return read_json(os.path.join(silver_dir, SILVER_MANIFEST_FILE))
+
+
+def list_silver_files(silver_dir: str) -> list:
+    """
+    Lista os arquivos Parquet que compõem a versão atual da camada Silver.
+
+    Com manifesto, apenas os arquivos da versão publicada são retornados (arquivos
+    de versões anteriores ou de escritas em andamento são ignorados). Sem manifesto
+    (layout legado), todos os arquivos 'brewery_type=*/*.parquet' são retornados.
+    """
+    manifest = read_silver_manifest(silver_dir)
+    if manifest is None:
+        return sorted(glob.glob(os.path.join(silver_dir, "brewery_type=*", "*.parquet")))
+    return [
+        os.path.join(silver_dir, path)
+        for brewery_type in sorted(manifest["partitions"])
+        for path in manifest["partitions"][brewery_type]
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Manifesto da Camada Gold
+# ---------------------------------------------------------------------------
+
+def read_gold_manifest(gold_dir: str):
+    """
+    Lê o manifesto da camada Gold ('_manifest.json'), que aponta a versão
+    atual ("latest") de cada tabela.
+
+    Returns:
+        dict ou None: Manifesto atual, ou None se a Gold ainda não tiver um.
+    """
+    return read_json(os.path.join(gold_dir, GOLD_MANIFEST_FILE))
+
+
+def gold_table_path(gold_dir: str, table: str, fmt: str = "parquet"):
+    """
+    Caminho da versão atual de uma tabela Gold.
+
+    Com manifesto, o caminho vem diretamente da entrada da tabela (sem listar o
+    diretório). Sem manifesto (layout legado), vale o arquivo com o maior
+    timestamp no nome.
+
+    Args:
+        gold_dir (str): Caminho para o diretório da camada Gold.
+        table (str): Nome da tabela (ex.: 'top_cities_by_brewery_count').
+        fmt (str): 'parquet' ou 'csv'.
+
+    Returns:
+        str ou None: Caminho do arquivo, ou None se a tabela (nesse formato) não existir.
+    """
+    manifest = read_gold_manifest(gold_dir)
+    if manifest is None:
+        versions = sorted(glob.glob(os.path.join(gold_dir, f"{table}_????????_??????*.{fmt}")))
+        return versions[-1] if versions else None
+    entry = manifest["tables"].get(table)
+    if entry is None or entry.get(fmt) is None:
+        return None
+    return os.path.join(gold_dir, entry[fmt])
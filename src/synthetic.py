@@ -0,0 +1,467 @@
+"""
+synthetic.py – Gerador de dados sintéticos de cervejarias para testes de escala.
+
+Produz partições no formato da camada Bronze, de tamanho arbitrário (1M, 10M,
+100M+ registros), com o mesmo schema da API Open Brewery DB. As distribuições de
+'brewery_type', localização (país / estado / cidade), taxas de nulos e coordenadas
+são extraídas de um snapshot real da camada Bronze (perfil); sem snapshot, usa um
+perfil padrão.
+
+Os dados incluem a "sujeira" que a camada Silver precisa tratar: telefones
+formatados, códigos postais com espaços e minúsculas, tipos com caixa e espaços
+variados, coordenadas fora do intervalo e ids duplicados.
+
+As partições são gravadas em 'data/synthetic' (SYNTHETIC_DIR), não na Bronze de
+produção, com arquivos 'breweries_synthetic_*' e o marcador SYNTHETIC_MARKER_FILE;
+a camada Silver recusa partições com esse marcador (ver 'silver.list_bronze_files').
+
+A geração é vetorizada e feita em blocos determinísticos: o bloco 'b' depende
+apenas de (seed, b), então qualquer faixa de registros pode ser regenerada.
+
+Uso:
+    python synthetic.py --rows 1000000
+    python synthetic.py --rows 10000000 --compression zstd --output-dir /tmp/synthetic
+"""
+
+import os
+import glob
+import json
+import itertools
+import logging
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    BRONZE_DIR, BRONZE_COMPRESSION, BRONZE_CHECKPOINT_FILE, SYNTHETIC_DIR, SYNTHETIC_MARKER_FILE,
+)
+from storage import (
+    append_block, atomic_write_json, compress_block, iter_ndjson, ndjson_file_name, read_json,
+    NDJSON_EXTENSIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Colunas da API, na ordem em que são retornadas
+BRONZE_COLUMNS = [
+    "id", "name", "brewery_type", "address_1", "address_2", "address_3", "city",
+    "state_province", "postal_code", "country", "longitude", "latitude", "phone",
+    "website_url", "state", "street",
+]
+
+# Quantidade de registros por bloco determinístico
+BLOCK_SIZE = 100_000
+
+# Registros lidos do snapshot real para extrair o perfil (ver 'build_profile')
+PROFILE_SAMPLE_ROWS = 100_000
+
+# Perfil usado quando não há snapshot real disponível
+DEFAULT_PROFILE = {
+    "brewery_type": {
+        "micro": 0.5309, "brewpub": 0.2832, "planning": 0.0702, "closed": 0.039,
+        "regional": 0.0249, "contract": 0.0199, "large": 0.0122, "proprietor": 0.0074,
+        "taproom": 0.0049, "bar": 0.004, "nano": 0.0024, "cidery": 0.0008,
+        "beergarden": 0.0003, "location": 0.0001,
+    },
+    "locations": [
+        # país, estado, cidade, peso, longitude média, latitude média
+        ["United States", "California", "San Diego", 0.05, -117.16, 32.72],
+        ["United States", "Colorado", "Denver", 0.04, -104.99, 39.74],
+        ["United States", "Oregon", "Portland", 0.04, -122.68, 45.52],
+        ["United States", "Washington", "Seattle", 0.03, -122.33, 47.61],
+        ["United States", "Illinois", "Chicago", 0.03, -87.63, 41.88],
+        ["United States", "Texas", "Austin", 0.03, -97.74, 30.27],
+        ["United States", "New York", "Brooklyn", 0.02, -73.94, 40.68],
+        ["United States", "Michigan", "Grand Rapids", 0.02, -85.67, 42.96],
+        ["United States", "Pennsylvania", "Philadelphia", 0.02, -75.17, 39.95],
+        ["United States", "North Carolina", "Asheville", 0.02, -82.55, 35.6],
+        ["Australia", "New South Wales", "Sydney", 0.03, 151.21, -33.87],
+        ["Canada", "Ontario", "Toronto", 0.01, -79.38, 43.65],
+        ["South Africa", "Western Cape", "Cape Town", 0.01, 18.42, -33.92],
+        ["Ireland", "Dublin", "Dublin", 0.01, -6.26, 53.35],
+        ["England", "Greater London", "London", 0.01, -0.13, 51.51],
+        ["South Korea", "Seoul", "Seoul", 0.01, 126.98, 37.57],
+    ],
+    "null_rates": {
+        "address_1": 0.08, "address_2": 0.97, "address_3": 0.996, "postal_code": 0.0,
+        "coordinates": 0.248, "phone": 0.102, "website_url": 0.132,
+    },
+}
+
+# Taxas de "sujeira" injetada
+DIRTY_RATES = {
+    "brewery_type_case": 0.01,    # ex.: ' Micro ' / 'BREWPUB'
+    "postal_code": 0.02,          # ex.: ' d02 x285 '
+    "coordinates": 0.001,         # longitude/latitude fora do intervalo
+    "name_whitespace": 0.01,      # espaços nas pontas
+    "duplicate_id": 0.001,        # ids repetidos dentro do bloco
+}
+
+PHONE_FORMATS = ["plain", "dashes", "parens", "dots", "intl"]
+PHONE_FORMAT_WEIGHTS = [0.7, 0.1, 0.1, 0.05, 0.05]
+
+NAME_WORDS = np.array([
+    "Hop", "Barrel", "River", "Mountain", "Copper", "Iron", "Golden", "Wild", "Old",
+    "Red", "Black", "Lost", "Stone", "Oak", "Harbor", "Valley", "Northern", "Saint",
+])
+NAME_SUFFIXES = np.array([
+    "Brewing Co", "Brewery", "Beer Co", "Brewhouse", "Ales", "Taproom", "Craft Brewery",
+])
+STREET_NAMES = np.array([
+    "Main St", "Oak Ave", "Market St", "1st St", "Broadway", "Elm St", "Industrial Way",
+    "Park Blvd", "River Rd", "Commerce Dr",
+])
+
+
+# ---------------------------------------------------------------------------
+# Perfil (distribuições)
+# ---------------------------------------------------------------------------
+
+def find_profile_source(bronze_dir: str = BRONZE_DIR):
+    """
+    Retorna o arquivo completo mais recente da ingestão ('breweries_raw_*', CSV ou
+    NDJSON) na camada Bronze para extrair o perfil, ou None se não houver nenhum.
+
+    Partições sintéticas (com SYNTHETIC_MARKER_FILE), deltas da ingestão
+    incremental e o arquivo de uma ingestão incompleta (ver 'bronze.ingest')
+    são ignorados: nenhum deles representa a fonte real por inteiro.
+    """
+    for partition in sorted(glob.glob(os.path.join(bronze_dir, "ingestion_date=*")), reverse=True):
+        if os.path.exists(os.path.join(partition, SYNTHETIC_MARKER_FILE)):
+            continue
+        checkpoint = read_json(os.path.join(partition, BRONZE_CHECKPOINT_FILE)) or {}
+        incomplete = None if checkpoint.get("complete", True) else checkpoint.get("file")
+        candidates = [
+            path for path in glob.glob(os.path.join(partition, "breweries_raw_*"))
+            if path.endswith((".csv",) + NDJSON_EXTENSIONS) and os.path.basename(path) != incomplete
+        ]
+        if candidates:
+            return max(candidates)
+    return None
+
+
+def build_profile(source: str = None, sample_rows: int = PROFILE_SAMPLE_ROWS) -> dict:
+    """
+    Extrai as distribuições de um snapshot real da camada Bronze.
+
+    Apenas os primeiros 'sample_rows' registros do arquivo são lidos, de modo
+    que a memória usada não depende do tamanho do snapshot.
+
+    Args:
+        source (str, opcional): Arquivo CSV, JSON ou NDJSON. Se None, procura o mais
+            recente na camada Bronze (ver 'find_profile_source'); se nenhum existir,
+            retorna DEFAULT_PROFILE.
+        sample_rows (int): Quantidade máxima de registros lidos do snapshot.
+
+    Returns:
+        dict: Perfil com as distribuições de tipo, localização e nulos.
+    """
+    source = source or find_profile_source()
+    if source is None:
+        logger.info("Nenhum snapshot Bronze encontrado. Usando perfil padrão.")
+        return DEFAULT_PROFILE
+
+    if source.endswith(".csv"):
+        df = pd.read_csv(source, dtype=str, nrows=sample_rows)
+    elif source.endswith(NDJSON_EXTENSIONS):
+        df = pd.DataFrame(itertools.islice(iter_ndjson(source), sample_rows))
+    else:
+        # Formato legado (uma única lista JSON): não há leitura parcial
+        df = pd.read_json(source, dtype=False).head(sample_rows)
+    logger.info(f"Perfil extraído de {source} ({len(df)} registros).")
+
+    for coord in ("longitude", "latitude"):
+        df[coord] = pd.to_numeric(df[coord], errors="coerce")
+
+    types = df["brewery_type"].str.strip().str.lower().value_counts(normalize=True)
+    locations = (
+        df.groupby(["country", "state_province", "city"])
+        .agg(weight=("id", "size"), longitude=("longitude", "mean"), latitude=("latitude", "mean"))
+        .reset_index()
+    )
+    locations["weight"] = locations["weight"] / locations["weight"].sum()
+    locations = locations.astype(object).where(locations.notna(), None)
+
+    return {
+        "brewery_type": types.round(6).to_dict(),
+        "locations": locations.values.tolist(),
+        "null_rates": {
+            "address_1": float(df["address_1"].isna().mean()),
+            "address_2": float(df["address_2"].isna().mean()),
+            "address_3": float(df["address_3"].isna().mean()),
+            "postal_code": float(df["postal_code"].isna().mean()),
+            "coordinates": float(df["longitude"].isna().mean()),
+            "phone": float(df["phone"].isna().mean()),
+            "website_url": float(df["website_url"].isna().mean()),
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Geração
+# ---------------------------------------------------------------------------
+
+def _uuid4_strings(rng, n: int) -> np.ndarray:
+    """Gera 'n' UUIDs v4 em formato texto."""
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    flat = raw.tobytes().hex()
+    return np.array(
+        [
+            f"{flat[i:i + 8]}-{flat[i + 8:i + 12]}-{flat[i + 12:i + 16]}-"
+            f"{flat[i + 16:i + 20]}-{flat[i + 20:i + 32]}"
+            for i in range(0, 32 * n, 32)
+        ],
+        dtype=object,
+    )
+
+
+def _digits(rng, n: int, width: int) -> pd.Series:
+    """Gera 'n' sequências numéricas de 'width' dígitos (sem zero à esquerda)."""
+    low, high = 10 ** (width - 1), 10 ** width
+    return pd.Series(rng.integers(low, high, size=n)).astype(str)
+
+
+def _with_nulls(rng, values: pd.Series, rate: float) -> pd.Series:
+    """Anula aleatoriamente uma fração 'rate' dos valores."""
+    return values.mask(rng.random(len(values)) < rate, None)
+
+
+def _dirty_phones(rng, digits: pd.Series) -> pd.Series:
+    """Aplica formatações variadas (como na fonte real) a telefones de 10 dígitos."""
+    fmt = rng.choice(len(PHONE_FORMATS), size=len(digits), p=PHONE_FORMAT_WEIGHTS)
+    area, prefix, line = digits.str[:3], digits.str[3:6], digits.str[6:]
+    formatted = digits.copy()
+    formatted[fmt == 1] = (area + "-" + prefix + "-" + line)[fmt == 1]
+    formatted[fmt == 2] = ("(" + area + ") " + prefix + "-" + line)[fmt == 2]
+    formatted[fmt == 3] = (area + "." + prefix + "." + line)[fmt == 3]
+    formatted[fmt == 4] = ("+1 " + area + " " + prefix + " " + line)[fmt == 4]
+    return formatted
+
+
+def generate_block(block_index: int, size: int = BLOCK_SIZE, profile: dict = None,
+                   seed: int = 42) -> pd.DataFrame:
+    """
+    Gera um bloco determinístico de registros sintéticos.
+
+    Args:
+        block_index (int): Índice do bloco (o bloco depende apenas de seed e índice).
+        size (int): Quantidade de registros do bloco.
+        profile (dict, opcional): Perfil de distribuições (ver 'build_profile').
+        seed (int): Semente base.
+
+    Returns:
+        pd.DataFrame: Registros brutos, com as colunas de BRONZE_COLUMNS.
+    """
+    profile = profile or DEFAULT_PROFILE
+    rng = np.random.default_rng([seed, block_index])
+    null_rates = profile["null_rates"]
+
+    # Identificador (com alguns duplicados para exercitar a deduplicação)
+    ids = pd.Series(_uuid4_strings(rng, size))
+    dup = np.flatnonzero(rng.random(size) < DIRTY_RATES["duplicate_id"])
+    if len(dup):
+        ids[dup] = ids.values[rng.integers(0, size, size=len(dup))]
+
+    # Nome
+    names = pd.Series(
+        NAME_WORDS[rng.integers(0, len(NAME_WORDS), size)].astype(object) + " "
+        + NAME_WORDS[rng.integers(0, len(NAME_WORDS), size)].astype(object) + " "
+        + NAME_SUFFIXES[rng.integers(0, len(NAME_SUFFIXES), size)].astype(object)
+    )
+    padded = rng.random(size) < DIRTY_RATES["name_whitespace"]
+    names[padded] = "  " + names[padded] + " "
+
+    # Tipo de cervejaria
+    type_values = np.array(list(profile["brewery_type"]), dtype=object)
+    type_weights = np.array(list(profile["brewery_type"].values()), dtype=float)
+    types = pd.Series(type_values[rng.choice(len(type_values), size=size, p=type_weights / type_weights.sum())])
+    dirty = rng.random(size) < DIRTY_RATES["brewery_type_case"]
+    types[dirty] = " " + types[dirty].str.capitalize() + " "
+
+    # Localização (país / estado / cidade conjuntos)
+    locations = pd.DataFrame(
+        profile["locations"],
+        columns=["country", "state_province", "city", "weight", "longitude", "latitude"],
+    )
+    weights = locations["weight"].to_numpy(dtype=float)
+    loc = locations.iloc[rng.choice(len(locations), size=size, p=weights / weights.sum())].reset_index(drop=True)
+
+    # Endereço
+    street = pd.Series(
+        rng.integers(1, 20000, size).astype(str).astype(object) + " "
+        + STREET_NAMES[rng.integers(0, len(STREET_NAMES), size)].astype(object)
+    )
+    street = _with_nulls(rng, street, null_rates["address_1"])
+    address_2 = _with_nulls(rng, "Ste " + pd.Series(rng.integers(1, 500, size)).astype(str), null_rates["address_2"])
+    address_3 = _with_nulls(rng, "Unit " + pd.Series(rng.integers(1, 50, size)).astype(str), null_rates["address_3"])
+
+    # Código postal: 5 dígitos, às vezes com o sufixo '-dddd', às vezes "sujo"
+    postal = _digits(rng, size, 5)
+    plus4 = rng.random(size) < 0.6
+    postal[plus4] = postal[plus4] + "-" + _digits(rng, size, 4)[plus4]
+    dirty = rng.random(size) < DIRTY_RATES["postal_code"]
+    postal[dirty] = " d" + postal[dirty].str[:2] + " x" + postal[dirty].str[2:5] + " "
+    postal = _with_nulls(rng, postal, null_rates["postal_code"])
+
+    # Coordenadas ao redor do centro da cidade, com nulos e valores inválidos
+    base_lon = loc["longitude"].astype(float).fillna(0.0).to_numpy()
+    base_lat = loc["latitude"].astype(float).fillna(0.0).to_numpy()
+    longitude = np.round(base_lon + rng.normal(0, 0.05, size), 8)
+    latitude = np.round(base_lat + rng.normal(0, 0.05, size), 8)
+    invalid = rng.random(size) < DIRTY_RATES["coordinates"]
+    longitude[invalid] = longitude[invalid] + 400.0
+    missing = rng.random(size) < null_rates["coordinates"]
+    longitude[missing] = np.nan
+    latitude[missing] = np.nan
+
+    # Telefone e site
+    phones = _with_nulls(rng, _dirty_phones(rng, _digits(rng, size, 10)), null_rates["phone"])
+    slugs = names.str.strip().str.lower().str.replace(" ", "", regex=False)
+    websites = _with_nulls(rng, "http://www." + slugs + ".com", null_rates["website_url"])
+
+    return pd.DataFrame({
+        "id": ids,
+        "name": names,
+        "brewery_type": types,
+        "address_1": street,
+        "address_2": address_2,
+        "address_3": address_3,
+        "city": loc["city"],
+        "state_province": loc["state_province"],
+        "postal_code": postal,
+        "country": loc["country"],
+        "longitude": longitude,
+        "latitude": latitude,
+        "phone": phones,
+        "website_url": websites,
+        "state": loc["state_province"],
+        "street": street,
+    }, columns=BRONZE_COLUMNS)
+
+
+def iter_blocks(rows: int, block_size: int = BLOCK_SIZE, profile: dict = None, seed: int = 42):
+    """
+    Gera 'rows' registros sintéticos em blocos determinísticos.
+
+    Yields:
+        pd.DataFrame: Blocos de até 'block_size' registros.
+    """
+    profile = profile or build_profile()
+    for block_index, start in enumerate(range(0, rows, block_size)):
+        yield generate_block(block_index, min(block_size, rows - start), profile, seed)
+
+
+def block_records(df: pd.DataFrame) -> list:
+    """Converte um bloco em lista de dicionários, com None no lugar de NaN."""
+    return json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+# ---------------------------------------------------------------------------
+# Escrita na Camada Bronze
+# ---------------------------------------------------------------------------
+
+def generate_bronze(rows: int, bronze_dir: str = SYNTHETIC_DIR, fmt: str = "ndjson",
+                    compression=BRONZE_COMPRESSION, block_size: int = BLOCK_SIZE,
+                    seed: int = 42, profile_source: str = None, partition_date: str = None) -> str:
+    """
+    Grava uma partição Bronze sintética com 'rows' registros e o marcador
+    SYNTHETIC_MARKER_FILE, que impede a partição de ser processada pela Silver
+    sem 'allow_synthetic=True'.
+
+    Args:
+        rows (int): Quantidade de registros.
+        bronze_dir (str): Diretório de destino. Padrão: SYNTHETIC_DIR (fora da
+            Bronze de produção).
+        fmt (str): 'ndjson' (formato da ingestão) ou 'json' (lista JSON legada).
+        compression (str, opcional): None, 'gzip' ou 'zstd' (apenas para 'ndjson').
+        block_size (int): Registros gerados e gravados por bloco.
+        seed (int): Semente para geração reprodutível.
+        profile_source (str, opcional): Snapshot usado para extrair as distribuições.
+        partition_date (str, opcional): Data da partição (AAAA-MM-DD). Padrão: hoje.
+
+    Returns:
+        str: Caminho do arquivo gerado.
+
+    Raises:
+        ValueError: Se o formato não for suportado ou se o destino for a Bronze de produção.
+    """
+    if os.path.abspath(bronze_dir) == os.path.abspath(BRONZE_DIR):
+        raise ValueError(f"Dados sintéticos não podem ser gravados na Bronze de produção: {bronze_dir}")
+
+    if fmt not in ("ndjson", "json"):
+        raise ValueError(f"Formato não suportado: {fmt}. Use 'ndjson' ou 'json'.")
+
+    timestamp = datetime.now()
+    partition_date = partition_date or timestamp.strftime("%Y-%m-%d")
+    partition_path = os.path.join(bronze_dir, f"ingestion_date={partition_date}")
+    os.makedirs(partition_path, exist_ok=True)
+
+    base_name = f"breweries_synthetic_{timestamp.strftime('%H%M%S')}"
+    if fmt == "ndjson":
+        file_path = os.path.join(partition_path, ndjson_file_name(base_name, compression))
+    else:
+        file_path = os.path.join(partition_path, f"{base_name}.json")
+
+    # O marcador é gravado antes dos dados: nem uma geração interrompida deixa
+    # uma partição sintética sem identificação
+    atomic_write_json(os.path.join(partition_path, SYNTHETIC_MARKER_FILE), {
+        "file": os.path.basename(file_path),
+        "rows": rows,
+        "seed": seed,
+        "format": fmt,
+        "compression": compression if fmt == "ndjson" else None,
+        "profile_source": profile_source or find_profile_source(),
+        "generated_at": timestamp.isoformat(timespec="seconds"),
+    })
+
+    profile = build_profile(profile_source)
+    blocks = iter_blocks(rows, block_size, profile, seed)
+    if fmt == "ndjson":
+        for block in blocks:
+            payload = block.to_json(orient="records", lines=True, force_ascii=False)
+            if not payload.endswith("\n"):
+                payload += "\n"
+            append_block(file_path, compress_block(payload.encode("utf-8"), compression))
+    else:
+        # Formato legado: uma única lista JSON (não recomendado em grandes volumes)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for i, block in enumerate(blocks):
+                body = block.to_json(orient="records", force_ascii=False)[1:-1]
+                if body:
+                    f.write(("," if i else "") + body)
+            f.write("]")
+
+    logger.info(f"Partição sintética gerada: {rows} registros em {file_path}")
+    return file_path
+
+
+# ---------------------------------------------------------------------------
+# Ponto de Entrada
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera partições Bronze sintéticas para testes de escala.")
+    parser.add_argument("--rows", type=int, required=True, help="Quantidade de registros.")
+    parser.add_argument("--output-dir", default=SYNTHETIC_DIR,
+                        help="Diretório de destino (nunca a Bronze de produção).")
+    parser.add_argument("--format", dest="fmt", choices=["ndjson", "json"], default="ndjson")
+    parser.add_argument("--compression", choices=["none", "gzip", "zstd"], default=BRONZE_COMPRESSION or "none")
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--profile-source", help="Snapshot Bronze real usado como perfil.")
+    parser.add_argument("--partition-date", help="Data da partição (AAAA-MM-DD).")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    start = datetime.now()
+    path = generate_bronze(
+        args.rows, args.output_dir, args.fmt,
+        None if args.compression == "none" else args.compression,
+        args.block_size, args.seed, args.profile_source, args.partition_date,
+    )
+    print(f"{args.rows} registros sintéticos gravados em {path} ({datetime.now() - start})")
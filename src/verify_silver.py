@@ -1,18 +1,26 @@
 import pandas as pd
-import glob
 import os
 
+from storage import list_silver_files
+from snapshot import open_silver_snapshot
+
 # Configuração de caminhos base
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SILVER_DIR = os.path.join(BASE_DIR, 'data', 'silver')
 
-# Busca todos os arquivos Parquet na camada Silver
-files = glob.glob(os.path.join(SILVER_DIR, '**', '*.parquet'), recursive=True)
+# Busca os arquivos Parquet da versão atual da camada Silver
+files = list_silver_files(SILVER_DIR)
 print(f'Arquivos Parquet encontrados: {len(files)}')
 
 if files:
-    # Consolida todos os arquivos em um único DataFrame para verificação
-    df = pd.concat([pd.read_parquet(f) for f in files])
+    # Usa o snapshot Arrow IPC da versão atual (memory map) ou, na falta dele,
+    # consolida todos os arquivos em um único DataFrame para verificação
+    snapshot = open_silver_snapshot(SILVER_DIR)
+    if snapshot is not None:
+        print('Fonte: snapshot Arrow IPC da versão atual')
+        df = snapshot.to_pandas()
+    else:
+        df = pd.concat([pd.read_parquet(f) for f in files])
     print(f'Total de registros: {len(df)}')
     print(f'Colunas: {list(df.columns)}')
     print(f'IDs Nulos: {df["id"].isnull().sum()}')
@@ -0,0 +1,63 @@
+"""
+conftest.py – Configuração compartilhada dos testes do Data Lake.
+
+Os módulos de 'src/' são importados diretamente (como em 'pipeline.py') e
+todos os testes gravam em diretórios temporários, nunca em 'data/'.
+"""
+
+import os
+import sys
+import logging
+
+import pytest
+
+# Os loggers das camadas chamam 'logging.basicConfig(filename=...)' na importação;
+# com um handler já configurado essa chamada não faz nada e os testes não
+# gravam arquivos em 'logs/'
+logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pandas as pd  # noqa: E402
+
+import mock_api  # noqa: E402
+import synthetic  # noqa: E402
+from schema import CATEGORICAL_COLUMNS  # noqa: E402
+from storage import append_ndjson  # noqa: E402
+
+
+def make_records(size: int, seed: int = 7) -> list:
+    """Registros sintéticos no formato da API (perfil padrão, com a "sujeira" da Silver)."""
+    return synthetic.block_records(synthetic.generate_block(0, size, synthetic.DEFAULT_PROFILE, seed))
+
+
+def fixture_dataset(path: str, records: list) -> mock_api.FixtureDataset:
+    """Grava os registros em um arquivo NDJSON e o carrega como conjunto do servidor simulado."""
+    append_ndjson(path, records)
+    return mock_api.FixtureDataset(path)
+
+
+def silver_frame(silver_dir: str) -> pd.DataFrame:
+    """
+    Conteúdo da versão atual da Silver, comparável entre execuções: sem
+    'processed_at', categóricas como texto, linhas ordenadas por 'id'.
+    """
+    from gold import load_silver
+
+    df = load_silver(silver_dir, use_snapshot=False).drop(columns="processed_at")
+    df = df.astype({c: object for c in CATEGORICAL_COLUMNS if c in df.columns})
+    return df[sorted(df.columns)].sort_values("id").reset_index(drop=True)
+
+
+@pytest.fixture
+def records():
+    return make_records(600)
+
+
+@pytest.fixture
+def lake(tmp_path):
+    """Diretórios Bronze, Silver e Gold de um Data Lake temporário."""
+    dirs = {layer: str(tmp_path / layer) for layer in ("bronze", "silver", "gold")}
+    for path in dirs.values():
+        os.makedirs(path)
+    return dirs
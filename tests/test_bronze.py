@@ -0,0 +1,91 @@
+"""
+Ingestão da camada Bronze contra o servidor simulado ('mock_api.py').
+"""
+
+import os
+import asyncio
+
+import pytest
+
+import bronze
+from mock_api import SyntheticDataset, run_mock_server
+from storage import iter_ndjson
+from synthetic import DEFAULT_PROFILE
+
+
+@pytest.fixture
+def dataset():
+    return SyntheticDataset(1_000, seed=3, profile=DEFAULT_PROFILE)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Backoff curto para que as novas tentativas não atrasem os testes."""
+    monkeypatch.setattr(bronze, "API_BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(bronze, "API_BACKOFF_MAX", 0.01)
+
+
+def test_pages_are_delivered_in_order(dataset):
+    with run_mock_server(dataset, latency=0.005, jitter=0.02, seed=1) as server:
+        pages = list(bronze.iter_pages(server.url, per_page=50, max_workers=8, rate_limit=None))
+        data = bronze.fetch_data(server.url, per_page=50, max_workers=8, rate_limit=None)
+
+    assert [page for page, _ in pages] == list(range(1, 21))
+    assert [r for _, records in pages for r in records] == dataset.slice(0, 1_000)
+    assert data == dataset.slice(0, 1_000)
+
+
+def test_async_pages_are_delivered_in_order(dataset):
+    with run_mock_server(dataset, latency=0.005, jitter=0.02, seed=1) as server:
+        data = asyncio.run(bronze.fetch_data_async(server.url, per_page=50, max_concurrency=8, rate_limit=None))
+
+    assert data == dataset.slice(0, 1_000)
+
+
+@pytest.mark.parametrize("mode", ["threads", "async"])
+def test_throttled_and_failed_requests_are_retried(dataset, mode):
+    options = {"throttle_rate": 0.2, "error_rate": 0.1, "retry_after": 0.01, "seed": 5}
+    with run_mock_server(dataset, **options) as server:
+        if mode == "threads":
+            data = bronze.fetch_data(server.url, per_page=50, rate_limit=None)
+        else:
+            data = asyncio.run(bronze.fetch_data_async(server.url, per_page=50, rate_limit=None))
+        stats = dict(server.stats)
+
+    assert data == dataset.slice(0, 1_000)
+    assert stats["throttled"] > 0 and stats["errors"] > 0
+
+
+def test_retry_after_is_respected():
+    assert bronze._retry_delay(0, "2") >= 2
+    assert bronze._parse_retry_after("invalid") is None
+
+
+def test_non_retryable_status_fails_without_retries(dataset):
+    with run_mock_server(dataset) as server:
+        with pytest.raises(Exception, match="404"):
+            bronze.fetch_page(server.url.replace("/v1/breweries", "/unknown"), 1)
+
+
+def test_ingest_resumes_from_failed_page(dataset, tmp_path):
+    bronze_dir = str(tmp_path / "bronze")
+    # A página 12 falha enquanto as anteriores ainda estão em andamento
+    with run_mock_server(dataset, latency=0.2, fail_pages={12}) as server:
+        with pytest.raises(Exception, match="503"):
+            bronze.ingest(server.url, bronze_dir, per_page=50, max_workers=8, rate_limit=None)
+
+        partition, checkpoint = bronze.find_resumable_checkpoint(server.url, 50, bronze_dir)
+        # Todas as páginas contíguas anteriores à falha foram confirmadas
+        assert checkpoint["last_page"] == 11
+        assert checkpoint["records"] == 550
+
+        server.fail_pages.clear()
+        served_before = server.stats["records_served"]
+        final = bronze.ingest(server.url, bronze_dir, per_page=50, max_workers=8, rate_limit=None)
+        served_after = server.stats["records_served"] - served_before
+
+    assert final["complete"] and final["run_id"] == checkpoint["run_id"]
+    assert final["last_page"] == 20 and final["records"] == 1_000
+    # A retomada não baixa de novo as páginas já confirmadas
+    assert served_after == 450
+    assert list(iter_ndjson(os.path.join(partition, final["file"]))) == dataset.slice(0, 1_000)
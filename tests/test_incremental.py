@@ -0,0 +1,88 @@
+"""
+Ingestão incremental (CDC) e aplicação dos deltas na Silver.
+"""
+
+import os
+import glob
+
+import pandas as pd
+
+import bronze
+import silver
+from mock_api import run_mock_server
+from storage import iter_ndjson
+
+from conftest import fixture_dataset, make_records, silver_frame
+
+
+def _age_partitions(bronze_dir):
+    """Move as partições existentes para uma data antiga, deixando a de hoje para o delta."""
+    for i, partition in enumerate(sorted(glob.glob(os.path.join(bronze_dir, "ingestion_date=*")))):
+        os.rename(partition, os.path.join(bronze_dir, f"ingestion_date=2000-01-{i + 1:02d}"))
+
+
+def _ingest_incremental(tmp_path, name, records, bronze_dir):
+    with run_mock_server(fixture_dataset(str(tmp_path / name), records)) as server:
+        return bronze.ingest_incremental(server.url, bronze_dir, per_page=50, rate_limit=None)
+
+
+def test_duplicate_ids_are_compared_by_last_occurrence(tmp_path, lake):
+    base = make_records(300)
+    repeated, updated = dict(base[10]), dict(base[20])
+    # Fonte com ids repetidos: vale a última ocorrência de cada um
+    source = base + [dict(repeated, name="Stale Name"), repeated, base[20]]
+
+    with run_mock_server(fixture_dataset(str(tmp_path / "v1.ndjson"), source)) as server:
+        bronze.ingest(server.url, lake["bronze"], per_page=50, rate_limit=None)
+    _age_partitions(lake["bronze"])
+
+    # Mesma fonte: nenhuma alteração, mesmo com ids repetidos
+    run = _ingest_incremental(tmp_path, "v2.ndjson", source, lake["bronze"])
+    assert run["counts"] == {"insert": 0, "update": 0, "delete": 0, "unchanged": 300}
+    assert run["file"] is None
+
+    # A primeira ocorrência de 'updated' muda, mas a última não: sem alteração.
+    # A última ocorrência de 'repeated' muda: a alteração traz a última ocorrência.
+    source = base + [dict(updated, city="Stale City"), updated, dict(repeated, name="Fresh Name")]
+    run = _ingest_incremental(tmp_path, "v3.ndjson", source, lake["bronze"])
+    assert run["counts"] == {"insert": 0, "update": 1, "delete": 0, "unchanged": 299}
+
+    partition = silver.latest_bronze_partition(lake["bronze"])
+    delta = list(iter_ndjson(os.path.join(partition, run["file"])))
+    assert delta == [{**repeated, "name": "Fresh Name", "_op": "update"}]
+    assert not glob.glob(os.path.join(partition, ".*.tmp"))
+
+
+def test_incremental_delta_merges_into_silver(tmp_path, lake):
+    base = make_records(400)
+    with run_mock_server(fixture_dataset(str(tmp_path / "v1.ndjson"), base)) as server:
+        bronze.ingest(server.url, lake["bronze"], per_page=50, rate_limit=None)
+    silver.process_silver(lake["bronze"], lake["silver"], snapshot=False)
+    _age_partitions(lake["bronze"])
+
+    changed = [dict(r) for r in base]
+    changed[0]["city"] = "Changed City"
+    changed[1]["brewery_type"] = "nano" if changed[1]["brewery_type"] != "nano" else "micro"
+    deleted_id = changed.pop(2)["id"]
+    changed += [dict(changed[3], name="Stale Name"), changed[3]]  # id repetido, sem alteração
+    changed.append(make_records(1, seed=99)[0])
+    run = _ingest_incremental(tmp_path, "v2.ndjson", changed, lake["bronze"])
+    assert run["counts"]["insert"] == 1
+    assert run["counts"]["update"] == 2
+    assert run["counts"]["delete"] == 1
+
+    # O modo padrão ("overwrite") detecta o delta e aplica como merge
+    silver.process_silver(lake["bronze"], lake["silver"], snapshot=False)
+    entry = silver.read_silver_manifest(lake["silver"])["history"][-1]
+    assert entry["operation"] == "merge"
+    assert (entry["inserted"], entry["updated"], entry["deleted"]) == (1, 2, 1)
+
+    # Mesmo resultado que uma Silver completa da fonte atual
+    expected_bronze, expected_silver = str(tmp_path / "expected_bronze"), str(tmp_path / "expected_silver")
+    with run_mock_server(fixture_dataset(str(tmp_path / "v3.ndjson"), changed)) as server:
+        bronze.ingest(server.url, expected_bronze, per_page=50, rate_limit=None)
+    silver.process_silver(expected_bronze, expected_silver, snapshot=False)
+
+    result = silver_frame(lake["silver"])
+    assert deleted_id not in set(result["id"])
+    pd.testing.assert_frame_equal(result, silver_frame(expected_silver))
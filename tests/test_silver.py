@@ -0,0 +1,175 @@
+"""
+Camada Silver: equivalência entre os motores, merge incremental, compactação
+e partições Bronze recusadas.
+"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import silver
+import silver_arrow
+import synthetic
+from compaction import compact_silver
+from storage import append_ndjson, atomic_write_json
+from config import BRONZE_CHECKPOINT_FILE, BRONZE_DIR
+
+from conftest import silver_frame
+
+
+def _write_partition(bronze_dir, records, date="2026-01-01", name="breweries_raw_100000"):
+    partition = os.path.join(bronze_dir, f"ingestion_date={date}")
+    os.makedirs(partition, exist_ok=True)
+    append_ndjson(os.path.join(partition, f"{name}.ndjson.gz"), records, "gzip")
+    return partition
+
+
+@pytest.fixture
+def bronze_dir(tmp_path, records):
+    bronze_dir = str(tmp_path / "bronze")
+    # Ids repetidos entre arquivos e lotes: vale a última ocorrência
+    _write_partition(bronze_dir, records[:400])
+    _write_partition(bronze_dir, [dict(r, name=f"{r['name']} v2") for r in records[350:]],
+                     name="breweries_raw_110000")
+    return bronze_dir
+
+
+def _process(tmp_path, bronze_dir, label, **options):
+    """Executa a Silver com as opções dadas e retorna o conteúdo e as partições publicadas."""
+    silver_dir = str(tmp_path / f"silver_{label}")
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False, **options)
+    return silver_frame(silver_dir), sorted(silver.read_silver_manifest(silver_dir)["partitions"])
+
+
+def test_arrow_engine_matches_pandas(tmp_path, records, bronze_dir):
+    expected, expected_partitions = _process(tmp_path, bronze_dir, "pandas")
+    result, partitions = _process(tmp_path, bronze_dir, "arrow", engine="arrow")
+
+    assert len(expected) == len({r["id"] for r in records})
+    pd.testing.assert_frame_equal(result, expected)
+    assert partitions == expected_partitions
+
+
+def test_streaming_matches_in_memory(tmp_path, bronze_dir):
+    expected, expected_partitions = _process(tmp_path, bronze_dir, "pandas")
+    # Lotes pequenos: ids repetidos caem em lotes diferentes
+    result, partitions = _process(tmp_path, bronze_dir, "streaming", streaming=True, batch_size=97)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert partitions == expected_partitions
+
+
+@pytest.mark.parametrize("phone, expected", [
+    ("(555) 123-4567", "5551234567"),
+    ("+1.555.123.4567", "15551234567"),
+    ("１２３-45", "45"),  # apenas dígitos ASCII
+    ("n/a", None),
+    (None, None),
+])
+def test_phone_normalization_matches_between_engines(phone, expected):
+    pandas_phone = silver.normalize_phone(pd.DataFrame({"phone": [phone, "1"]}))["phone"][0]
+    arrow_phone = silver_arrow.normalize_phone(pa.table({"phone": [phone, "1"]}))["phone"][0].as_py()
+    assert (None if pd.isna(pandas_phone) else pandas_phone) == arrow_phone == expected
+
+
+def test_merge_of_full_snapshot_rewrites_only_changed_ids(tmp_path, records):
+    bronze_dir, silver_dir = str(tmp_path / "bronze"), str(tmp_path / "silver")
+    _write_partition(bronze_dir, records)
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False)
+    files_before = set(silver.list_silver_files(silver_dir))
+
+    # Mesmo snapshot em uma nova partição: nada muda
+    _write_partition(bronze_dir, records, date="2026-01-02")
+    entry = silver.merge_silver(bronze_dir, silver_dir)
+    assert (entry["inserted"], entry["updated"], entry["deleted"], entry["files_rewritten"]) == (0, 0, 0, 0)
+    assert entry["changes"] == {"inserted": [], "removed": None}
+    assert set(silver.list_silver_files(silver_dir)) == files_before
+
+    # Uma alteração, uma remoção e uma inserção: só os arquivos desses ids mudam
+    changed = [dict(r) for r in records]
+    changed[0]["city"] = "Changed City"
+    changed.pop(1)
+    changed.append(dict(changed[5], id="new-brewery-id"))
+    _write_partition(bronze_dir, changed, date="2026-01-03")
+    entry = silver.merge_silver(bronze_dir, silver_dir)
+
+    assert (entry["inserted"], entry["updated"], entry["deleted"]) == (1, 1, 1)
+    assert len(pd.read_parquet(os.path.join(silver_dir, entry["changes"]["removed"]))) == 2
+    assert entry["files_rewritten"] <= 2
+
+    expected_dir = str(tmp_path / "expected")
+    silver.save_silver(silver.transform(silver.load_latest_bronze(bronze_dir)), expected_dir)
+    pd.testing.assert_frame_equal(silver_frame(silver_dir), silver_frame(expected_dir))
+
+
+def test_compaction_rewrites_files_without_changing_rows(tmp_path, records):
+    bronze_dir, silver_dir = str(tmp_path / "bronze"), str(tmp_path / "silver")
+    _write_partition(bronze_dir, records)
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False)
+    # Um merge deixa arquivos pequenos ao lado dos originais
+    _write_partition(bronze_dir, [dict(r, city="Changed City") for r in records[:20]] + records[20:],
+                     date="2026-01-02")
+    silver.merge_silver(bronze_dir, silver_dir)
+    expected, files_before = silver_frame(silver_dir), silver.list_silver_files(silver_dir)
+
+    report = compact_silver(silver_dir, force=True)
+
+    assert report["partitions_compacted"]
+    assert report["after"]["files"] < report["before"]["files"] == len(files_before)
+    assert not set(silver.list_silver_files(silver_dir)) & set(files_before)
+    assert silver.read_silver_manifest(silver_dir)["history"][-1]["operation"] == "compact"
+    pd.testing.assert_frame_equal(silver_frame(silver_dir), expected)
+
+
+def test_incomplete_ingestion_is_never_applied_as_snapshot(tmp_path, records):
+    bronze_dir, silver_dir = str(tmp_path / "bronze"), str(tmp_path / "silver")
+    _write_partition(bronze_dir, records)
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False)
+
+    # Ingestão interrompida: só parte da fonte foi baixada
+    partial = [dict(r) for r in records[:100]]
+    partial[0]["city"] = "Changed City"
+    partition = _write_partition(bronze_dir, partial, date="2026-01-02")
+    atomic_write_json(os.path.join(partition, BRONZE_CHECKPOINT_FILE),
+                      {"run_id": "100000", "last_page": 2, "complete": False})
+
+    for options in [{}, {"mode": "merge"}]:
+        with pytest.raises(ValueError, match="incompleta"):
+            silver.process_silver(bronze_dir, silver_dir, snapshot=False, **options)
+    with pytest.raises(ValueError, match="incompleta"):
+        silver.merge_silver(bronze_dir, silver_dir)
+
+    # Com a permissão explícita, os dados disponíveis são aplicados sem remoções
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False, allow_incomplete=True)
+    entry = silver.read_silver_manifest(silver_dir)["history"][-1]
+    assert entry["operation"] == "merge"
+    assert entry["deleted"] == 0
+    result = silver_frame(silver_dir)
+    assert len(result) == len({r["id"] for r in records})
+    assert "Changed City" in set(result["city"])
+
+    # A partição não conta como aplicada: é aplicada de novo quando a ingestão terminar
+    _write_partition(bronze_dir, [dict(r) for r in records[100:]] + partial[1:], date="2026-01-02")
+    atomic_write_json(os.path.join(partition, BRONZE_CHECKPOINT_FILE),
+                      {"run_id": "100000", "last_page": 12, "complete": True})
+    assert silver.merge_silver(bronze_dir, silver_dir) is not None
+
+
+def test_synthetic_partitions_are_refused(tmp_path):
+    bronze_dir, silver_dir = str(tmp_path / "synthetic"), str(tmp_path / "silver")
+    path = synthetic.generate_bronze(500, bronze_dir=bronze_dir, compression=None, profile_source="",
+                                     partition_date="2026-01-01")
+    assert os.path.basename(path).startswith("breweries_synthetic_")
+
+    for options in [{}, {"engine": "arrow"}, {"streaming": True}, {"mode": "merge"}]:
+        with pytest.raises(ValueError, match="sintéticos"):
+            silver.process_silver(bronze_dir, silver_dir, snapshot=False, **options)
+    assert not os.path.exists(silver_dir)
+
+    silver.process_silver(bronze_dir, silver_dir, snapshot=False, allow_synthetic=True)
+    assert len(silver_frame(silver_dir)) > 0
+
+    with pytest.raises(ValueError, match="produção"):
+        synthetic.generate_bronze(10, bronze_dir=BRONZE_DIR)
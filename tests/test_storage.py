@@ -0,0 +1,50 @@
+"""
+Utilitários de escrita em disco ('storage.py').
+"""
+
+import os
+import csv
+import stat
+
+import pytest
+
+import storage
+
+
+def test_atomic_path_creates_regular_file_permissions(tmp_path):
+    path = str(tmp_path / "data.json")
+    storage.atomic_write_json(path, {"a": 1})
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == storage.FILE_MODE
+    assert storage.FILE_MODE & stat.S_IRUSR and storage.FILE_MODE & stat.S_IWUSR
+    assert storage.read_json(path) == {"a": 1}
+
+
+def test_atomic_path_discards_temporary_file_on_error(tmp_path):
+    path = str(tmp_path / "data.json")
+    with pytest.raises(RuntimeError):
+        with storage.atomic_path(path) as tmp:
+            open(tmp, "w").write("partial")
+            raise RuntimeError("falha")
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_ndjson_blocks_are_read_as_one_stream(tmp_path, compression):
+    path = str(tmp_path / storage.ndjson_file_name("records", compression))
+    storage.append_ndjson(path, [{"id": 1}, {"id": 2}], compression)
+    storage.append_ndjson(path, [{"id": 3, "name": "Cervejaria São João"}], compression)
+
+    assert list(storage.iter_ndjson(path)) == [{"id": 1}, {"id": 2}, {"id": 3, "name": "Cervejaria São João"}]
+
+
+def test_records_csv_header_is_the_union_of_all_columns(tmp_path):
+    records = [{"id": i, "name": f"b{i}"} for i in range(3)] + [{"id": 3, "website_url": "http://x"}]
+    path = str(tmp_path / "records.csv")
+
+    assert storage.write_records_csv(lambda: iter(records), path) == 4
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ["id", "name", "website_url"]
+    assert rows[3] == {"id": "3", "name": "", "website_url": "http://x"}
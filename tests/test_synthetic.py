@@ -0,0 +1,45 @@
+"""
+Gerador sintético ('synthetic.py'): escolha e leitura do snapshot usado como perfil.
+"""
+
+import os
+
+import synthetic
+from config import BRONZE_CHECKPOINT_FILE
+from storage import append_ndjson, atomic_write_json
+
+from conftest import make_records
+
+
+def _write(bronze_dir, date, name, records):
+    partition = os.path.join(bronze_dir, f"ingestion_date={date}")
+    os.makedirs(partition, exist_ok=True)
+    path = os.path.join(partition, f"{name}.ndjson.gz")
+    append_ndjson(path, records, "gzip")
+    return partition, path
+
+
+def test_profile_source_skips_synthetic_delta_and_incomplete_files(tmp_path):
+    bronze_dir = str(tmp_path / "bronze")
+    _, expected = _write(bronze_dir, "2026-01-01", "breweries_raw_100000", make_records(50))
+
+    # Ingestão incompleta e delta só com remoções na partição seguinte
+    partition, _ = _write(bronze_dir, "2026-01-02", "breweries_raw_100000", make_records(10))
+    atomic_write_json(os.path.join(partition, BRONZE_CHECKPOINT_FILE),
+                      {"file": "breweries_raw_100000.ndjson.gz", "complete": False})
+    _write(bronze_dir, "2026-01-02", "breweries_delta_110000", [{"id": "x", "_op": "delete"}])
+
+    synthetic.generate_bronze(20, bronze_dir=bronze_dir, compression=None, partition_date="2026-01-03",
+                              profile_source=expected)
+
+    assert synthetic.find_profile_source(bronze_dir) == expected
+
+
+def test_profile_reads_a_bounded_sample(tmp_path):
+    records = make_records(300)
+    for i, record in enumerate(records):
+        record["brewery_type"] = "micro" if i < 100 else "nano"
+    _, path = _write(str(tmp_path / "bronze"), "2026-01-01", "breweries_raw_100000", records)
+
+    assert synthetic.build_profile(path, sample_rows=100)["brewery_type"] == {"micro": 1.0}
+    assert synthetic.build_profile(path)["brewery_type"] == {"nano": 0.666667, "micro": 0.333333}